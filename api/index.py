@@ -9,6 +9,9 @@ from fastapi.security import APIKeyHeader
 from fastapi.staticfiles import StaticFiles
 from voyager.obc import OnBoardComputer, SimulationError
 from voyager.ccsds import TelemetryPacket
+from voyager.fdir import SECDED
+from voyager.memory import MemoryBank, Scrubber
+from voyager.radiation import RadiationModel
 import time
 import secrets
 import logging
@@ -249,6 +252,17 @@ app.add_middleware(SecurityHeadersMiddleware)
 obc = OnBoardComputer()
 obc.boot()
 
+# Global SSR bank with EDAC statistics for FDIR dashboards. Every /api/tick
+# irradiates it and runs a full scrub pass, so /api/memory/stats reports the
+# errors found. The environment is accelerated (about one upset every three
+# seconds) so that errors show up at dashboard time scales.
+ssr = MemoryBank(size=65536, protected=True, edac=SECDED)
+ssr.enable_stats(page_words=1024, recent=64)
+ssr_radiation = RadiationModel(ssr, cross_section=1e-7, flux=4.0)
+ssr_scrubber = Scrubber(ssr, words_per_tick=ssr.size)
+# Longest span irradiated per tick request; bounds the work of huge dt values
+SSR_MAX_IRRADIATION = 3600.0
+
 # Health Check
 @app.get("/api/health", dependencies=[Depends(limit_health)])
 async def health_check():
@@ -285,8 +299,18 @@ async def command_freeze(request: Request):
 @app.post("/api/tick", dependencies=[Depends(limit_tick), Depends(verify_api_key)])
 async def tick_simulation(dt: float = Query(1.0, ge=0)):
     obc.tick(dt)
+    ssr_radiation.tick(min(dt, SSR_MAX_IRRADIATION))
+    ssr_scrubber.tick(dt)
     return JSONResponse(content={"message": f"Simulation advanced by {dt}s", "status": get_status_dict()})
 
+@app.get("/api/memory/stats", dependencies=[Depends(limit_tick), Depends(verify_api_key)])
+async def get_memory_stats():
+    # Optimization: Counters are maintained as errors occur, so this is a
+    # summary of preallocated arrays rather than a scan of the bank.
+    if ssr.stats is None:
+        return JSONResponse(content={"enabled": False})
+    return JSONResponse(content={"enabled": True, "size": ssr.size, **ssr.stats.to_dict()})
+
 # Optimization: Cache the telemetry response per sequence count.
 # The sequence count changes once per second (int(time.time())).
 # This avoids redundant packet generation, CRC calculation, and hex formatting
@@ -0,0 +1,242 @@
+import time
+import tracemalloc
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import io
+import tempfile
+import struct
+import binascii
+
+import random
+
+from voyager.ccsds import (
+    TelemetryPacket, CUCTimeCode, encode_packets, read_packets, validate_crc_batch, pack_gather_into
+)
+from voyager.frames import FrameMultiplexer, FrameDemultiplexer
+from voyager.segmentation import segment_payload, SegmentReassembler
+
+N_PACKETS = 100000
+PAYLOAD = bytes(range(64))
+REPEATS = 5
+
+def measure(fn):
+    """Returns (best wall time, peak traced allocation in bytes) for fn()."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+class DictPacket:
+    """The pre-__slots__ TelemetryPacket layout, kept for comparison."""
+    def __init__(self, apid, sequence_count, data):
+        self.apid = apid
+        self.sequence_count = sequence_count
+        self.data = data
+
+def bench_encode():
+    specs = [(i & 0x7FF, i & 0x3FFF, PAYLOAD) for i in range(N_PACKETS)]
+
+    def per_object():
+        return b"".join([TelemetryPacket(apid, seq, data).to_bytes() for apid, seq, data in specs])
+
+    def bulk():
+        return encode_packets(specs)[0]
+
+    assert bytes(bulk()) == per_object()
+
+    print(f"Encode {N_PACKETS} packets ({len(PAYLOAD)} byte payload)")
+    for name, fn in (("TelemetryPacket.to_bytes", per_object), ("encode_packets", bulk)):
+        elapsed, peak = measure(fn)
+        print(f"  {name:<25} {elapsed:.4f}s ({N_PACKETS / elapsed:,.0f} pkt/s), peak alloc {peak / 1e6:.1f} MB")
+
+def bench_deframe(payload_size=1024, chunk_size=1 << 20):
+    specs = [(i & 0x7FF, i & 0x3FFF, bytes(payload_size)) for i in range(N_PACKETS)]
+    stream = bytes(encode_packets(specs)[0])
+
+    start = time.perf_counter()
+    count = 0
+    for view in read_packets(io.BytesIO(stream), chunk_size=chunk_size):
+        count += view.crc_ok
+    elapsed = time.perf_counter() - start
+
+    assert count == N_PACKETS
+    print(f"Deframe {N_PACKETS} packets ({payload_size} byte payload, {chunk_size} byte chunks)")
+    print(f"  read_packets: {elapsed:.4f}s ({len(stream) / elapsed / 1e6:,.0f} MB/s, {N_PACKETS / elapsed:,.0f} pkt/s)")
+
+def bench_crc_batch(n_packets=1000000):
+    rng = random.Random(0)
+    payloads = [bytes(rng.randrange(1, 33)) for _ in range(64)]
+    specs = [(i & 0x7FF, i & 0x3FFF, payloads[i & 63]) for i in range(n_packets)]
+    buffer, offsets = encode_packets(specs)
+    view = memoryview(buffer)
+    bounds = offsets.tolist()
+
+    start = time.perf_counter()
+    expected = [TelemetryPacket.validate_crc(view[a:b]) for a, b in zip(bounds, bounds[1:])]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mask = validate_crc_batch(buffer, offsets)
+    batch_time = time.perf_counter() - start
+
+    assert mask.tolist() == expected
+    print(f"Validate CRC of {n_packets} short packets")
+    print(f"  validate_crc loop:  {loop_time:.4f}s")
+    print(f"  validate_crc_batch: {batch_time:.4f}s")
+
+def bench_timestamps(n_packets=1000000):
+    cuc = CUCTimeCode()
+    rng = random.Random(0)
+    specs = [(0x10, i & 0x3FFF, PAYLOAD[:8], rng.uniform(0, 1e6)) for i in range(n_packets)]
+    buffer, offsets = encode_packets(specs, time_code=cuc)
+    starts = offsets[:-1]
+
+    start = time.perf_counter()
+    stamps = [cuc.decode(buffer, off + 6) for off in starts]
+    loop_order = sorted(range(n_packets), key=stamps.__getitem__)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_order = cuc.decode_packets(buffer, starts).argsort(kind='stable')
+    batch_time = time.perf_counter() - start
+
+    assert batch_order.tolist() == loop_order
+    print(f"Decode and sort CUC timestamps of {n_packets} packets")
+    print(f"  CUCTimeCode.decode loop:     {loop_time:.4f}s")
+    print(f"  CUCTimeCode.decode_packets:  {batch_time:.4f}s")
+
+def bench_frames(n_packets=200000, payload_size=1000, frame_length=1115):
+    # APID 0x7FF is reserved for idle packets, which the demultiplexer drops.
+    specs = [(i & 0x3FF, i & 0x3FFF, bytes(payload_size)) for i in range(n_packets)]
+    buffer, offsets = encode_packets(specs)
+    view = memoryview(buffer)
+    bounds = offsets.tolist()
+    packets = [view[a:b] for a, b in zip(bounds, bounds[1:])]
+
+    mux = FrameMultiplexer(spacecraft_id=42, frame_length=frame_length)
+    start = time.perf_counter()
+    frames = []
+    for i, pkt in enumerate(packets):
+        frames.extend(mux.push(i & 3, pkt))
+    for vcid in range(4):
+        frames.extend(mux.flush(vcid))
+    mux_time = time.perf_counter() - start
+
+    demux_times = {}
+    for check_crc in (True, False):
+        demux = FrameDemultiplexer(frame_length=frame_length, check_crc=check_crc)
+        start = time.perf_counter()
+        count = 0
+        for frame in frames:
+            for _ in demux.feed(frame):
+                count += 1
+        demux_times[check_crc] = time.perf_counter() - start
+        assert count == n_packets
+
+    # The frame CRC alone bounds the demultiplexer rate from above.
+    start = time.perf_counter()
+    for frame in frames:
+        binascii.crc_hqx(frame, 0xFFFF)
+    crc_time = time.perf_counter() - start
+
+    print(f"TM frames: {len(frames)} x {frame_length} bytes on 4 virtual channels")
+    print(f"  FrameMultiplexer:   {mux_time:.4f}s ({len(frames) / mux_time:,.0f} frames/s)")
+    print(f"  FrameDemultiplexer: {demux_times[True]:.4f}s ({len(frames) / demux_times[True]:,.0f} frames/s), "
+          f"frame CRC only {len(frames) / demux_times[False]:,.0f} frames/s, "
+          f"bare frame CRC loop {len(frames) / crc_time:,.0f} frames/s")
+
+def bench_packet_objects(n_packets=N_PACKETS):
+    specs = [(i & 0x7FF, i & 0x3FFF, PAYLOAD) for i in range(n_packets)]
+    raws = [TelemetryPacket(apid, seq, data).to_bytes() for apid, seq, data in specs]
+
+    print(f"Hold {n_packets} packet objects")
+    for name, make in (("dict-based class", lambda: [DictPacket(*spec) for spec in specs]),
+                       ("__slots__ TelemetryPacket", lambda: [TelemetryPacket(*spec) for spec in specs])):
+        tracemalloc.start()
+        objects = make()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objects
+        print(f"  {name:<26} {size / n_packets:.0f} bytes/packet (excluding shared payload)")
+
+    # Eager decode: what callers had to do before from_bytes existed.
+    unpack_from = struct.Struct('>HHH').unpack_from
+    def eager():
+        out = []
+        for raw in raws:
+            word0, word1, _ = unpack_from(raw)
+            out.append(TelemetryPacket(word0 & 0x7FF, word1 & 0x3FFF, raw[6:-2]).to_bytes())
+        return out
+
+    def lazy():
+        from_bytes = TelemetryPacket.from_bytes
+        return [from_bytes(raw).to_bytes() for raw in raws]
+
+    assert eager() == lazy()
+    print(f"Decode and re-serialise {n_packets} packets")
+    for name, fn in (("decode + to_bytes", eager), ("from_bytes + to_bytes", lazy)):
+        elapsed, _ = measure(fn)
+        print(f"  {name:<26} {elapsed:.4f}s ({n_packets / elapsed:,.0f} pkt/s)")
+
+def bench_segmentation(payload_mb=256, max_data_length=65000):
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = os.path.join(tmp, "image.bin")
+        target_path = os.path.join(tmp, "rebuilt.bin")
+        chunk = os.urandom(1 << 20)
+        with open(source_path, "wb") as f:
+            for _ in range(payload_mb):
+                f.write(chunk)
+
+        reassembler = SegmentReassembler(max_payload_length=payload_mb << 20,
+                                         sink_factory=lambda apid: open(target_path, "wb"))
+        tracemalloc.start()
+        start = time.perf_counter()
+        with open(source_path, "rb", buffering=0) as source:
+            for raw in segment_payload(0x40, source, max_data_length=max_data_length):
+                done = reassembler.feed(TelemetryPacket.from_bytes(raw))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        done[1].close()
+
+        assert os.path.getsize(target_path) == payload_mb << 20
+        print(f"Segment and reassemble a {payload_mb} MB file payload")
+        print(f"  {elapsed:.4f}s ({payload_mb / elapsed:,.0f} MB/s), peak traced memory {peak / 1e6:.2f} MB")
+
+def bench_gather(n_parts=16, part_size=4000):
+    parts = [os.urandom(part_size) for _ in range(n_parts)]
+    target = bytearray(n_parts * part_size + 8)
+    n_packets = 2000
+
+    def concatenate():
+        for i in range(n_packets):
+            raw = TelemetryPacket(0x10, i, b"".join(parts)).to_bytes()
+            target[:len(raw)] = raw
+
+    def gather():
+        for i in range(n_packets):
+            pack_gather_into(target, 0, 0x10, i, parts)
+
+    print(f"Encode {n_packets} packets from {n_parts} x {part_size} byte parts into a buffer")
+    for name, fn in (("join + to_bytes", concatenate), ("pack_gather_into", gather)):
+        elapsed, peak = measure(fn)
+        print(f"  {name:<18} {elapsed:.4f}s, peak alloc {peak / 1e3:.0f} KB")
+
+if __name__ == "__main__":
+    bench_encode()
+    bench_deframe()
+    bench_crc_batch()
+    bench_timestamps()
+    bench_frames()
+    bench_packet_objects()
+    bench_segmentation()
+    bench_gather()
@@ -0,0 +1,140 @@
+import time
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from voyager.checkpoint import checkpoint, restore, fork
+from voyager.fdir import ReedSolomon, SECDED
+from voyager.memory import MemoryBank, PagedMemoryBank, Scrubber
+from voyager.scenario import run_scenarios, summarize
+from voyager.obc import OBCFleet, OnBoardComputer, Simulation
+
+REPEATS = 3
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_reed_solomon(size=4 << 20, interleave=5):
+    rs = ReedSolomon(interleave=interleave)
+    block = ReedSolomon.K * interleave
+    data = os.urandom(size // block * block)
+    encoded = rs.encode(data)
+    mb = len(data) / 1e6
+
+    encode = best_of(lambda: rs.encode(data))
+    clean = best_of(lambda: rs.decode(encoded))
+
+    # Corrupt 1% of codewords with 8 symbol errors each
+    rng = np.random.default_rng(0)
+    codewords = len(encoded) // ReedSolomon.N
+    noisy = bytearray(encoded)
+    for word in rng.choice(codewords, codewords // 100, replace=False).tolist():
+        base, lane = divmod(word, interleave)
+        for symbol in rng.choice(ReedSolomon.N, 8, replace=False).tolist():
+            noisy[base * ReedSolomon.N * interleave + symbol * interleave + lane] ^= 0x5A
+    noisy = bytes(noisy)
+    dirty = best_of(lambda: rs.decode(noisy))
+    assert rs.decode(noisy)[0] == data
+
+    print(f"RS(255,223) I={interleave}, {mb:.1f} MB: encode {mb / encode:.1f} MB/s, "
+          f"decode clean {mb / clean:.1f} MB/s, decode with 1% codewords corrupted {mb / dirty:.1f} MB/s")
+
+def bench_event_simulation(days=30, housekeeping=60.0, step=0.1):
+    obc = OnBoardComputer()
+    obc.boot()
+    sim = Simulation(obc)
+    frames = []
+    sim.every(housekeeping, lambda: frames.append(sim.time))
+    # One software hang per day; the watchdog expiry is a computed event
+    for day in range(days):
+        sim.schedule_at(day * 86400.0 + 3600.0, obc.freeze)
+
+    end = days * 86400.0
+    start = time.perf_counter()
+    sim.run_until(end)
+    elapsed = time.perf_counter() - start
+    assert obc.reboot_count == days and len(frames) == int(end / housekeeping)
+
+    print(f"Event-driven simulation of {days} days: {sim.events_processed:,} events in {elapsed:.2f}s "
+          f"({sim.events_processed / elapsed:,.0f} events/s; fixed {step}s stepping would take "
+          f"{end / step:,.0f} ticks)")
+
+def bench_obc_fleet(n=100_000, ticks=1000, dt=0.1, hung=0.01):
+    fleet = OBCFleet(n)
+    fleet.boot()
+    rng = np.random.default_rng(4)
+    fleet.freeze(np.flatnonzero(rng.random(n) < hung))
+
+    reboots = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        reboots += fleet.tick(dt)
+    elapsed = time.perf_counter() - start
+    assert reboots == np.count_nonzero(fleet.reboot_count)
+
+    print(f"OBC fleet of {n:,}: {elapsed / ticks * 1e6:.0f} us/tick "
+          f"({n * ticks / elapsed / 1e6:,.0f}M OBC-ticks/s), {reboots:,} watchdog reboots")
+
+def bench_checkpoint(n=2000, words=64 << 10):
+    obc = OnBoardComputer()
+    obc.boot()
+    sim = Simulation(obc)
+    ram = MemoryBank(size=words, protected=True, edac=SECDED)
+    ram.write_block(0, os.urandom(words))
+    ssr = PagedMemoryBank(size=1 << 32, protected=True, edac=SECDED)
+    ssr.write_block(0, os.urandom(1 << 20))
+    sim.scrubbers.append(Scrubber(ram))
+    sim.run_until(3600.0)
+    banks = [ram, ssr]
+
+    data = checkpoint(sim, banks)
+    save = best_of(lambda: checkpoint(sim, banks))
+    load = best_of(lambda: restore(data))
+
+    def forks():
+        for _ in range(n):
+            fork(sim, banks)
+
+    forked = best_of(forks)
+    print(f"Checkpoint of {words >> 10}K word RAM + 1M word paged SSR: {len(data) / 1e6:.1f} MB, "
+          f"save {save * 1e3:.1f} ms, restore {load * 1e3:.1f} ms, fork {n / forked:,.0f}/s")
+
+def bench_scenarios(n=10_000, workers=None):
+    scenarios = []
+    for i in range(n):
+        scenario = {
+            "name": f"nightly-{i}",
+            "duration": 86400.0,
+            "memory": {"size": 4096, "codec": ("EDAC", "SECDED", "SECDED32")[i % 3], "scrub_period": 3600.0},
+            "random_seus": 10
+        }
+        if i % 2:
+            scenario["freeze"] = [float(i % 86000)]
+            scenario["expect"] = {"mode": "SAFE_MODE", "reboot_count": 1}
+        else:
+            scenario["expect"] = {"mode": "NORMAL", "reboot_count": 0}
+        scenarios.append(scenario)
+
+    start = time.perf_counter()
+    results = list(run_scenarios(scenarios, workers=workers))
+    summary = summarize(results, time.perf_counter() - start)
+    assert not summary["failed"]
+
+    print(f"{n:,} one-day scenarios: {summary['elapsed']:.2f}s "
+          f"({summary['scenarios_per_second']:,.0f} scenarios/s, "
+          f"{summary['sim_seconds_per_second'] / 86400:,.0f} simulated days/s, "
+          f"slowest {summary['max_wall_time'] * 1e3:.1f} ms)")
+
+if __name__ == "__main__":
+    bench_reed_solomon()
+    bench_event_simulation()
+    bench_obc_fleet()
+    bench_checkpoint()
+    bench_scenarios()
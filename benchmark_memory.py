@@ -0,0 +1,272 @@
+import time
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from voyager.fdir import EDAC, SECDED, SECDED32
+from voyager.campaign import run_campaign, sweep
+from voyager.radiation import RadiationModel
+from voyager.memory import MemoryBank, MassMemoryBank, MappedMemoryBank, PagedMemoryBank, Scrubber
+
+BLOCK_SIZE = 1 << 20
+REPEATS = 3
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_block_io():
+    image = os.urandom(BLOCK_SIZE)
+    for protected in (False, True):
+        ram = MemoryBank(size=BLOCK_SIZE, protected=protected)
+
+        def loop_write():
+            write = ram.write
+            for addr, value in enumerate(image):
+                write(addr, value)
+
+        def loop_read():
+            read = ram.read
+            return bytes([read(addr) for addr in range(BLOCK_SIZE)])
+
+        loop_w = best_of(loop_write)
+        block_w = best_of(lambda: ram.write_block(0, image))
+        loop_r = best_of(loop_read)
+        block_r = best_of(lambda: ram.read_block(0, BLOCK_SIZE))
+        scrub_r = best_of(lambda: ram.read_block_with_scrub(0, BLOCK_SIZE))
+        assert ram.read_block(0, BLOCK_SIZE) == image
+
+        kind = "protected" if protected else "unprotected"
+        print(f"1 MB {kind} bank")
+        print(f"  write loop {loop_w:.4f}s, write_block {block_w:.4f}s ({loop_w / block_w:,.0f}x)")
+        print(f"  read loop  {loop_r:.4f}s, read_block  {block_r:.4f}s ({loop_r / block_r:,.0f}x), "
+              f"read_block_with_scrub {scrub_r:.4f}s")
+
+def bench_mass_memory(size=1 << 30, upsets=100_000):
+    ram = MassMemoryBank(size=size, protected=True)
+    chunk = os.urandom(1 << 24)
+
+    start = time.perf_counter()
+    for addr in range(0, size, len(chunk)):
+        ram.write_block(addr, chunk[:size - addr])
+    fill = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    addrs = rng.integers(0, size, upsets)
+    start = time.perf_counter()
+    ram.inject_seus(addrs, rng.integers(0, 12, upsets))
+    inject = time.perf_counter() - start
+
+    start = time.perf_counter()
+    corrected = ram.scrub()
+    scrub = time.perf_counter() - start
+    # Double hits on one word may cancel or alias, so only bound the count.
+    assert 0 < corrected <= len(np.unique(addrs))
+    assert ram.read_block(size - 16, 16) == chunk[(size - 16) % len(chunk):][:16]
+
+    print(f"{size >> 20} MB SSR bank (NumPy)")
+    print(f"  fill {fill:.2f}s ({size / fill / 1e6:,.0f} MB/s), "
+          f"{upsets:,} SEUs {inject:.3f}s, full scrub {scrub:.2f}s ({corrected:,} corrected)")
+
+def bench_scrubber(size=64 << 20, words_per_tick=1 << 16, dt=0.1):
+    ram = MassMemoryBank(size=size, protected=True)
+    rng = np.random.default_rng(1)
+    ram.inject_seus(rng.integers(0, size, 10_000), rng.integers(0, 12, 10_000))
+    scrubber = Scrubber(ram, words_per_tick=words_per_tick)
+    ticks = 0
+    while scrubber.passes == 0:
+        scrubber.tick(dt)
+        ticks += 1
+    stats = scrubber.stats()
+    print(f"Scrubber on {size >> 20} MB bank, {words_per_tick:,} words/tick")
+    print(f"  {ticks:,} ticks per pass, {stats['wall_time'] / ticks * 1e6:.0f} us/tick, "
+          f"{stats['scrub_rate'] / 1e6:,.0f} Mwords/s, pass {stats['last_pass_wall_time']:.2f}s wall / "
+          f"{stats['last_pass_time']:.1f}s simulated, {stats['corrected']:,} corrected")
+
+def bench_edac_codecs(n=1 << 20):
+    for edac in (EDAC, SECDED):
+        ram = MemoryBank(size=4096, protected=True, edac=edac)
+        ram.write_block(0, os.urandom(4096))
+        codewords = [edac.encode(i & 0xFF) for i in range(n)]
+
+        def decode_loop():
+            decode = edac.decode_data_only
+            for word in codewords:
+                decode(word)
+
+        def read_loop():
+            read = ram.read
+            for addr in range(n):
+                read(addr & 0xFFF)
+
+        decode = best_of(decode_loop)
+        read = best_of(read_loop)
+        print(f"{edac.__name__} ({edac.CODE_BITS}-bit): decode_data_only {decode / n * 1e9:.0f} ns/word, "
+              f"MemoryBank.read {read / n * 1e9:.0f} ns/word")
+
+def bench_edac_stats(n=1 << 20, upsets=10_000):
+    ram = MemoryBank(size=1 << 16, protected=True, edac=SECDED)
+    ram.write_block(0, os.urandom(1 << 16))
+
+    def read_loop():
+        read = ram.read
+        for addr in range(n):
+            read(addr & 0xFFFF)
+
+    plain = best_of(read_loop)
+    stats = ram.enable_stats()
+    instrumented = best_of(read_loop)
+    ram.disable_stats()
+    disabled = best_of(read_loop)
+
+    rng = np.random.default_rng(2)
+    ram.enable_stats()
+    ram.inject_seus(rng.integers(0, ram.size, upsets), rng.integers(0, 13, upsets))
+    start = time.perf_counter()
+    ram.scrub()
+    scrub = time.perf_counter() - start
+    stats = ram.stats
+    print("EDAC statistics (SECDED, 64K words)")
+    print(f"  read {plain / n * 1e9:.0f} ns/word plain, {instrumented / n * 1e9:.0f} ns enabled, "
+          f"{disabled / n * 1e9:.0f} ns after disable; scrub with stats {scrub * 1e3:.1f} ms "
+          f"({stats.corrected:,} corrected, {stats.uncorrectable:,} uncorrectable)")
+
+def bench_word_codec(n_bytes=1 << 22):
+    """8-bit EDAC vs 32-bit SECDED32, normalised per data byte."""
+    data = np.frombuffer(os.urandom(n_bytes), dtype=np.uint8)
+    words = data.view('<u4')
+    small = data[:1 << 16].tolist()
+    small_words = words[:1 << 14].tolist()
+
+    for name, codec, batch, scalar in (
+        ("EDAC (12,8)", EDAC, data, small),
+        ("SECDED32 (39,32)", SECDED32, words, small_words),
+    ):
+        per_word = 4 if codec is SECDED32 else 1
+        codes = codec.encode_batch(batch)
+        encode_batch = best_of(lambda: codec.encode_batch(batch))
+        decode_batch = best_of(lambda: codec.decode_batch(codes))
+
+        def scalar_loop():
+            encode = codec.encode
+            decode = codec.decode_data_only
+            for value in scalar:
+                decode(encode(value))
+
+        roundtrip = best_of(scalar_loop)
+        print(f"{name}: batch encode {encode_batch / n_bytes * 1e9:.2f} ns/byte, "
+              f"batch decode {decode_batch / n_bytes * 1e9:.2f} ns/byte, "
+              f"scalar encode+decode {roundtrip / (len(scalar) * per_word) * 1e9:.0f} ns/byte")
+
+def bench_campaign(trials=2_000_000):
+    """Monte Carlo SEU campaign throughput for 1..N worker processes."""
+    configs = sweep([1e-6, 1e-5], [60.0], ("EDAC", "SECDED"))
+    cores = os.cpu_count() or 1
+    base = None
+    for workers in sorted({1, max(1, cores // 2), cores}):
+        start = time.perf_counter()
+        list(run_campaign(configs, trials, words=1024, shard_trials=100_000, workers=workers))
+        elapsed = time.perf_counter() - start
+        rate = len(configs) * trials / elapsed
+        base = base or rate
+        print(f"Campaign, {workers} worker(s): {rate:,.0f} trials/s ({rate / base:.2f}x)")
+
+def bench_radiation(size=1 << 20, hours=1.0, dt=1.0):
+    """One orbit segment of batch SEU/MBU injection vs calling inject_seu per flip."""
+    ram = MassMemoryBank(size=size, protected=True, edac=SECDED)
+    # Harsh environment so an hour produces about a million flips
+    model = RadiationModel(ram, cross_section=1e-9, flux=2e4, mbu_sizes={2: 0.05, 3: 0.01}, seed=2)
+    scrubber = Scrubber(ram, words_per_tick=size // 600)
+
+    start = time.perf_counter()
+    model.run(hours * 3600, dt)
+    batch = time.perf_counter() - start
+    flips = model.bit_flips
+
+    start = time.perf_counter()
+    model.run(hours * 3600, dt, scrubber)
+    scrubbed = time.perf_counter() - start
+
+    addrs, bits = model.draw(3600 * hours)
+    loop_ram = MemoryBank(size=size, protected=True, edac=SECDED)
+    start = time.perf_counter()
+    inject = loop_ram.inject_seu
+    for addr, bit in zip(addrs.tolist(), bits.tolist()):
+        inject(addr, bit)
+    loop = time.perf_counter() - start
+
+    print(f"Radiation model, {size >> 20}M words, {hours:g} h ({flips:,} flips, {model.mbu_events:,} MBU over both runs)")
+    print(f"  batch injection {batch:.3f}s, inject_seu loop {loop:.3f}s ({loop / batch:.1f}x); "
+          f"{dt:g}s steps interleaved with a Scrubber {scrubbed:.2f}s")
+
+def bench_mapped_image(size=1 << 31):
+    """Creating and reopening a multi-GB SSR image; only touched pages are read."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ssr.img")
+        start = time.perf_counter()
+        with MappedMemoryBank(path, size=size, protected=True) as ram:
+            ram.write_block(size - 4096, os.urandom(4096))
+        create = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ram = MappedMemoryBank(path, protected=True, writable=False)
+        reopen = time.perf_counter() - start
+        addrs = np.random.default_rng(0).integers(0, size, 1000).tolist()
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            for addr in addrs:
+                ram.read(addr)
+            timings.append(time.perf_counter() - start)
+        ram.close()
+        print(f"Mapped {size * 2 >> 30} GB image: create {create * 1e3:.1f} ms, reopen {reopen * 1e3:.2f} ms, "
+              f"1000 random reads {timings[0] * 1e3:.1f} ms cold (page faults) / {timings[1] * 1e3:.1f} ms warm")
+
+def bench_paged_snapshots(used=16 << 20, branches=1000, upsets=100):
+    """Branching fault scenarios from one baseline: COW snapshots vs full copies."""
+    base = PagedMemoryBank(size=1 << 32, protected=True)
+    base.write_block(0, os.urandom(used))
+    flat = MassMemoryBank(size=used, protected=True)
+    flat.write_block(0, base.read_block(0, used))
+    rng = np.random.default_rng(0)
+
+    def scenario(branch):
+        addrs = rng.integers(0, used, upsets)
+        branch.inject_seus(addrs, rng.integers(0, 12, upsets))
+        for addr in addrs.tolist():
+            branch.read_with_scrub(addr)
+
+    start = time.perf_counter()
+    for _ in range(branches):
+        scenario(base.snapshot())
+    paged = time.perf_counter() - start
+
+    copies = max(1, branches // 20)
+    start = time.perf_counter()
+    for _ in range(copies):
+        branch = MassMemoryBank(size=used, protected=True)
+        branch.memory[:] = flat.memory
+        scenario(branch)
+    full = (time.perf_counter() - start) * branches / copies
+
+    print(f"4G word paged bank, {used >> 20}M words used: {branches} branches x {upsets} SEUs "
+          f"{paged:.2f}s with COW snapshots vs {full:.2f}s with full copies (est.)")
+
+if __name__ == "__main__":
+    bench_block_io()
+    bench_mapped_image()
+    bench_paged_snapshots()
+    bench_edac_codecs()
+    bench_edac_stats()
+    bench_word_codec()
+    bench_radiation()
+    bench_campaign()
+    bench_scrubber()
+    bench_mass_memory(int(sys.argv[1]) << 20 if len(sys.argv) > 1 else 1 << 30)
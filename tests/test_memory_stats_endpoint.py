@@ -0,0 +1,34 @@
+from fastapi.testclient import TestClient
+from api.index import app, VOYAGER_API_KEY, ssr, ssr_radiation
+
+client = TestClient(app)
+
+def test_memory_stats_endpoint():
+    ssr.write(0x500, 0x42)
+    ssr.inject_seu(0x500, 3)
+    assert ssr.read(0x500) == 0x42
+
+    response = client.get("/api/memory/stats", headers={"X-API-Key": VOYAGER_API_KEY})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is True
+    assert data["corrected"] >= 1
+    assert 0x500 // data["page_words"] in [page for page, _ in data["page_errors"]]
+    assert data["recent"][-1]["addr"] == 0x500
+    assert data["recent"][-1]["status"] == "CORRECTED_SINGLE_BIT_ERROR"
+
+def test_tick_irradiates_and_scrubs_ssr():
+    headers = {"X-API-Key": VOYAGER_API_KEY}
+    before = client.get("/api/memory/stats", headers=headers).json()
+    events = ssr_radiation.events
+    response = client.post("/api/tick", params={"dt": 100.0}, headers=headers)
+    assert response.status_code == 200
+    assert ssr_radiation.events > events
+
+    after = client.get("/api/memory/stats", headers=headers).json()
+    assert after["corrected"] + after["uncorrectable"] > before["corrected"] + before["uncorrectable"]
+    assert after["scrub_writebacks"] > before["scrub_writebacks"]
+
+def test_memory_stats_requires_api_key():
+    response = client.get("/api/memory/stats")
+    assert response.status_code == 401
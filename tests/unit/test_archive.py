@@ -0,0 +1,92 @@
+import pytest
+from voyager.archive import TelemetryArchive
+from voyager.ccsds import TelemetryPacket, CUCTimeCode, validate_crc_batch
+
+def build_archive(path, n=100):
+    with TelemetryArchive(path, writable=True) as archive:
+        for i in range(n):
+            pkt = TelemetryPacket(apid=0x10 + (i % 3), sequence_count=i, data=bytes([i]) * (i % 7))
+            archive.append(pkt.to_bytes(), timestamp=float(i))
+    return [TelemetryPacket(0x10 + (i % 3), i, bytes([i]) * (i % 7)).to_bytes() for i in range(n)]
+
+def test_archive_append_and_query(tmp_path):
+    path = tmp_path / "tm.bin"
+    expected = build_archive(path)
+
+    archive = TelemetryArchive(path)
+    assert len(archive) == 100
+    assert bytes(archive.packet(42)) == expected[42]
+
+    # Half-open time window located by binary search
+    window = [bytes(v) for v in archive.query(start=10.0, end=20.0)]
+    assert window == expected[10:20]
+
+    # APID filter within a window
+    positions = archive.select(start=10.0, end=40.0, apid=0x11)
+    assert positions.tolist() == [i for i in range(10, 40) if i % 3 == 1]
+    assert list(archive.query(start=500.0)) == []
+
+    index = archive.index
+    assert validate_crc_batch(archive.data, index['offset'], index['length']).all()
+    archive.close()
+
+def test_archive_reopen_appends_and_ordering(tmp_path):
+    path = tmp_path / "tm.bin"
+    build_archive(path, n=10)
+
+    with TelemetryArchive(path, writable=True) as archive:
+        cuc = CUCTimeCode()
+        archive.append_packet(TelemetryPacket(0x20, 1, b'late', time_code=cuc, timestamp=50.0))
+        assert [bytes(v)[-6:-2] for v in archive.query(apid=0x20)] == [b'late']
+        with pytest.raises(ValueError):
+            archive.append(TelemetryPacket(0x20, 2, b'old').to_bytes(), timestamp=1.0)
+
+    assert len(TelemetryArchive(path)) == 11
+    with pytest.raises(ValueError):
+        TelemetryArchive(path).append(b'\x00' * 8, 60.0)
+
+def test_archive_recovers_from_torn_write(tmp_path):
+    path = tmp_path / "tm.bin"
+    expected = build_archive(path, n=5)
+
+    # Index record written but packet bytes lost, plus a partial record.
+    with open(path, 'r+b') as f:
+        f.truncate(sum(map(len, expected[:4])) + 3)
+    with open(str(path) + '.idx', 'ab') as f:
+        f.write(b'\x01\x02\x03')
+
+    with TelemetryArchive(path, writable=True) as archive:
+        assert len(archive) == 4
+        archive.append(expected[4], timestamp=4.0)
+        assert [bytes(v) for v in archive.query()] == expected
+
+def test_empty_archive(tmp_path):
+    path = tmp_path / "tm.bin"
+    TelemetryArchive(path, writable=True).close()
+    archive = TelemetryArchive(path)
+    assert len(archive) == 0
+    assert list(archive.query()) == []
+
+def test_append_packet_without_timestamp(tmp_path):
+    with TelemetryArchive(tmp_path / "tm.bin", writable=True) as archive:
+        pkt = TelemetryPacket(0x20, 0, b'no time')
+        with pytest.raises(ValueError, match="timestamp"):
+            archive.append_packet(pkt)
+        assert len(archive) == 0
+        archive.append_packet(pkt, timestamp=1.0)
+        assert archive.index['timestamp'].tolist() == [1.0]
+
+def test_apid_index_matches_scan_and_tracks_appends(tmp_path):
+    path = tmp_path / "tm.bin"
+    build_archive(path, n=250)
+    with TelemetryArchive(path, writable=True) as archive:
+        index = archive.index
+        for apid in (0x10, 0x12, 0x99):
+            expected = [i for i in range(40, 200) if index['apid'][i] == apid]
+            assert archive.select(start=40.0, end=200.0, apid=apid).tolist() == expected
+
+        # Records appended after the first APID query are picked up
+        archive.append(TelemetryPacket(0x99, 0, b'new').to_bytes(), timestamp=400.0)
+        archive.append(TelemetryPacket(0x10, 1, b'new').to_bytes(), timestamp=401.0)
+        assert archive.select(apid=0x99).tolist() == [250]
+        assert archive.select(start=240.0, apid=0x10).tolist() == [240, 243, 246, 249, 251]
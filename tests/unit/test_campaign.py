@@ -0,0 +1,36 @@
+import io
+
+import pytest
+from voyager.campaign import run_campaign, run_shard, sweep, wilson_interval
+
+def test_wilson_interval():
+    low, high = wilson_interval(0, 100)
+    assert low == 0.0 and 0.0 < high < 0.05
+    low, high = wilson_interval(50, 100)
+    assert low < 0.5 < high
+    assert high - low == pytest.approx(0.192, abs=0.005)
+
+def test_campaign_is_deterministic_across_workers():
+    configs = sweep([1e-4], [10.0], ("EDAC", "SECDED"))
+    kwargs = dict(trials=5000, words=64, shard_trials=1000, seed=7)
+    serial = list(run_campaign(configs, workers=1, **kwargs))
+    parallel = list(run_campaign(configs, workers=2, **kwargs))
+    key = lambda r: r["codec"]
+    assert sorted(serial, key=key) == sorted(parallel, key=key)
+    assert all(r["trials"] == 5000 for r in serial)
+
+def test_secded_detects_what_sec_misses():
+    # Same seed and upset pattern: SEC miscorrects silently, SECDED flags it
+    sec = run_shard("EDAC", 1e-3, 10.0, 32, 2000, 1, (0, 0))
+    secded = run_shard("SECDED", 1e-3, 10.0, 32, 2000, 1, (0, 0))
+    assert sec["silent"] > 0 and sec["uncorrectable"] == 0
+    assert secded["uncorrectable"] > 0
+    assert secded["silent"] < secded["uncorrectable"]
+
+def test_campaign_streams_csv():
+    out = io.StringIO()
+    results = list(run_campaign(sweep([1e-5, 1e-4], [1.0], ("SECDED32",)), trials=100, words=16, workers=1, output=out))
+    lines = out.getvalue().strip().splitlines()
+    assert lines[0].startswith("codec,upset_rate,scrub_interval")
+    assert len(lines) == 3
+    assert results[0]["ci_low"] <= results[0]["failure_probability"] <= results[0]["ci_high"]
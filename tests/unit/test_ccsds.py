@@ -75,3 +75,270 @@ def test_crc_validation_header_corruption():
     raw_bytes[0] ^= 0x01
 
     assert TelemetryPacket.validate_crc(raw_bytes) == False
+
+def test_encode_packets_matches_to_bytes():
+    """Verifies that the bulk encoder produces the same bytes as per-packet to_bytes()."""
+    from voyager.ccsds import encode_packets
+
+    specs = [(0x10, 1, b'Hello'), (0x7FF, 0x3FFF, b''), (0x23, 500, bytes(range(200)))]
+    buffer, offsets = encode_packets(iter(specs))
+
+    assert list(offsets) == [0, 13, 21, 229]
+    assert len(buffer) == offsets[-1]
+    for i, (apid, seq, data) in enumerate(specs):
+        expected = TelemetryPacket(apid=apid, sequence_count=seq, data=data).to_bytes()
+        assert buffer[offsets[i]:offsets[i + 1]] == expected
+
+def test_encode_packets_into_preallocated_buffer():
+    """Verifies that a caller-supplied buffer is filled in place and size is checked."""
+    from voyager.ccsds import encode_packets
+
+    target = bytearray(32)
+    buffer, offsets = encode_packets([(10, 1, b'Hello')], buffer=target)
+    assert buffer is target
+    assert TelemetryPacket.validate_crc(target[:offsets[1]])
+
+    with pytest.raises(ValueError):
+        encode_packets([(10, 1, bytes(40))], buffer=target)
+
+def test_deframer_handles_arbitrary_chunking():
+    """Verifies that packets split across chunk boundaries are reassembled intact."""
+    from voyager.ccsds import encode_packets, PacketDeframer
+
+    specs = [(0x10, i, bytes([i]) * (i * 7 % 23)) for i in range(20)]
+    stream = bytes(encode_packets(specs)[0])
+
+    for chunk_size in (1, 2, 5, 6, 7, 13, 64, len(stream)):
+        deframer = PacketDeframer()
+        views = []
+        for start in range(0, len(stream), chunk_size):
+            views.extend(deframer.feed(stream[start:start + chunk_size]))
+
+        assert deframer.pending_bytes == 0
+        assert [(v.apid, v.sequence_count, bytes(v.data)) for v in views] == specs
+        assert all(v.crc_ok and v.sequence_flags == 3 for v in views)
+
+def test_deframer_flags_bad_crc():
+    from voyager.ccsds import PacketDeframer
+
+    raw = bytearray(TelemetryPacket(apid=10, sequence_count=1, data=b'Hello').to_bytes())
+    raw[7] ^= 0x01
+    (view,) = PacketDeframer().feed(bytes(raw))
+    assert not view.crc_ok
+
+def test_read_packets_from_file(tmp_path):
+    from voyager.ccsds import encode_packets, read_packets
+
+    specs = [(0x20, i, b'X' * i) for i in range(50)]
+    capture = tmp_path / "capture.bin"
+    capture.write_bytes(encode_packets(specs)[0])
+
+    views = list(read_packets(capture, chunk_size=100))
+    assert [(v.apid, v.sequence_count, bytes(v.data)) for v in views] == specs
+
+    capture.write_bytes(capture.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        list(read_packets(str(capture), chunk_size=100))
+
+def test_validate_crc_batch_matches_validate_crc():
+    """Verifies the batch validator against validate_crc bit for bit, including corrupt packets."""
+    import random
+    from voyager.ccsds import encode_packets, validate_crc_batch
+
+    rng = random.Random(7)
+    # Enough packets per length to exercise both the vectorized and fallback paths.
+    specs = [(i & 0x7FF, i, bytes(rng.randrange(256) for _ in range(rng.choice((3, 4, 17, 40)))))
+             for i in range(400)]
+    buffer, offsets = encode_packets(specs)
+    for _ in range(60):
+        buffer[rng.randrange(len(buffer))] ^= 1 << rng.randrange(8)
+
+    expected = [TelemetryPacket.validate_crc(buffer[offsets[i]:offsets[i + 1]]) for i in range(len(specs))]
+    assert validate_crc_batch(buffer, offsets).tolist() == expected
+    assert not all(expected)
+
+    # Explicit, out-of-order offsets/lengths select the same packets.
+    picks = list(range(len(specs)))[::-3]
+    mask = validate_crc_batch(bytes(buffer), [offsets[i] for i in picks],
+                              [offsets[i + 1] - offsets[i] for i in picks])
+    assert mask.tolist() == [expected[i] for i in picks]
+
+def test_validate_crc_batch_bounds():
+    from voyager.ccsds import validate_crc_batch
+
+    assert validate_crc_batch(b'', []).tolist() == []
+    assert validate_crc_batch(bytes(10), [0], [7]).tolist() == [False]
+    with pytest.raises(ValueError):
+        validate_crc_batch(bytes(10), [4], [8])
+
+def test_cuc_time_code_round_trip():
+    import numpy as np
+    from voyager.ccsds import CUCTimeCode
+
+    cuc = CUCTimeCode(coarse_octets=4, fine_octets=2)
+    assert cuc.size == 6
+    assert cuc.encode(1.5) == bytes([0, 0, 0, 1, 0x80, 0x00])
+    assert cuc.decode(cuc.encode(123456.25)) == 123456.25
+
+    # Odd field widths exercise the split struct fields.
+    cuc3 = CUCTimeCode(coarse_octets=3, fine_octets=0)
+    assert cuc3.encode(0x123456) == bytes([0x12, 0x34, 0x56])
+    with pytest.raises(ValueError):
+        cuc3.encode(1 << 24)
+    with pytest.raises(ValueError):
+        CUCTimeCode(coarse_octets=5)
+
+    seconds = np.array([0.0, 1.5, 2 ** 31 + 0.75, 42.125])
+    fields = cuc.encode_batch(seconds)
+    assert [bytes(row) for row in fields] == [cuc.encode(t) for t in seconds]
+    assert cuc.decode_batch(fields.tobytes(), np.arange(4) * 6).tolist() == seconds.tolist()
+
+def test_cds_time_code_round_trip():
+    import numpy as np
+    from voyager.ccsds import CDSTimeCode
+
+    cds = CDSTimeCode(submillisecond=True)
+    t = 3 * 86400 + 12.345678
+    assert cds.encode(t) == bytes([0, 3, 0, 0, 0x30, 0x39, 0x02, 0xA6])
+    assert abs(cds.decode(cds.encode(t)) - t) < 1e-9
+
+    seconds = np.array([0.0, t, 20000 * 86400 + 0.001])
+    fields = CDSTimeCode().encode_batch(seconds)
+    assert [bytes(row) for row in fields] == [CDSTimeCode().encode(x) for x in seconds]
+    assert np.allclose(CDSTimeCode().decode_batch(fields.tobytes(), [0, 6, 12]), np.round(seconds, 3))
+
+def test_packet_secondary_header_timestamps():
+    """Verifies time-stamped packets from both encoders and batch timestamp sorting."""
+    import numpy as np
+    from voyager.ccsds import CUCTimeCode, CCSDS_EPOCH, PacketDeframer, encode_packets
+
+    cuc = CUCTimeCode()
+    pkt = TelemetryPacket(apid=0x10, sequence_count=1, data=b'AB', time_code=cuc, timestamp=100.5)
+    raw = pkt.to_bytes()
+    assert len(raw) == 6 + 6 + 2 + 2
+    assert raw[4:6] == bytes([0x00, 0x09])
+    assert TelemetryPacket.validate_crc(raw)
+
+    times = [30.0, 10.25, 20.5]
+    buffer, offsets = encode_packets([(0x10, i, b'AB', t) for i, t in enumerate(times)], time_code=cuc)
+    assert bytes(buffer[offsets[0]:offsets[1]]) == TelemetryPacket(0x10, 0, b'AB', cuc, 30.0).to_bytes()
+
+    stamps = cuc.decode_packets(buffer, offsets[:-1])
+    assert np.argsort(stamps).tolist() == [1, 2, 0]
+    assert cuc.to_datetime64(stamps)[1] == CCSDS_EPOCH + np.timedelta64(10250, 'ms')
+    assert cuc.from_datetime64(cuc.to_datetime64(stamps)).tolist() == times
+
+    views = list(PacketDeframer().feed(buffer))
+    assert [v.timestamp(cuc) for v in views] == times
+
+def test_from_bytes_lazy_decode_and_passthrough():
+    """Verifies that decoded packets return the original buffer until modified."""
+    raw = TelemetryPacket(apid=0x10, sequence_count=42, data=b'Hello').to_bytes()
+    pkt = TelemetryPacket.from_bytes(raw)
+
+    assert isinstance(pkt, TelemetryPacket)
+    assert not hasattr(pkt, '__dict__')
+    assert pkt.to_bytes() is raw
+    assert (pkt.apid, pkt.sequence_count, pkt.data, pkt.timestamp) == (0x10, 42, b'Hello', None)
+    assert pkt.to_bytes() is raw
+
+    pkt.sequence_count = 43
+    reencoded = pkt.to_bytes()
+    assert reencoded is not raw
+    assert reencoded == TelemetryPacket(apid=0x10, sequence_count=43, data=b'Hello').to_bytes()
+
+    with pytest.raises(AttributeError):
+        pkt.missing
+    with pytest.raises(ValueError):
+        TelemetryPacket.from_bytes(raw[:7])
+
+def test_from_bytes_with_time_code():
+    from voyager.ccsds import CUCTimeCode
+
+    cuc = CUCTimeCode()
+    raw = TelemetryPacket(0x10, 1, b'AB', time_code=cuc, timestamp=12.5).to_bytes()
+    pkt = TelemetryPacket.from_bytes(memoryview(raw), time_code=cuc)
+    assert pkt.timestamp == 12.5
+    assert bytes(pkt.data) == b'AB'
+
+    # Modifying only the timestamp re-encodes with the decoded fields.
+    pkt.timestamp = 13.0
+    assert pkt.to_bytes() == TelemetryPacket(0x10, 1, b'AB', time_code=cuc, timestamp=13.0).to_bytes()
+
+def test_from_bytes_copy_and_pickle():
+    import copy
+    import pickle
+    from voyager.ccsds import CUCTimeCode
+
+    cuc = CUCTimeCode(fine_octets=3)
+    raw = TelemetryPacket(0x10, 1, b'AB', time_code=cuc, timestamp=12.5).to_bytes()
+    pkt = TelemetryPacket.from_bytes(memoryview(raw), time_code=cuc)
+    for clone in (copy.copy(pkt), copy.deepcopy(pkt), pickle.loads(pickle.dumps(pkt))):
+        assert clone.to_bytes() == raw
+        assert (clone.apid, clone.sequence_count, bytes(clone.data), clone.timestamp) == (0x10, 1, b'AB', 12.5)
+
+    # Modified packets are pickled re-encoded
+    pkt.sequence_count = 2
+    assert pickle.loads(pickle.dumps(pkt)).to_bytes() == pkt.to_bytes()
+
+    # Unknown attributes are rejected without dropping the raw buffer
+    pkt = TelemetryPacket.from_bytes(raw, time_code=cuc)
+    with pytest.raises(AttributeError):
+        pkt.foo = 1
+    assert pkt.to_bytes() is raw
+
+def test_gather_encoding_matches_to_bytes(tmp_path):
+    """Verifies scatter-gather encoding into buffers, files and sockets."""
+    import io
+    import mmap
+    import socket
+    from array import array
+    from voyager.ccsds import pack_gather_into, write_gather
+
+    block = bytes(range(200))
+    words = array('H', [0x0102, 0x0304])
+    parts = [b'\x01\x02', memoryview(block)[10:50], b'', words]
+    expected = TelemetryPacket(0x10, 9, b'\x01\x02' + block[10:50] + words.tobytes()).to_bytes()
+
+    target = bytearray(len(expected) + 4)
+    assert pack_gather_into(target, 4, 0x10, 9, parts) == len(target)
+    assert bytes(target[4:]) == expected
+    with pytest.raises(ValueError):
+        pack_gather_into(bytearray(10), 0, 0x10, 9, parts)
+
+    stream = io.BytesIO()
+    assert write_gather(stream, 0x10, 9, parts) == len(expected)
+    assert stream.getvalue() == expected
+
+    path = tmp_path / "out.bin"
+    with open(path, "wb") as f:
+        f.write(b'HEAD') # Buffered bytes must land before the vectored write
+        write_gather(f, 0x10, 9, parts)
+    assert path.read_bytes() == b'HEAD' + expected
+
+    # mmap slices can be sent without copying them out first
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        left, right = socket.socketpair()
+        with left, right:
+            mv = memoryview(mapped)
+            write_gather(left, 0x10, 9, [mv[4:10], mv[10:]])
+            del mv
+            data = right.recv(4096)
+        assert data == TelemetryPacket(0x10, 9, expected).to_bytes()
+
+def test_write_gather_resumes_partial_writes():
+    from voyager.ccsds import write_gather
+
+    class TrickleSocket:
+        """Accepts at most 5 bytes per sendmsg call, like a congested socket."""
+        def __init__(self):
+            self.received = bytearray()
+        def sendmsg(self, buffers):
+            chunk = b''.join(bytes(b) for b in buffers)[:5]
+            self.received += chunk
+            return len(chunk)
+
+    sock = TrickleSocket()
+    parts = [b'abc', b'defghij', b'k']
+    assert write_gather(sock, 1, 2, parts) == 19
+    assert bytes(sock.received) == TelemetryPacket(1, 2, b'abcdefghijk').to_bytes()
@@ -0,0 +1,92 @@
+import pytest
+from voyager.checkpoint import checkpoint, restore, fork
+from voyager.fdir import SECDED
+from voyager.memory import MemoryBank, MassMemoryBank, MappedMemoryBank, WordMemoryBank, PagedMemoryBank, Scrubber
+from voyager.obc import OnBoardComputer, Simulation
+
+def warmed_up():
+    obc = OnBoardComputer()
+    obc.boot()
+    sim = Simulation(obc)
+    banks = [
+        MemoryBank(size=512, protected=True, edac=SECDED),
+        MassMemoryBank(size=300),
+        WordMemoryBank(size=64, protected=True),
+        PagedMemoryBank(size=1 << 32, protected=True, page_words=256)
+    ]
+    for bank in banks:
+        bank.write_block(40, b"voyager!")
+    banks[0].inject_seu(41, 3)
+    sim.scrubbers.append(Scrubber(banks[0], words_per_tick=100))
+    sim.step(12.5)
+    obc.freeze()
+    sim.step(2.0)
+    return sim, banks
+
+def test_checkpoint_round_trip():
+    sim, banks = warmed_up()
+    data = checkpoint(sim, banks)
+    # Only the allocated page of the 4G word paged bank is stored
+    assert len(data) < 4096
+
+    restored, copies = restore(data)
+    assert restored.time == 14.5
+    assert vars(restored.obc) == vars(sim.obc)
+    assert [type(bank) for bank in copies] == [type(bank) for bank in banks]
+    for bank, copied in zip(banks, copies):
+        assert copied.read_block(40, 8) == bank.read_block(40, 8)
+        assert bank.read_block(40, 8).startswith(b"voyager!")
+    scrubber = restored.scrubbers[0]
+    assert scrubber.bank is copies[0] and scrubber.cursor == 200 and scrubber.corrected == 1
+
+    # The restored OBC carries on from the frozen state
+    restored.step(3.0)
+    assert restored.obc.mode == "SAFE_MODE" and restored.obc.reboot_count == 1
+    assert sim.obc.frozen
+
+    with pytest.raises(ValueError):
+        restore(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        checkpoint(sim, banks[1:])
+
+def test_fork_is_independent():
+    sim, banks = warmed_up()
+    before = [bank.read(40) for bank in banks]
+    forked, copies = fork(sim, banks)
+    for bank in copies:
+        bank.write(40, ord("V"))
+    forked.step(5.0)
+
+    assert forked.obc.reboot_count == 1 and sim.obc.reboot_count == 0
+    assert forked.scrubbers[0].bank is copies[0] and forked.scrubbers[0].cursor == 300
+    assert sim.scrubbers[0].cursor == 200
+    assert [bank.read(40) for bank in banks] == before
+    assert all(bank.read(40) == ord("V") for bank in copies)
+    # Paged banks fork copy-on-write
+    assert copies[3].pages is not banks[3].pages
+
+def test_mapped_bank_checkpoint_restores_in_memory(tmp_path):
+    obc = OnBoardComputer()
+    sim = Simulation(obc)
+    with MappedMemoryBank(tmp_path / "ssr.img", size=128, protected=True) as image:
+        image.write_block(0, b"image")
+        _, (bank,) = restore(checkpoint(sim, [image]))
+        (clone,) = fork(sim, [image])[1]
+    assert type(bank) is MassMemoryBank and type(clone) is MassMemoryBank
+    assert bank.read_block(0, 5) == clone.read_block(0, 5) == b"image"
+
+def test_fork_after_stats_cycle_does_not_touch_parent():
+    sim, banks = warmed_up()
+    for bank in banks:
+        if bank.protected:
+            bank.enable_stats()
+            bank.disable_stats()
+    banks[0].enable_stats()
+    before = [bank.read_block(40, 8) for bank in banks]
+    forked, copies = fork(sim, banks)
+    for copied in copies:
+        copied.write_block(40, b"\x00" * 8)
+        assert copied.stats is None
+        assert copied.read(41) == 0
+    assert [bank.read_block(40, 8) for bank in banks] == before
+    assert banks[0].stats is not None
@@ -1,6 +1,13 @@
+from array import array
+from functools import partial
+
+import numpy as np
 import pytest
-from voyager.memory import MemoryBank
-from voyager.fdir import EDAC
+from voyager.memory import MemoryBank, MassMemoryBank, PagedMemoryBank
+from voyager.fdir import EDAC, SECDED, SECDED32
+
+# Small pages so block operations cross page boundaries
+BANKS = pytest.mark.parametrize("bank_cls", [MemoryBank, MassMemoryBank, partial(PagedMemoryBank, page_words=64)])
 
 def test_edac_logic():
     # Test EDAC encoding and decoding logic directly
@@ -17,9 +24,10 @@ def test_edac_logic():
     assert decoded == data
     assert status == "CORRECTED_SINGLE_BIT_ERROR"
 
-def test_memory_scrub():
+@BANKS
+def test_memory_scrub(bank_cls):
     # Example from README
-    ram = MemoryBank(size=1024, protected=True)
+    ram = bank_cls(size=1024, protected=True)
     ram.write(addr=0x50, data=0xFF)
 
     # Simulate Radiation Hit (Bit flip)
@@ -36,12 +44,13 @@ def test_memory_scrub():
     assert data == 0xFF
     assert status == "OK"
 
-def test_memory_double_flip():
+@BANKS
+def test_memory_double_flip(bank_cls):
     # With SEC (Single Error Correction), double bit flips might be detected as single or incorrect correction.
     # Our simple Hamming might miscorrect double bit errors if we don't implement SEC-DED.
     # But let's just see behavior.
 
-    ram = MemoryBank(size=1024, protected=True)
+    ram = bank_cls(size=1024, protected=True)
     ram.write(addr=0x10, data=0xA5) # 10100101
 
     # Flip two bits
@@ -77,3 +86,295 @@ def test_edac_out_of_bounds():
 
     assert decoded == expected_decoded
     assert status == expected_status
+
+@BANKS
+def test_block_roundtrip_matches_word_ops(bank_cls):
+    payload = bytes(range(256)) * 4
+    for protected in (False, True):
+        ram = bank_cls(size=2048, protected=protected)
+        ram.write_block(100, payload)
+        assert ram.read_block(100, len(payload)) == payload
+        assert bytes(ram.read(100 + i) for i in range(len(payload))) == payload
+
+        # Lists of ints are masked to 8 bits like write()
+        ram.write_block(0, [0x1FF, 0x100, 7])
+        assert ram.read_block(0, 3) == bytes([0xFF, 0x00, 7])
+
+        # Int arrays are masked by value too, not reinterpreted as raw bytes
+        ram.write_block(0, np.array([0x1FF, 7]))
+        assert ram.read_block(0, 3) == bytes([0xFF, 7, 7])
+        ram.write_block(0, array('H', [300, 2]))
+        assert ram.read_block(0, 3) == bytes([300 & 0xFF, 2, 7])
+
+@BANKS
+def test_block_scrub_corrects_and_writes_back(bank_cls):
+    ram = bank_cls(size=1024, protected=True)
+    ram.write_block(0, b"\xA5" * 64)
+    for addr in (3, 10, 63):
+        ram.inject_seu(addr=addr, bit=5)
+
+    assert ram.read_block(0, 64) == b"\xA5" * 64
+    data, corrected = ram.read_block_with_scrub(0, 64)
+    assert data == b"\xA5" * 64
+    assert corrected == 3
+    assert ram.read_block_with_scrub(0, 64) == (b"\xA5" * 64, 0)
+
+@BANKS
+def test_block_out_of_bounds(bank_cls):
+    ram = bank_cls(size=16, protected=True)
+    with pytest.raises(IndexError):
+        ram.write_block(10, bytes(7))
+    with pytest.raises(IndexError):
+        ram.read_block(-1, 4)
+    with pytest.raises(IndexError):
+        ram.read_block_with_scrub(8, 9)
+
+def test_mass_memory_batch_seu_and_scrub():
+    ram = MassMemoryBank(size=10_000, protected=True)
+    ram.write_block(0, bytes(range(256)) * 39)
+    ram.inject_seus([5, 500, 9000, 500], [0, 11, 7, 11])
+    # The two hits on word 500 cancel out
+    assert ram.scrub() == 2
+    assert ram.read_block(0, 9984) == bytes(range(256)) * 39
+    assert ram.scrub() == 0
+
+    with pytest.raises(IndexError):
+        ram.inject_seus([10_000], [0])
+    with pytest.raises(ValueError):
+        ram.inject_seus([0], [16])
+    with pytest.raises(ValueError):
+        MassMemoryBank(size=4).inject_seu(0, 8)
+
+@BANKS
+def test_scrubber_walks_bank_under_budget(bank_cls):
+    from voyager.memory import Scrubber
+    from voyager.obc import OnBoardComputer, Simulation
+
+    ram = bank_cls(size=1000, protected=True)
+    ram.write_block(0, bytes(range(250)) * 4)
+    for addr in (10, 450, 999):
+        ram.inject_seu(addr=addr, bit=2)
+
+    scrubber = Scrubber(ram, words_per_tick=400)
+    sim = Simulation(OnBoardComputer())
+    sim.scrubbers.append(scrubber)
+
+    sim.step(1.0)
+    assert scrubber.cursor == 400
+    assert scrubber.corrected == 1
+    assert ram.read_with_scrub(450)[1] == "CORRECTED_SINGLE_BIT_ERROR"
+
+    sim.step(1.0)
+    sim.step(1.0)
+    stats = scrubber.stats()
+    assert stats["passes"] == 1
+    assert stats["corrected"] == 2
+    assert stats["words_scrubbed"] == 1200
+    assert stats["last_pass_time"] == 3.0
+    assert stats["scrub_rate"] > 0
+    assert scrubber.cursor == 200
+    assert ram.scrub() == 0
+
+def test_scrubber_requires_protected_bank():
+    from voyager.memory import Scrubber
+    with pytest.raises(ValueError):
+        Scrubber(MemoryBank(size=16))
+
+def test_secded_corrects_single_and_detects_double():
+    for byte_val in (0x00, 0xA5, 0xFF):
+        encoded = SECDED.encode(byte_val)
+        assert SECDED.decode(encoded) == (byte_val, "OK")
+        for i in range(13):
+            assert SECDED.decode(encoded ^ (1 << i)) == (byte_val, "CORRECTED_SINGLE_BIT_ERROR")
+            for j in range(i + 1, 13):
+                assert SECDED.decode_fast(encoded ^ (1 << i) ^ (1 << j))[1] == SECDED.STATUS_DOUBLE_ERROR
+
+@BANKS
+def test_secded_bank_leaves_double_errors_in_place(bank_cls):
+    from voyager.memory import Scrubber
+
+    ram = bank_cls(size=64, protected=True, edac=SECDED)
+    ram.write_block(0, b"\xA5" * 64)
+    ram.inject_seu(addr=0x10, bit=0)
+    ram.inject_seu(addr=0x10, bit=1)
+    ram.inject_seu(addr=0x20, bit=12)
+
+    assert ram.read_with_scrub(0x10)[1] == "DOUBLE_ERROR_DETECTED"
+    scrubber = Scrubber(ram, words_per_tick=64)
+    assert scrubber.tick() == 1
+    assert scrubber.stats()["uncorrectable"] == 1
+    assert ram.read_with_scrub(0x20) == (0xA5, "OK")
+    assert ram.read_block_with_scrub(0, 64)[1] == 0
+    assert ram.read_with_scrub(0x10)[1] == "DOUBLE_ERROR_DETECTED"
+
+def test_secded32_corrects_single_and_detects_double():
+    for word in (0, 0xDEADBEEF, 0xFFFFFFFF):
+        code = SECDED32.encode(word)
+        assert code < (1 << 39)
+        assert SECDED32.decode(code) == (word, "OK")
+        for i in range(39):
+            assert SECDED32.decode(code ^ (1 << i)) == (word, "CORRECTED_SINGLE_BIT_ERROR")
+        assert SECDED32.decode(code ^ 0b11)[1] == "DOUBLE_ERROR_DETECTED"
+
+    words = [0, 1, 0x12345678, 0xFFFFFFFF]
+    codes = SECDED32.encode_batch(words)
+    assert codes.tolist() == [SECDED32.encode(w) for w in words]
+    data, status = SECDED32.decode_batch(codes ^ (1 << 20))
+    assert data.tolist() == words
+    assert status.tolist() == [SECDED32.STATUS_CORRECTED] * 4
+
+def test_word_memory_bank():
+    from voyager.memory import WordMemoryBank, Scrubber
+
+    ram = WordMemoryBank(size=256, protected=True)
+    assert ram.memory.dtype.name == "uint64"
+    ram.write(0x10, 0xCAFEF00D)
+    assert ram.read(0x10) == 0xCAFEF00D
+
+    ram.write_block(0x20, b"\x01\x00\x00\x00\xff\xff\xff\xff")
+    assert ram.read_block(0x20, 2) == b"\x01\x00\x00\x00\xff\xff\xff\xff"
+
+    ram.inject_seu(addr=0x10, bit=31)
+    ram.inject_seu(addr=0x21, bit=35)
+    ram.inject_seu(addr=0x40, bit=0)
+    ram.inject_seu(addr=0x40, bit=9)
+    scrubber = Scrubber(ram, words_per_tick=256)
+    assert scrubber.tick() == 2
+    assert scrubber.uncorrectable == 1
+    assert ram.read_with_scrub(0x10) == (0xCAFEF00D, "OK")
+    assert ram.read_with_scrub(0x40)[1] == "DOUBLE_ERROR_DETECTED"
+
+    # Int arrays are stored by value, whatever their dtype
+    ram.write_block(0x30, np.array([1, 0xFFFFFFFF, 0x1_0000_0002], dtype=np.int64))
+    assert ram.read_block(0x30, 3) == b"\x01\x00\x00\x00\xff\xff\xff\xff\x02\x00\x00\x00"
+
+    with pytest.raises(IndexError):
+        ram.write_block(255, [1, 2])
+
+def test_mapped_memory_bank_persists(tmp_path):
+    import pickle
+    from voyager.memory import MappedMemoryBank
+
+    path = tmp_path / "ssr.img"
+    with MappedMemoryBank(path, size=4096, protected=True, edac=SECDED) as ram:
+        ram.write(0x50, 0xFF)
+        ram.write_block(0x100, b"telemetry")
+        ram.inject_seu(addr=0x101, bit=4)
+    assert path.stat().st_size == 4096 * 2
+
+    ram = MappedMemoryBank(path, protected=True, edac=SECDED, writable=False)
+    assert ram.size == 4096
+    assert ram.read(0x50) == 0xFF
+    assert ram.read_block(0x100, 9) == b"telemetry"
+    with pytest.raises(ValueError):
+        ram.write(0x50, 0)
+
+    # Pickling (e.g. to worker processes) reopens the file
+    clone = pickle.loads(pickle.dumps(ram))
+    assert clone.path == ram.path and not clone.writable
+    assert clone.read_block(0x100, 9) == b"telemetry"
+
+    rw = MappedMemoryBank(path, protected=True, edac=SECDED)
+    assert rw.scrub() == 1
+    rw.flush()
+    assert ram.read_with_scrub(0x101) == (ord("e"), "OK")
+
+def test_paged_bank_is_sparse_and_copy_on_write():
+    base = PagedMemoryBank(size=1 << 32, protected=True, edac=SECDED, page_words=1024)
+    assert base.read(0xFFFFFFFF) == 0
+    base.write_block(0x8000_0000 - 4, b"baseline")
+    assert len(base.pages) == 2
+
+    branch = base.snapshot()
+    page = 0x8000_0000 // 1024
+    assert branch.pages[page] is base.pages[page]
+    branch.inject_seus([0x8000_0000, 0x8000_0001, 0x10], [1, 2, 0])
+    assert len(branch.pages) == 3 and len(base.pages) == 2
+    assert base.read_block(0x8000_0000 - 4, 8) == b"baseline"
+    assert branch.read_block_with_scrub(0x8000_0000 - 4, 8) == (b"baseline", 2)
+
+    # Writes to the baseline after the snapshot stay out of the branch
+    base.write(0x7FFF_FFFC, ord("B"))
+    assert branch.read(0x7FFF_FFFC) == ord("b")
+    # Scrubbing clean shared pages does not copy them
+    shared = base.snapshot()
+    assert shared.scrub(0x7FFF_F000, 0x2000) == 0
+    assert all(shared.pages[i] is base.pages[i] for i in base.pages)
+
+def test_paged_scrub_visits_only_allocated_pages():
+    from voyager.memory import Scrubber
+
+    bank = PagedMemoryBank(size=1 << 32, protected=True, edac=SECDED, page_words=1024)
+    stats = bank.enable_stats(page_words=1 << 20)
+    addrs = [5, 1023, 1024, 0x8000_0000, 0xFFFF_FFFF]
+    bank.inject_seus(addrs, [0] * len(addrs))
+    assert len(bank.pages) == 4
+
+    # Ranges are clipped to partial pages at both ends
+    assert bank.scrub(6, 1018) == 1
+    assert bank.scrub(1024, 0x8000_0000 - 1024) == 1
+    assert bank.scrub() == 3
+    assert sorted(addr for addr, _, _ in stats.recent()) == sorted(addrs)
+
+    bank.inject_seus(addrs, [1] * len(addrs))
+    scrubber = Scrubber(bank, words_per_tick=1 << 28)
+    while not scrubber.passes:
+        scrubber.tick()
+    assert scrubber.corrected == len(addrs)
+    assert len(bank.pages) == 4
+
+@BANKS
+def test_edac_stats_record_errors(bank_cls):
+    bank = bank_cls(size=256, protected=True, edac=SECDED)
+    assert bank.stats is None
+    with pytest.raises(ValueError):
+        bank_cls(size=16).enable_stats()
+
+    stats = bank.enable_stats(page_words=64, recent=2)
+    bank.write_block(0, bytes(range(200)))
+    bank.inject_seu(10, 0)
+    bank.inject_seus([70, 71, 71, 130], [1, 0, 2, 3])
+    assert bank.read(10) == 10
+    assert bank.read_with_scrub(70) == (70, "CORRECTED_SINGLE_BIT_ERROR")
+    # read() corrects without writing back, so the scrub fixes word 10 again
+    assert bank.scrub() == 2
+    assert stats.corrected == 4 and stats.uncorrectable == 1
+    assert stats.scrub_writebacks == 3
+    assert stats.page_errors.tolist() == [2, 2, 1, 0]
+    # Oldest entries are overwritten once the ring is full
+    assert [(addr, status) for addr, status, _ in stats.recent()] == [(71, SECDED.STATUS_DOUBLE_ERROR), (130, 1)]
+
+    summary = stats.to_dict()
+    assert summary["page_errors"] == [[0, 2], [1, 2], [2, 1]]
+    assert summary["recent"][0]["status"] == "DOUBLE_ERROR_DETECTED"
+
+def test_edac_stats_disabled_read_is_untouched():
+    bank = MemoryBank(size=64, protected=True)
+    bank.enable_stats()
+    assert bank.read.__func__ is MemoryBank._read_instrumented
+    bank.disable_stats()
+    assert bank.stats is None and "read" not in vars(bank)
+    bank.inject_seu(0, 0)
+    assert bank.read(0) == 0
+
+    # Snapshots of a paged bank start without statistics
+    paged = PagedMemoryBank(size=64, protected=True, page_words=16)
+    paged.enable_stats()
+    assert paged.snapshot().stats is None
+
+@BANKS
+def test_copies_after_stats_cycle_read_their_own_memory(bank_cls):
+    bank = bank_cls(size=64, protected=True)
+    bank.write(0, 0x11)
+    bank.enable_stats()
+    bank.disable_stats()
+    clone = bank.snapshot() if hasattr(bank, "snapshot") else bank.copy()
+    clone.write(0, 0x22)
+    assert clone.read(0) == 0x22 and bank.read(0) == 0x11
+
+    # Snapshots taken while statistics are on start without them
+    bank.enable_stats()
+    clone = bank.copy()
+    assert clone.stats is None and "read" not in vars(clone)
+    clone.write(0, 0x33)
+    assert clone.read(0) == 0x33 and bank.read(0) == 0x11
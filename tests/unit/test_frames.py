@@ -0,0 +1,106 @@
+import pytest
+from voyager.ccsds import TelemetryPacket
+from voyager.frames import FrameMultiplexer, FrameDemultiplexer, FHP_NO_PACKET_START
+
+FRAME_LENGTH = 64
+
+def make_packets(n, apid=0x10):
+    return [TelemetryPacket(apid=apid, sequence_count=i, data=bytes([i]) * (i * 5 % 90)).to_bytes()
+            for i in range(n)]
+
+def test_mux_demux_round_trip():
+    """Verifies packets spanning several frames on interleaved VCs are reassembled."""
+    mux = FrameMultiplexer(spacecraft_id=42, frame_length=FRAME_LENGTH)
+    streams = {0: make_packets(30, apid=0x10), 3: make_packets(30, apid=0x20)}
+
+    frames = []
+    for i in range(30):
+        for vcid, packets in streams.items():
+            frames.extend(mux.push(vcid, packets[i]))
+    for vcid in streams:
+        frames.extend(mux.flush(vcid))
+
+    assert all(len(f) == FRAME_LENGTH for f in frames)
+    # Master channel frame count increments across all virtual channels
+    assert [f[2] for f in frames] == [i & 0xFF for i in range(len(frames))]
+
+    demux = FrameDemultiplexer(frame_length=FRAME_LENGTH)
+    received = {0: [], 3: []}
+    for frame in frames:
+        for vcid, view in demux.feed(frame):
+            assert view.crc_ok
+            received[vcid].append(bytes(view.raw))
+
+    assert received == streams
+    assert demux.bad_frames == 0 and demux.lost_frames == 0
+
+def test_first_header_pointer_and_idle_fill():
+    mux = FrameMultiplexer(spacecraft_id=1, frame_length=FRAME_LENGTH)
+    big = TelemetryPacket(apid=5, sequence_count=0, data=bytes(150)).to_bytes()
+
+    frames = list(mux.push(1, big)) + mux.flush(1)
+    fhps = [int.from_bytes(f[4:6], 'big') & 0x7FF for f in frames]
+    # 158 byte packet over 56 byte data fields: the middle frame holds no
+    # packet start and the last frame's idle packet starts after the tail.
+    assert fhps == [0, FHP_NO_PACKET_START, 158 - 2 * 56]
+
+    idle = mux.idle_frame()
+    assert int.from_bytes(idle[4:6], 'big') & 0x7FF == 0x7FE
+    assert list(FrameDemultiplexer(frame_length=FRAME_LENGTH).feed(idle)) == []
+
+def test_demux_resynchronises_after_loss():
+    mux = FrameMultiplexer(spacecraft_id=1, frame_length=FRAME_LENGTH)
+    packets = make_packets(40)
+    frames = []
+    for pkt in packets:
+        frames.extend(mux.push(0, pkt))
+    frames.extend(mux.flush(0))
+
+    demux = FrameDemultiplexer(frame_length=FRAME_LENGTH)
+    corrupt = bytearray(frames[5])
+    corrupt[20] ^= 0xFF
+    received = []
+    for i, frame in enumerate(frames):
+        if i == 10:
+            continue # Dropped on the link
+        received.extend(bytes(v.raw) for _, v in demux.feed(bytes(corrupt) if i == 5 else frame))
+
+    assert demux.bad_frames == 1
+    assert demux.lost_frames == 2
+    # Every delivered packet is intact and in order, and most survive.
+    positions = [packets.index(r) for r in received]
+    assert positions == sorted(positions)
+    assert len(received) > len(packets) // 2
+
+    with pytest.raises(ValueError):
+        list(demux.feed(frames[0][:-1]))
+
+def test_gap_before_idle_frame_drops_partial_packet():
+    mux = FrameMultiplexer(spacecraft_id=1, frame_length=FRAME_LENGTH)
+    big = TelemetryPacket(apid=5, sequence_count=0, data=bytes(150)).to_bytes()
+    small = TelemetryPacket(apid=6, sequence_count=1, data=b"hello").to_bytes()
+    frames = list(mux.push(0, big)) + mux.flush(0)
+    frames.append(mux.idle_frame(0))
+    frames.extend(list(mux.push(0, small)) + mux.flush(0))
+
+    demux = FrameDemultiplexer(frame_length=FRAME_LENGTH)
+    received = []
+    for i, frame in enumerate(frames):
+        if i == 2:
+            continue # Frame with the packet tail dropped; the gap shows on the idle frame
+        received.extend(view for _, view in demux.feed(frame))
+
+    assert demux.lost_frames == 1
+    assert [(view.apid, bytes(view.raw)) for view in received] == [(6, small)]
+    assert received[0].crc_ok
+
+def test_frame_length_limits():
+    # A 2046 octet data field is the largest whose offsets stay below 0x7FE
+    FrameMultiplexer(spacecraft_id=1, frame_length=6 + 2046 + 2)
+    FrameDemultiplexer(frame_length=6 + 2046, fecf=False)
+    with pytest.raises(ValueError):
+        FrameMultiplexer(spacecraft_id=1, frame_length=6 + 2047 + 2)
+    with pytest.raises(ValueError):
+        FrameDemultiplexer(frame_length=6 + 2047 + 2)
+    with pytest.raises(ValueError):
+        FrameDemultiplexer(frame_length=12)
@@ -0,0 +1,77 @@
+import pytest
+from voyager.obc import OnBoardComputer, Simulation, SimulationError
+
+def make_sim():
+    obc = OnBoardComputer()
+    obc.boot()
+    return obc, Simulation(obc)
+
+def test_events_fire_in_time_order():
+    obc, sim = make_sim()
+    fired = []
+    sim.schedule_at(5.0, fired.append, "b")
+    sim.schedule(1.0, fired.append, "a")
+    sim.schedule_at(5.0, fired.append, "c")
+    cancelled = sim.schedule(2.0, fired.append, "x")
+    cancelled.cancel()
+    ticks = sim.every(2.0, fired.append, "tick")
+
+    assert sim.next_event_time == 1.0
+    assert sim.run_until(6.0) == 6
+    assert fired == ["a", "tick", "tick", "b", "c", "tick"]
+    assert sim.time == 6.0
+
+    ticks.cancel()
+    sim.step(10.0)
+    assert sim.time == 16.0 and sim.events_processed == 6
+    with pytest.raises(SimulationError):
+        sim.schedule_at(1.0, fired.append, "late")
+    with pytest.raises(SimulationError):
+        sim.every(0, fired.append, "spin")
+
+def test_hung_obc_reboots_at_watchdog_expiry():
+    obc, sim = make_sim()
+    reboots = []
+    sim.schedule_at(100.0, obc.freeze)
+    sim.schedule_at(104.0, lambda: reboots.append(obc.reboot_count))
+    sim.schedule_at(105.0, lambda: reboots.append(obc.reboot_count))
+    assert obc.time_to_watchdog() == float("inf")
+
+    # A month in one call: the expiry is computed, not ticked towards
+    sim.run_until(30 * 86400.0)
+    assert reboots == [0, 1]
+    assert obc.mode == "SAFE_MODE" and not obc.frozen
+    assert sim.time == 30 * 86400.0
+
+    obc.freeze()
+    sim.step(3.0)
+    assert obc.time_to_watchdog() == pytest.approx(2.0)
+    sim.step(2.0)
+    assert obc.reboot_count == 2
+
+def test_fleet_matches_single_obc_semantics():
+    import numpy as np
+    from voyager.obc import OBCFleet
+
+    rng = np.random.default_rng(3)
+    n = 40
+    fleet = OBCFleet(n, watchdog_timeout=5.0)
+    obcs = [OnBoardComputer() for _ in range(n)]
+    for step in range(300):
+        for command in ("boot", "freeze", "kick_watchdog", "reboot"):
+            chosen = np.flatnonzero(rng.random(n) < 0.03)
+            getattr(fleet, command)(chosen)
+            for i in chosen.tolist():
+                getattr(obcs[i], command)()
+        dt = float(rng.choice([0.0, 0.25, 1.0, 3.7]))
+        reboots = sum(obc.time_to_watchdog() <= dt for obc in obcs)
+        assert fleet.tick(dt) == reboots
+        for obc in obcs:
+            obc.tick(dt)
+        assert [fleet.status(i) for i in range(n)] == [
+            {"mode": obc.mode, "reboot_count": obc.reboot_count,
+             "watchdog_timer": obc.watchdog_timer, "frozen": obc.frozen} for obc in obcs]
+
+    assert sum(fleet.counts().values()) == n
+    with pytest.raises(SimulationError):
+        fleet.tick(float("nan"))
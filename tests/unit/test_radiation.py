@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from voyager.fdir import SECDED
+from voyager.memory import MemoryBank, MassMemoryBank, Scrubber
+from voyager.radiation import RadiationModel
+
+def test_upset_count_follows_rate():
+    ram = MassMemoryBank(size=1 << 16, protected=True)
+    model = RadiationModel(ram, cross_section=1e-10, flux=10.0, seed=3)
+    # 1e-9 upsets/bit/s * 12 bits * 65536 words ~= 7.9e-4 per second
+    events = model.run(duration=100_000, dt=100.0)
+    assert model.time == pytest.approx(100_000)
+    assert abs(events - model.upset_rate * 100_000) < 5 * np.sqrt(model.upset_rate * 100_000)
+    assert model.bit_flips == events
+    assert np.count_nonzero(ram.memory) > 0
+    assert ram.memory.max() < (1 << 12)
+
+def test_mbu_clusters_are_adjacent_bits():
+    ram = MemoryBank(size=1 << 16, protected=True, edac=SECDED)
+    model = RadiationModel(ram, cross_section=1e-6, flux=100.0, mbu_sizes={2: 0.5, 3: 0.5}, seed=1)
+    addrs, bits = model.draw(1.0)
+    assert len(addrs) > 0 and bits.max() < 13
+    # Flips are listed cluster by cluster: same word, consecutive bits
+    steps = np.flatnonzero((addrs[1:] == addrs[:-1]) & (bits[1:] == bits[:-1] + 1))
+    assert len(addrs) - len(steps) <= len(addrs) / 2
+
+    events = model.tick(1.0)
+    assert events > 0 and model.mbu_events == events
+    assert 2 * events <= model.bit_flips <= 3 * events
+    # Double-bit clusters are detected but cannot be corrected
+    scrubber = Scrubber(ram, words_per_tick=1 << 16)
+    scrubber.tick()
+    assert scrubber.uncorrectable > 0
+
+def test_invalid_mbu_sizes():
+    ram = MemoryBank(size=16, protected=True)
+    with pytest.raises(ValueError):
+        RadiationModel(ram, 1e-14, 1.0, mbu_sizes={13: 0.1})
+    with pytest.raises(ValueError):
+        RadiationModel(ram, 1e-14, 1.0, mbu_sizes={2: 0.7, 3: 0.6})
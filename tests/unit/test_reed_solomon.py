@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from voyager.ccsds import TelemetryPacket
+from voyager.fdir import ReedSolomon
+from voyager.frames import FrameMultiplexer, FrameDemultiplexer
+from voyager.memory import MemoryBank
+
+def test_corrects_up_to_16_symbol_errors():
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 256, (40, ReedSolomon.K), dtype=np.uint8)
+    codewords = ReedSolomon.encode_batch(data)
+    assert codewords.shape == (40, 255)
+    assert not ReedSolomon.syndromes_batch(codewords).any()
+
+    for row in range(40):
+        n = row % 18
+        positions = rng.choice(255, n, replace=False)
+        codewords[row, positions] ^= rng.integers(1, 256, n, dtype=np.uint8)
+    decoded, errors = ReedSolomon.decode_batch(codewords)
+    correctable = np.arange(40) % 18 <= 16
+    assert (decoded[correctable] == data[correctable]).all()
+    assert errors[correctable].tolist() == (np.arange(40) % 18)[correctable].tolist()
+    assert (errors[~correctable] == -1).all()
+
+def test_interleaved_transfer_frames_survive_burst():
+    mux = FrameMultiplexer(spacecraft_id=42)
+    packet = TelemetryPacket(apid=5, sequence_count=0, data=bytes(range(256)) * 8)
+    frames = mux.push(1, packet) + mux.flush(1)
+    rs = ReedSolomon(interleave=5)
+
+    demux = FrameDemultiplexer()
+    packets = []
+    for frame in frames:
+        block = bytearray(rs.encode(frame))
+        assert len(block) == 1275
+        # A 70-byte burst spreads over the five codewords (14 symbols each)
+        block[300:370] = bytes(70)
+        data, corrected, failed = rs.decode(bytes(block))
+        assert data == frame and failed == 0 and corrected > 0
+        packets.extend(demux.feed(data))
+    assert demux.bad_frames == 0
+    assert bytes(packets[0][1].data) == bytes(range(256)) * 8
+
+def test_memory_bank_blocks():
+    rs = ReedSolomon(interleave=2)
+    payload = bytes(range(223)) * 2
+    ram = MemoryBank(size=1024)
+    ram.write_block(0, rs.encode(payload))
+    # Consecutive bytes alternate between the two codewords: 16 errors each
+    ram.inject_seus(range(32), [7] * 32)
+    assert rs.decode(ram.read_block(0, 510)) == (payload, 32, 0)
+
+    with pytest.raises(ValueError):
+        rs.encode(bytes(223))
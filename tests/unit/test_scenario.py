@@ -0,0 +1,78 @@
+import io
+
+import pytest
+from voyager.scenario import run_batch, run_scenario, run_scenarios, summarize
+
+WATCHDOG = {
+    "name": "watchdog-reboot",
+    "duration": 86400.0,
+    "freeze": [100.0],
+    "expect": {"mode": "SAFE_MODE", "reboot_count": 1, "frozen": False}
+}
+
+SEU = {
+    "name": "scrubbed-seus",
+    "duration": 60.0,
+    "tick": 1.0,
+    "memory": {"size": 256, "codec": "SECDED", "scrub_period": 10.0},
+    "seus": [[5.0, 0x50, 3], [42.0, 0x10, 8], [42.0, 0x10, 9]],
+    # The double error is detected again by every later scrub pass
+    "expect": {"corrected": 1, "uncorrectable": 2, "data_errors": 1, "mode": "NORMAL"}
+}
+
+def test_scenarios_check_expectations():
+    assert run_scenario(WATCHDOG)["passed"]
+    result = run_scenario(SEU)
+    assert result["passed"], result["failures"]
+    assert result["latent_errors"] == 1 and result["sim_time"] == 60.0
+
+    failing = dict(WATCHDOG, expect={"reboot_count": 2})
+    result = run_scenario(failing)
+    assert not result["passed"]
+    assert result["failures"] == "reboot_count: expected 2, got 1"
+
+    with pytest.raises(ValueError):
+        run_scenario({"duration": 1.0, "commands": [[0.5, "selfdestruct"]]})
+    with pytest.raises(ValueError):
+        run_scenario({"duration": 1.0, "random_seus": 3})
+
+def test_batch_is_deterministic_across_workers():
+    scenarios = [
+        {"name": f"random-{i}", "duration": 3600.0, "freeze": [60.0 * i],
+         "memory": {"size": 512, "codec": codec, "scrub_period": 600.0}, "random_seus": 20}
+        for i in range(12) for codec in ("EDAC", "SECDED32")
+    ]
+    key = lambda r: r["index"]
+    strip = lambda results: [{k: v for k, v in r.items() if k != "wall_time"} for r in sorted(results, key=key)]
+    out = io.StringIO()
+    serial = list(run_scenarios(scenarios, workers=1, seed=5, batch_size=5, output=out))
+    parallel = list(run_scenarios(scenarios, workers=2, seed=5, batch_size=7))
+    assert strip(serial) == strip(parallel)
+    assert strip(serial) != strip(run_scenarios(scenarios, workers=1, seed=6))
+    assert len(out.getvalue().strip().splitlines()) == len(scenarios) + 1
+
+    summary = summarize(serial, elapsed=1.0)
+    assert summary["scenarios"] == summary["passed"] == 24
+    assert summary["sim_time"] == 24 * 3600.0
+    assert summary["speedup"] > 1
+
+@pytest.mark.parametrize("bad", [
+    {"freeze": [-1.0]},
+    {"commands": [[float("nan"), "reboot"]]},
+    {"tick": 0},
+    {"memory": {"size": 64}, "seus": [[1.0, 10, 40]]},
+    {"memory": {"size": 64}, "seus": [[1.0, 64, 0]]},
+    {"memory": {"size": 64, "codec": "SECDED32"}, "seus": [[-0.5, 1, 0]]},
+    {"memory": {"size": 64}, "random_seus": -1}
+])
+def test_malformed_scenarios_are_rejected_up_front(bad):
+    scenarios = [WATCHDOG, dict(bad, duration=10.0), SEU]
+    with pytest.raises(ValueError):
+        next(run_scenarios(scenarios, workers=1))
+
+def test_batch_reports_errors_as_failed_results():
+    results = run_batch([WATCHDOG, {"duration": 10.0, "freeze": [-1.0]}, SEU], range(3))
+    assert [r["passed"] for r in results] == [True, False, True]
+    assert results[1]["failures"].startswith("ValueError: freeze time")
+    assert results[1]["mode"] is None
+    assert summarize(results)["failed"] == ["scenario-1"]
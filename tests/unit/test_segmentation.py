@@ -0,0 +1,68 @@
+import io
+import pytest
+from voyager.ccsds import TelemetryPacket, PacketDeframer, SEQ_FIRST, SEQ_CONTINUATION, SEQ_LAST, SEQ_UNSEGMENTED
+from voyager.segmentation import segment_payload, SegmentReassembler
+
+PAYLOAD = bytes(range(256)) * 40 # 10240 bytes
+
+def test_segment_flags_and_sequence():
+    packets = list(segment_payload(0x30, PAYLOAD, sequence_count=0x3FFE, max_data_length=4000))
+    views = [v for p in packets for v in PacketDeframer().feed(p)]
+
+    assert [v.sequence_flags for v in views] == [SEQ_FIRST, SEQ_CONTINUATION, SEQ_LAST]
+    assert [v.sequence_count for v in views] == [0x3FFE, 0x3FFF, 0]
+    assert all(v.crc_ok and v.apid == 0x30 for v in views)
+    assert b''.join(bytes(v.data) for v in views) == PAYLOAD
+
+    (single,) = segment_payload(0x30, b'small')
+    assert single == TelemetryPacket(0x30, 0, b'small').to_bytes()
+    (empty,) = segment_payload(0x30, b'')
+    assert TelemetryPacket.from_bytes(empty).sequence_flags == SEQ_UNSEGMENTED
+
+    with pytest.raises(ValueError):
+        list(segment_payload(0x30, PAYLOAD, max_data_length=0))
+
+def test_file_source_matches_buffer_source():
+    from_buffer = list(segment_payload(1, memoryview(PAYLOAD), max_data_length=1000))
+    from_file = list(segment_payload(1, io.BytesIO(PAYLOAD), max_data_length=1000))
+    assert from_file == from_buffer
+    # Exact multiple of the segment size still ends with a LAST packet.
+    exact = list(segment_payload(1, io.BytesIO(PAYLOAD[:3000]), max_data_length=1000))
+    assert [TelemetryPacket.from_bytes(p).sequence_flags for p in exact] == [SEQ_FIRST, SEQ_CONTINUATION, SEQ_LAST]
+
+def test_reassembler_interleaved_apids_and_file_sink():
+    a = list(segment_payload(1, PAYLOAD, max_data_length=3000))
+    b = list(segment_payload(2, PAYLOAD[::-1], max_data_length=3000))
+    stream = [p for pair in zip(a, b) for p in pair]
+
+    sinks = {}
+    def sink_factory(apid):
+        sinks[apid] = io.BytesIO()
+        return sinks[apid]
+
+    for factory in (None, sink_factory):
+        reassembler = SegmentReassembler(sink_factory=factory)
+        done = [r for r in (reassembler.feed(TelemetryPacket.from_bytes(p), now=0.0) for p in stream) if r]
+        payloads = {apid: bytes(sink) if factory is None else sink.getvalue() for apid, sink in done}
+        assert payloads == {1: PAYLOAD, 2: PAYLOAD[::-1]}
+        assert reassembler.completed == 2 and reassembler.pending == []
+
+def test_reassembler_discards_gaps_timeouts_and_oversize():
+    packets = [TelemetryPacket.from_bytes(p) for p in segment_payload(7, PAYLOAD, max_data_length=2000)]
+
+    reassembler = SegmentReassembler(timeout=5.0)
+    assert reassembler.feed(packets[0], now=0.0) is None
+    assert reassembler.feed(packets[2], now=1.0) is None # Gap: packets[1] lost
+    assert reassembler.discarded == 1
+    assert reassembler.feed(packets[3], now=1.0) is None
+    assert reassembler.orphaned == 1
+
+    reassembler.feed(packets[0], now=10.0)
+    assert reassembler.expire(now=12.0) == 0
+    assert reassembler.expire(now=20.0) == 1
+    assert reassembler.pending == []
+
+    small = SegmentReassembler(max_payload_length=3000)
+    results = [small.feed(p, now=0.0) for p in packets]
+    assert results == [None] * len(packets)
+    assert small.discarded == 1
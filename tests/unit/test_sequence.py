@@ -0,0 +1,47 @@
+import random
+import numpy as np
+from voyager.sequence import SequenceTracker
+
+def test_gap_duplicate_and_wrap():
+    tracker = SequenceTracker()
+    statuses = [tracker.update(0x10, seq) for seq in (16381, 16382, 16383, 0, 1, 4, 4, 2, 5)]
+    assert [SequenceTracker.STATUS_MAP[s] for s in statuses] == [
+        "OK", "OK", "OK", "OK", "OK", "SEQUENCE_GAP", "DUPLICATE_OR_LATE", "DUPLICATE_OR_LATE", "OK"
+    ]
+    stats = tracker.stats(0x10)
+    assert stats == {"received": 9, "lost": 2, "duplicates": 2, "wraps": 1, "last_sequence_count": 5}
+    assert list(tracker.recent_gaps) == [(0x10, 2, 2)]
+    assert tracker.stats(0x11)["last_sequence_count"] is None
+
+def test_batch_matches_incremental():
+    """Verifies update_batch against update() on interleaved streams with losses, repeats and wraps."""
+    rng = random.Random(3)
+    counters = {apid: rng.randrange(0x4000) for apid in (0, 5, 0x7FE)}
+    apids, seqs = [], []
+    for _ in range(5000):
+        apid = rng.choice(list(counters))
+        r = rng.random()
+        if r < 0.05:
+            counters[apid] += rng.randrange(2, 50) # Lost packets
+        elif r < 0.08:
+            counters[apid] -= rng.randrange(0, 3) # Repeat / late packet
+        else:
+            counters[apid] += 1
+        apids.append(apid)
+        seqs.append(counters[apid] & 0x3FFF)
+
+    incremental = SequenceTracker()
+    expected = [incremental.update(a, s) for a, s in zip(apids, seqs)]
+
+    # Split across two batches to exercise carrying state between calls.
+    batch = SequenceTracker()
+    result = np.concatenate([
+        batch.update_batch(np.array(apids[:1234]), np.array(seqs[:1234])),
+        batch.update_batch(np.array(apids[1234:]), np.array(seqs[1234:])),
+    ])
+
+    assert result.tolist() == expected
+    for apid in counters:
+        assert batch.stats(apid) == incremental.stats(apid)
+    assert list(batch.recent_gaps) == list(incremental.recent_gaps)
+    assert batch.active_apids().tolist() == [0, 5, 0x7FE]
@@ -0,0 +1,203 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from .ccsds import _HEADER_STRUCT
+
+# Sidecar index record: byte offset and length of the packet in the data
+# file, APID, sequence count and timestamp (seconds, caller-defined epoch).
+_INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('length', '<u4'),
+    ('apid', '<u2'),
+    ('sequence_count', '<u2'),
+    ('timestamp', '<f8'),
+])
+_INDEX_STRUCT = struct.Struct('<QIHHd')
+assert _INDEX_STRUCT.size == _INDEX_DTYPE.itemsize
+
+
+class TelemetryArchive:
+    """
+    Append-only on-disk archive of encoded Space Packets.
+
+    Packets are stored back to back in 'path' and described by fixed-size
+    records in 'path.idx'. Both files are memory-mapped on demand, so opening
+    an archive only reads two file sizes and time-window queries touch only
+    the index pages visited by the binary search plus the packets they
+    return. The first query by APID scans the whole index once (see
+    select()).
+    Packets must be appended in non-decreasing timestamp order.
+    """
+
+    def __init__(self, path, writable=False):
+        self.path = os.fspath(path)
+        self.index_path = self.path + '.idx'
+        self.writable = writable
+
+        if writable:
+            self._data_file = open(self.path, 'ab')
+            self._index_file = open(self.index_path, 'ab')
+        else:
+            self._data_file = self._index_file = None
+
+        self._data_size = os.path.getsize(self.path)
+        # A crash can leave a torn trailing record; ignore partial records and
+        # records whose packet bytes never reached the data file.
+        self._count = os.path.getsize(self.index_path) // _INDEX_DTYPE.itemsize
+        self._data_map = None
+        self._index_map = None
+        self._mapped_count = -1
+        self._mapped_size = -1
+        # APID -> ascending index positions, covering the first
+        # _apid_indexed records; built by the first APID query.
+        self._apid_positions = {}
+        self._apid_indexed = 0
+
+        index = self.index
+        count = self._count
+        while count and int(index['offset'][count - 1]) + int(index['length'][count - 1]) > self._data_size:
+            count -= 1
+        self._count = count
+        if count:
+            last = index[count - 1]
+            end = int(last['offset']) + int(last['length'])
+            self._last_timestamp = float(last['timestamp'])
+        else:
+            end = 0
+            self._last_timestamp = float('-inf')
+
+        if writable:
+            # Drop the torn tail so new appends line up with the index.
+            self._data_file.truncate(end)
+            self._index_file.truncate(count * _INDEX_DTYPE.itemsize)
+            self._data_size = end
+            self._mapped_count = -1
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, raw, timestamp):
+        """Appends one encoded packet. O(1): one write to each file."""
+        if not self.writable:
+            raise ValueError("Archive is opened read-only")
+        if len(raw) < 6:
+            raise ValueError("Packet is shorter than a primary header")
+        if timestamp < self._last_timestamp:
+            raise ValueError("Packets must be appended in non-decreasing timestamp order")
+
+        word0, word1, _ = _HEADER_STRUCT.unpack_from(raw)
+        self._data_file.write(raw)
+        self._index_file.write(_INDEX_STRUCT.pack(self._data_size, len(raw), word0 & 0x7FF, word1 & 0x3FFF, timestamp))
+        self._data_size += len(raw)
+        self._count += 1
+        self._last_timestamp = timestamp
+
+    def append_packet(self, packet, timestamp=None):
+        """Appends a TelemetryPacket, defaulting to its secondary header timestamp."""
+        if timestamp is None:
+            timestamp = packet.timestamp
+            if timestamp is None:
+                raise ValueError("Packet has no secondary header timestamp; pass timestamp=")
+        self.append(packet.to_bytes(), timestamp)
+
+    def flush(self):
+        if self.writable:
+            self._data_file.flush()
+            self._index_file.flush()
+
+    def close(self):
+        if self.writable:
+            self._data_file.close()
+            self._index_file.close()
+            self.writable = False
+        # Outstanding memoryviews keep the mappings alive until released.
+        self._data_map = self._index_map = None
+        self._mapped_count = self._mapped_size = -1
+
+    @property
+    def index(self):
+        """Structured NumPy view of the index (offset, length, apid, sequence_count, timestamp)."""
+        if self._mapped_count != self._count:
+            self.flush()
+            if self._count:
+                self._index_map = np.memmap(self.index_path, dtype=_INDEX_DTYPE, mode='r', shape=(self._count,))
+            else:
+                self._index_map = np.zeros(0, dtype=_INDEX_DTYPE)
+            self._mapped_count = self._count
+        return self._index_map
+
+    @property
+    def data(self):
+        """Read-only mmap of the packet data file."""
+        if self._mapped_size != self._data_size:
+            self.flush()
+            if self._data_size:
+                with open(self.path, 'rb') as f:
+                    self._data_map = mmap.mmap(f.fileno(), self._data_size, access=mmap.ACCESS_READ)
+            else:
+                self._data_map = b''
+            self._mapped_size = self._data_size
+        return self._data_map
+
+    def packet(self, i):
+        """Returns packet i as a memoryview into the mapped data file."""
+        record = self.index[i]
+        offset = int(record['offset'])
+        return memoryview(self.data)[offset:offset + int(record['length'])]
+
+    def _positions_of(self, apid):
+        """Ascending index positions of every packet with this APID."""
+        if self._apid_indexed != self._count:
+            # Optimization: Group only the records appended since the last
+            # APID query; one stable argsort keeps each group in order.
+            first = self._apid_indexed
+            apids = self.index['apid'][first:self._count]
+            order = np.argsort(apids, kind='stable')
+            grouped = apids[order]
+            bounds = np.flatnonzero(np.diff(grouped)) + 1
+            for lo, hi in zip(np.r_[0, bounds].tolist(), np.r_[bounds, len(order)].tolist()):
+                key = int(grouped[lo])
+                new = order[lo:hi].astype(np.intp) + first
+                known = self._apid_positions.get(key)
+                self._apid_positions[key] = new if known is None else np.concatenate((known, new))
+            self._apid_indexed = self._count
+        return self._apid_positions.get(apid, np.zeros(0, dtype=np.intp))
+
+    def select(self, start=None, end=None, apid=None):
+        """
+        Returns index positions of packets with start <= timestamp < end,
+        optionally restricted to one APID. The time window is located by
+        binary search. APID queries binary-search that window in a per-APID
+        position index held in memory: the first APID query builds it with
+        one scan of the whole index (every index page is read once), and
+        later queries only add records appended since.
+        """
+        index = self.index
+        times = index['timestamp']
+        lo = 0 if start is None else int(np.searchsorted(times, start, side='left'))
+        hi = self._count if end is None else int(np.searchsorted(times, end, side='left'))
+        if hi <= lo:
+            return np.zeros(0, dtype=np.intp)
+        if apid is None:
+            return np.arange(lo, hi)
+        positions = self._positions_of(apid)
+        return positions[np.searchsorted(positions, lo):np.searchsorted(positions, hi)].copy()
+
+    def query(self, start=None, end=None, apid=None):
+        """Yields memoryview slices of the packets matched by select()."""
+        positions = self.select(start, end, apid)
+        if not len(positions):
+            return
+        records = self.index[positions]
+        view = memoryview(self.data)
+        for offset, length in zip(records['offset'].tolist(), records['length'].tolist()):
+            yield view[offset:offset + length]
@@ -0,0 +1,173 @@
+import csv
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .fdir import EDAC, SECDED, SECDED32
+from .memory import MassMemoryBank, WordMemoryBank
+
+CODECS = {
+    "EDAC": EDAC,
+    "SECDED": SECDED,
+    "SECDED32": SECDED32
+}
+
+RESULT_FIELDS = (
+    "codec", "upset_rate", "scrub_interval", "words", "trials", "failures",
+    "failure_probability", "ci_low", "ci_high", "upsets", "corrected",
+    "uncorrectable", "silent"
+)
+
+# Upper bound on words held by one shard's bank (trials are batched into it)
+_BATCH_WORDS = 1 << 20
+
+
+def wilson_interval(successes, trials, z=1.96):
+    """Wilson score interval for a binomial proportion (95% by default)."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def sweep(upset_rates, scrub_intervals, codecs=("EDAC", "SECDED")):
+    """Cartesian product of campaign parameters as (codec, upset_rate, scrub_interval) tuples."""
+    return list(itertools.product(codecs, upset_rates, scrub_intervals))
+
+
+def run_shard(codec_name, upset_rate, scrub_interval, words, trials, seed, spawn_key):
+    """
+    Runs 'trials' independent scrub intervals of a 'words' word bank and
+    returns the summed outcome counts.
+
+    Each trial draws a Poisson number of upsets (upset_rate per codeword bit
+    per second over scrub_interval seconds) at uniform word/bit positions.
+    A trial fails if any word is uncorrectable (detected) or decodes to
+    wrong data without being flagged (silent). Trials are batched into one
+    bank, so injection and decoding are a few NumPy calls per batch and
+    only the words that were hit are decoded.
+    """
+    codec = CODECS[codec_name]
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=spawn_key))
+    bank_cls = WordMemoryBank if codec is SECDED32 else MassMemoryBank
+    batch = max(1, min(trials, _BATCH_WORDS // words))
+    data_dtype = np.uint32 if codec is SECDED32 else np.uint8
+    # Plain SEC codes cannot flag double errors; those show up as silent.
+    double_error = getattr(codec, "STATUS_DOUBLE_ERROR", None)
+
+    bank = bank_cls(size=batch * words, protected=True, edac=codec)
+    original = rng.integers(0, np.iinfo(data_dtype).max, batch * words, dtype=data_dtype, endpoint=True)
+    bank.write_block(0, original)
+    clean = bank.memory.copy()
+    lam = upset_rate * scrub_interval * words * codec.CODE_BITS
+
+    counts = {"trials": 0, "failures": 0, "upsets": 0, "corrected": 0, "uncorrectable": 0, "silent": 0}
+    remaining = trials
+    while remaining:
+        n = min(batch, remaining)
+        remaining -= n
+        hits = rng.poisson(lam, n)
+        total = int(hits.sum())
+        counts["trials"] += n
+        counts["upsets"] += total
+        if not total:
+            continue
+
+        trial = np.repeat(np.arange(n), hits)
+        addrs = trial * words + rng.integers(0, words, total)
+        bank.inject_seus(addrs, rng.integers(0, codec.CODE_BITS, total))
+
+        touched = np.unique(addrs)
+        data, status = codec.decode_batch(bank.memory[touched])
+        due = status == double_error
+        sdc = (data != original[touched]) & ~due
+        failed = due | sdc
+        counts["corrected"] += int(np.count_nonzero((status == codec.STATUS_CORRECTED) & ~sdc))
+        counts["uncorrectable"] += int(np.count_nonzero(due))
+        counts["silent"] += int(np.count_nonzero(sdc))
+        counts["failures"] += len(np.unique(touched[failed] // words))
+
+        # Restore the hit words for the next batch
+        bank.memory[touched] = clean[touched]
+    return counts
+
+
+def _result(config, words, counts):
+    codec_name, upset_rate, scrub_interval = config
+    trials = counts["trials"]
+    low, high = wilson_interval(counts["failures"], trials)
+    result = {
+        "codec": codec_name,
+        "upset_rate": upset_rate,
+        "scrub_interval": scrub_interval,
+        "words": words,
+        "failure_probability": counts["failures"] / trials if trials else 0.0,
+        "ci_low": low,
+        "ci_high": high
+    }
+    result.update(counts)
+    return result
+
+
+def run_campaign(configs, trials, words=1024, shard_trials=100_000, workers=None, seed=0, output=None):
+    """
+    Runs 'trials' trials for every (codec, upset_rate, scrub_interval) in
+    'configs' and yields one aggregated result dict per configuration as
+    soon as all of its shards have finished.
+
+    Trials are split into shards of shard_trials, and shard i of config j
+    is seeded from SeedSequence(seed, spawn_key=(j, i)), so results do not
+    depend on the number of workers or on completion order. Shards run on
+    a ProcessPoolExecutor with 'workers' processes (default: all cores;
+    0 or 1 runs in-process). If 'output' is a text file, each result is
+    also written to it as a CSV row as it is yielded.
+    """
+    writer = None
+    if output is not None:
+        writer = csv.DictWriter(output, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+
+    configs = [tuple(config) for config in configs]
+    shards = []
+    for j, config in enumerate(configs):
+        for i, start in enumerate(range(0, trials, shard_trials)):
+            shards.append((j, config + (words, min(shard_trials, trials - start), seed, (j, i))))
+    pending = [len(range(0, trials, shard_trials))] * len(configs)
+    totals = [None] * len(configs)
+
+    def finish(j, counts):
+        if totals[j] is None:
+            totals[j] = counts
+        else:
+            for key, value in counts.items():
+                totals[j][key] += value
+        pending[j] -= 1
+        if pending[j]:
+            return None
+        result = _result(configs[j], words, totals[j])
+        if writer is not None:
+            writer.writerow(result)
+            output.flush()
+        return result
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for j, args in shards:
+            result = finish(j, run_shard(*args))
+            if result is not None:
+                yield result
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_shard, *args): j for j, args in shards}
+        for future in as_completed(futures):
+            result = finish(futures[future], future.result())
+            if result is not None:
+                yield result
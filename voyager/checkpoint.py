@@ -0,0 +1,174 @@
+import copy
+import struct
+
+import numpy as np
+
+from .fdir import EDAC, SECDED, SECDED32
+from .memory import MemoryBank, MassMemoryBank, WordMemoryBank, PagedMemoryBank, Scrubber
+from .obc import OBCFleet, OnBoardComputer, Simulation
+
+MAGIC = b"VGCK"
+VERSION = 1
+
+CODECS = (EDAC, SECDED, SECDED32)
+
+# Bank kinds; mapped banks are restored into memory as MassMemoryBank.
+KIND_ARRAY = 0
+KIND_MASS = 1
+KIND_WORD = 2
+KIND_PAGED = 3
+
+# magic, version, bank count, scrubber count, simulation time, events processed
+_HEADER_STRUCT = struct.Struct('<4sHHHdq')
+# mode, frozen, reboot count, watchdog timer, watchdog timeout
+_OBC_STRUCT = struct.Struct('<BBqdd')
+# kind, protected, codec, size, page words, stored pages
+_BANK_STRUCT = struct.Struct('<BBBQIQ')
+_PAGE_STRUCT = struct.Struct('<Q')
+# bank index, words per tick, cursor, words scrubbed, corrected, uncorrectable, passes
+_SCRUBBER_STRUCT = struct.Struct('<Hqqqqqq')
+
+
+def _bank_kind(bank):
+    # Subclasses first: WordMemoryBank and MappedMemoryBank are MassMemoryBanks.
+    if isinstance(bank, PagedMemoryBank):
+        return KIND_PAGED
+    if isinstance(bank, WordMemoryBank):
+        return KIND_WORD
+    if isinstance(bank, MassMemoryBank):
+        return KIND_MASS
+    if isinstance(bank, MemoryBank):
+        return KIND_ARRAY
+    raise TypeError(f"Cannot checkpoint {type(bank).__name__}")
+
+
+def _little_endian(words):
+    return np.ascontiguousarray(words, dtype=words.dtype.newbyteorder('<'))
+
+
+def checkpoint(sim, banks=()):
+    """
+    Serializes a Simulation (its OBC, time and scrubbers) and 'banks' to a
+    compact binary checkpoint (bytes).
+
+    Bank contents are stored as their raw little-endian word buffers, and
+    sparse paged banks store only their allocated pages. Every scrubber of
+    the simulation must scrub one of 'banks'. Pending events and EDAC
+    statistics are not part of a checkpoint.
+    """
+    banks = list(banks)
+    index = {id(bank): i for i, bank in enumerate(banks)}
+    obc = sim.obc
+    parts = [
+        _HEADER_STRUCT.pack(MAGIC, VERSION, len(banks), len(sim.scrubbers), sim.time, sim.events_processed),
+        _OBC_STRUCT.pack(OBCFleet.MODES.index(obc.mode), obc.frozen, obc.reboot_count,
+                         obc.watchdog_timer, obc.watchdog_timeout)
+    ]
+
+    for bank in banks:
+        kind = _bank_kind(bank)
+        codec = CODECS.index(bank.edac)
+        if kind == KIND_PAGED:
+            parts.append(_BANK_STRUCT.pack(kind, bank.protected, codec, bank.size, bank.page_words, len(bank.pages)))
+            for page_index in sorted(bank.pages):
+                parts.append(_PAGE_STRUCT.pack(page_index))
+                parts.append(_little_endian(bank.pages[page_index]).tobytes())
+        else:
+            parts.append(_BANK_STRUCT.pack(kind, bank.protected, codec, bank.size, 0, 0))
+            parts.append(_little_endian(bank._words()).tobytes())
+
+    for scrubber in sim.scrubbers:
+        if id(scrubber.bank) not in index:
+            raise ValueError("Scrubbed bank is not among the checkpointed banks")
+        parts.append(_SCRUBBER_STRUCT.pack(
+            index[id(scrubber.bank)], scrubber.words_per_tick, scrubber.cursor, scrubber.words_scrubbed,
+            scrubber.corrected, scrubber.uncorrectable, scrubber.passes))
+    return b"".join(parts)
+
+
+def restore(data):
+    """
+    Rebuilds (Simulation, banks) from checkpoint() output. The restored
+    simulation has no pending events.
+    """
+    data = memoryview(data)
+    magic, version, n_banks, n_scrubbers, time, events = _HEADER_STRUCT.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a supported Voyager checkpoint")
+    pos = _HEADER_STRUCT.size
+
+    mode, frozen, reboot_count, timer, timeout = _OBC_STRUCT.unpack_from(data, pos)
+    pos += _OBC_STRUCT.size
+    obc = OnBoardComputer()
+    obc.mode = OBCFleet.MODES[mode]
+    obc.frozen = bool(frozen)
+    obc.reboot_count = reboot_count
+    obc.watchdog_timer = timer
+    obc.watchdog_timeout = timeout
+
+    banks = []
+    for _ in range(n_banks):
+        kind, protected, codec, size, page_words, pages = _BANK_STRUCT.unpack_from(data, pos)
+        pos += _BANK_STRUCT.size
+        protected = bool(protected)
+        edac = CODECS[codec]
+        if kind == KIND_PAGED:
+            bank = PagedMemoryBank(size, protected, edac, page_words)
+            dtype = bank._dtype.newbyteorder('<')
+            for _ in range(pages):
+                page_index = _PAGE_STRUCT.unpack_from(data, pos)[0]
+                pos += _PAGE_STRUCT.size
+                page = np.frombuffer(data, dtype=dtype, count=page_words, offset=pos)
+                bank.pages[page_index] = page.astype(bank._dtype)
+                bank._owned.add(page_index)
+                pos += page.nbytes
+        else:
+            if kind == KIND_WORD:
+                bank = WordMemoryBank(size, protected, edac)
+            elif kind == KIND_MASS:
+                bank = MassMemoryBank(size, protected, edac)
+            else:
+                bank = MemoryBank(size, protected, edac)
+            words = bank._words()
+            stored = np.frombuffer(data, dtype=words.dtype.newbyteorder('<'), count=size, offset=pos)
+            words[:] = stored
+            pos += stored.nbytes
+        banks.append(bank)
+
+    sim = Simulation(obc)
+    sim.time = time
+    sim.events_processed = events
+    for _ in range(n_scrubbers):
+        bank_index, words_per_tick, cursor, scrubbed, corrected, uncorrectable, passes = \
+            _SCRUBBER_STRUCT.unpack_from(data, pos)
+        pos += _SCRUBBER_STRUCT.size
+        scrubber = Scrubber(banks[bank_index], words_per_tick)
+        scrubber.cursor = cursor
+        scrubber.words_scrubbed = scrubbed
+        scrubber.corrected = corrected
+        scrubber.uncorrectable = uncorrectable
+        scrubber.passes = passes
+        sim.scrubbers.append(scrubber)
+    return sim, banks
+
+
+def fork(sim, banks=()):
+    """
+    In-process equivalent of restore(checkpoint(sim, banks)) that skips
+    serialization: the OBC and scrubbers are shallow-copied and each bank
+    is copied with bank.copy(), which for paged banks is a copy-on-write
+    snapshot. Returns (Simulation, banks); pending events are not copied.
+    """
+    clones = [bank.copy() for bank in banks]
+    remap = {id(bank): clone for bank, clone in zip(banks, clones)}
+
+    forked = Simulation(copy.copy(sim.obc))
+    forked.time = sim.time
+    forked.events_processed = sim.events_processed
+    for scrubber in sim.scrubbers:
+        if id(scrubber.bank) not in remap:
+            raise ValueError("Scrubbed bank is not among the forked banks")
+        clone = copy.copy(scrubber)
+        clone.bank = remap[id(scrubber.bank)]
+        forked.scrubbers.append(clone)
+    return forked, clones
@@ -1,5 +1,7 @@
 from array import array
 
+import numpy as np
+
 _HAS_BIT_COUNT = hasattr(int, "bit_count")
 
 class EDAC:
@@ -13,6 +15,15 @@ class EDAC:
     _DECODE_TABLE = []
     _DECODE_DATA_TABLE = None # Will be array('B')
 
+    # NumPy copies of the tables for whole-block gathers
+    _ENCODE_ARRAY = None
+    _DECODE_DATA_ARRAY = None
+    _DECODE_STATUS_ARRAY = None
+
+    # Codeword width; stored words are masked to CODE_MASK before lookup
+    CODE_BITS = 12
+    CODE_MASK = 0xFFF
+
     # Status codes
     STATUS_OK = 0
     STATUS_CORRECTED = 1
@@ -130,13 +141,14 @@ class EDAC:
         # Encode table (0-255)
         cls._ENCODE_TABLE = [cls._compute_encode(i) for i in range(256)]
 
-        # Decode table (0-4095)
-        cls._DECODE_TABLE = [None] * 4096
+        # Decode table (0-4095 for the 12-bit code)
+        size = 1 << cls.CODE_BITS
+        cls._DECODE_TABLE = [None] * size
 
         # Optimized Decode Data Table (no status codes, byte array)
-        cls._DECODE_DATA_TABLE = array('B', [0] * 4096)
+        cls._DECODE_DATA_TABLE = array('B', [0] * size)
 
-        for i in range(4096):
+        for i in range(size):
             # Optimization: Compute decode once and populate both tables
             # This avoids redundant computation and list resizing overhead
             res = cls._compute_decode(i)
@@ -149,6 +161,12 @@ class EDAC:
         cls._DECODE_TABLE = tuple(cls._DECODE_TABLE)
         cls._DECODE_DATA_TABLE = bytes(cls._DECODE_DATA_TABLE)
 
+        # Optimization: Block operations gather through these arrays with one
+        # fancy index per block instead of one table lookup per Python call.
+        cls._ENCODE_ARRAY = np.array(cls._ENCODE_TABLE, dtype=np.uint16)
+        cls._DECODE_DATA_ARRAY = np.frombuffer(cls._DECODE_DATA_TABLE, dtype=np.uint8)
+        cls._DECODE_STATUS_ARRAY = np.array([status for _, status in cls._DECODE_TABLE], dtype=np.uint8)
+
     @staticmethod
     def encode(byte_val):
         """Encodes an 8-bit byte into a 12-bit Hamming code using lookup table."""
@@ -184,5 +202,496 @@ class EDAC:
         val, status_code = EDAC.decode_fast(encoded_val)
         return val, EDAC.STATUS_MAP[status_code]
 
+    @classmethod
+    def encode_batch(cls, data):
+        """Encodes an array of bytes into an array of codewords."""
+        return cls._ENCODE_ARRAY[np.asarray(data) & 0xFF]
+
+    @classmethod
+    def decode_batch(cls, codes):
+        """Decodes an array of codewords. Returns (uint8 data, uint8 status codes)."""
+        masked = np.asarray(codes) & cls.CODE_MASK
+        return cls._DECODE_DATA_ARRAY[masked], cls._DECODE_STATUS_ARRAY[masked]
+
+    @classmethod
+    def status_batch(cls, codes):
+        """Status codes of an array of codewords, without correcting the data."""
+        return cls._DECODE_STATUS_ARRAY[np.asarray(codes) & cls.CODE_MASK]
+
 # Initialize tables on module import
 EDAC._init_tables()
+
+
+class SECDED(EDAC):
+    """
+    Extended Hamming (13,8) code: the 12-bit EDAC codeword plus an overall
+    parity bit (bit 12). Corrects single-bit errors and detects, rather than
+    miscorrects, double-bit errors. Uses the same precomputed tables, so
+    encode and decode stay single lookups.
+    """
+
+    _ENCODE_TABLE = []
+    _DECODE_TABLE = []
+    _DECODE_DATA_TABLE = None
+
+    CODE_BITS = 13
+    CODE_MASK = 0x1FFF
+
+    STATUS_DOUBLE_ERROR = 2
+
+    STATUS_MAP = {
+        EDAC.STATUS_OK: "OK",
+        EDAC.STATUS_CORRECTED: "CORRECTED_SINGLE_BIT_ERROR",
+        STATUS_DOUBLE_ERROR: "DOUBLE_ERROR_DETECTED"
+    }
+
+    @staticmethod
+    def _compute_encode(byte_val):
+        """Encodes an 8-bit byte into a 13-bit SECDED code using bitwise operations."""
+        hamming = EDAC._compute_encode(byte_val)
+        return hamming | ((EDAC._bit_count(hamming) & 1) << 12)
+
+    @staticmethod
+    def _compute_decode(encoded_val):
+        """
+        Decodes a 13-bit SECDED code using bitwise operations.
+        Returns (decoded_byte, status_code).
+        Status code: 0 (OK), 1 (CORRECTED), 2 (DOUBLE_ERROR)
+        """
+        hamming = encoded_val & 0xFFF
+        data, inner_status = EDAC._compute_decode(hamming)
+        overall = EDAC._bit_count(encoded_val) & 1
+
+        if overall:
+            # Odd number of flips: a single error in the Hamming bits (already
+            # corrected above) or in the overall parity bit, which leaves the
+            # data intact.
+            return data, SECDED.STATUS_CORRECTED
+        if inner_status == EDAC.STATUS_OK:
+            return data, SECDED.STATUS_OK
+
+        # Even number of flips with a non-zero syndrome: uncorrectable.
+        # Return the data bits as stored instead of a miscorrected byte.
+        d = ((hamming >> 2) & 1) | ((hamming >> 3) & 0x0E) | ((hamming >> 4) & 0xF0)
+        return d, SECDED.STATUS_DOUBLE_ERROR
+
+    @staticmethod
+    def encode(byte_val):
+        """Encodes an 8-bit byte into a 13-bit SECDED code using lookup table."""
+        return SECDED._ENCODE_TABLE[byte_val & 0xFF]
+
+    @staticmethod
+    def decode_fast(encoded_val):
+        """
+        Decodes a 13-bit SECDED code using lookup table.
+        Returns (decoded_byte, status_code_int).
+        """
+        return SECDED._DECODE_TABLE[encoded_val & 0x1FFF]
+
+    @staticmethod
+    def decode_data_only(encoded_val):
+        """
+        Decodes a 13-bit SECDED code using optimized bytes lookup.
+        Returns only the decoded byte.
+        """
+        return SECDED._DECODE_DATA_TABLE[encoded_val & 0x1FFF]
+
+    @staticmethod
+    def decode(encoded_val):
+        """
+        Decodes a 13-bit SECDED code using lookup table.
+        Returns (decoded_byte, status_string).
+        """
+        val, status_code = SECDED._DECODE_TABLE[encoded_val & 0x1FFF]
+        return val, SECDED.STATUS_MAP[status_code]
+
+SECDED._init_tables()
+
+
+class SECDED32:
+    """
+    Hamming (39,32) SECDED code for 32-bit words.
+
+    Codewords keep the data word in bits 0-31 and seven check bits in bits
+    32-38: six Hamming parity bits and an overall parity bit. Parity and
+    syndrome come from XOR-ing four per-byte lookup tables (one per data
+    byte) instead of looping over bits; a 128-entry table then maps the
+    syndrome to the data correction mask and status. The same tables drive
+    the scalar and the NumPy batch paths.
+    """
+
+    CODE_BITS = 39
+    CODE_MASK = (1 << 39) - 1
+
+    STATUS_OK = 0
+    STATUS_CORRECTED = 1
+    STATUS_DOUBLE_ERROR = 2
+
+    STATUS_MAP = {
+        STATUS_OK: "OK",
+        STATUS_CORRECTED: "CORRECTED_SINGLE_BIT_ERROR",
+        STATUS_DOUBLE_ERROR: "DOUBLE_ERROR_DETECTED"
+    }
+
+    # Per-byte check contributions: bits 0-5 Hamming parity, bit 6 data parity
+    _CHECK_TABLES = ()
+    # Partial check bits -> stored check bits (adds the overall parity bit)
+    _CHECK_FINAL = ()
+    # Stored check bits -> value that XORs with the partial check bits into
+    # the syndrome (bits 0-5) and the overall parity of the word (bit 6)
+    _STORED_FOLD = ()
+    # Syndrome -> (data correction mask, status code)
+    _FIX_TABLE = ()
+
+    # NumPy copies for the batch methods
+    _CHECK_ARRAY = None
+    _CHECK_FINAL_ARRAY = None
+    _STORED_FOLD_ARRAY = None
+    _FIX_MASK_ARRAY = None
+    _FIX_STATUS_ARRAY = None
+
+    @classmethod
+    def _init_tables(cls):
+        """Populates the lookup tables."""
+        parity = EDAC._bit_count
+        # Hamming positions of the data bits: 3, 5, 6, 7, 9, ... 38 (skipping powers of two)
+        positions = [p for p in range(3, 39) if p & (p - 1)]
+
+        tables = []
+        for k in range(4):
+            table = []
+            for b in range(256):
+                check = 0
+                for i in range(8):
+                    if b >> i & 1:
+                        check ^= positions[8 * k + i]
+                table.append(check | ((parity(b) & 1) << 6))
+            tables.append(tuple(table))
+        cls._CHECK_TABLES = tuple(tables)
+
+        cls._CHECK_FINAL = tuple((c & 0x3F) | (((parity(c & 0x3F) ^ (c >> 6)) & 1) << 6) for c in range(128))
+        cls._STORED_FOLD = tuple((s & 0x3F) | ((parity(s) & 1) << 6) for s in range(128))
+
+        data_bit = {p: i for i, p in enumerate(positions)}
+        fix = []
+        for key in range(128):
+            syndrome = key & 0x3F
+            if not key >> 6:
+                # Even overall parity: clean word or an (uncorrectable) double error
+                fix.append((0, cls.STATUS_OK if syndrome == 0 else cls.STATUS_DOUBLE_ERROR))
+            elif syndrome in data_bit:
+                fix.append((1 << data_bit[syndrome], cls.STATUS_CORRECTED))
+            elif syndrome & (syndrome - 1) == 0:
+                # Error in a check bit (or the overall parity bit when 0): data intact
+                fix.append((0, cls.STATUS_CORRECTED))
+            else:
+                # Odd parity with an unused syndrome: three or more flips
+                fix.append((0, cls.STATUS_DOUBLE_ERROR))
+        cls._FIX_TABLE = tuple(fix)
+
+        cls._CHECK_ARRAY = np.array(cls._CHECK_TABLES, dtype=np.uint8)
+        cls._CHECK_FINAL_ARRAY = np.array(cls._CHECK_FINAL, dtype=np.uint64)
+        cls._STORED_FOLD_ARRAY = np.array(cls._STORED_FOLD, dtype=np.uint8)
+        cls._FIX_MASK_ARRAY = np.array([mask for mask, _ in fix], dtype=np.uint32)
+        cls._FIX_STATUS_ARRAY = np.array([status for _, status in fix], dtype=np.uint8)
+
+    @staticmethod
+    def _check(data):
+        t0, t1, t2, t3 = SECDED32._CHECK_TABLES
+        return t0[data & 0xFF] ^ t1[(data >> 8) & 0xFF] ^ t2[(data >> 16) & 0xFF] ^ t3[(data >> 24) & 0xFF]
+
+    @staticmethod
+    def encode(word):
+        """Encodes a 32-bit word into a 39-bit SECDED codeword."""
+        word &= 0xFFFFFFFF
+        return word | (SECDED32._CHECK_FINAL[SECDED32._check(word)] << 32)
+
+    @staticmethod
+    def decode_fast(code):
+        """
+        Decodes a 39-bit SECDED codeword.
+        Returns (decoded_word, status_code_int).
+        """
+        data = code & 0xFFFFFFFF
+        key = SECDED32._check(data) ^ SECDED32._STORED_FOLD[(code >> 32) & 0x7F]
+        mask, status = SECDED32._FIX_TABLE[key]
+        return data ^ mask, status
+
+    @staticmethod
+    def decode_data_only(code):
+        """Decodes a 39-bit SECDED codeword and returns only the data word."""
+        data = code & 0xFFFFFFFF
+        key = SECDED32._check(data) ^ SECDED32._STORED_FOLD[(code >> 32) & 0x7F]
+        return data ^ SECDED32._FIX_TABLE[key][0]
+
+    @staticmethod
+    def decode(code):
+        """
+        Decodes a 39-bit SECDED codeword.
+        Returns (decoded_word, status_string).
+        """
+        data, status_code = SECDED32.decode_fast(code)
+        return data, SECDED32.STATUS_MAP[status_code]
+
+    @staticmethod
+    def _check_batch(data):
+        t = SECDED32._CHECK_ARRAY
+        return t[0][data & 0xFF] ^ t[1][(data >> 8) & 0xFF] ^ t[2][(data >> 16) & 0xFF] ^ t[3][data >> 24]
+
+    @staticmethod
+    def encode_batch(words):
+        """Encodes an array of 32-bit words into a uint64 array of codewords."""
+        data = np.asarray(words).astype(np.uint32)
+        check = SECDED32._CHECK_FINAL_ARRAY[SECDED32._check_batch(data)]
+        return data.astype(np.uint64) | (check << np.uint64(32))
+
+    @staticmethod
+    def _syndrome_batch(codes):
+        codes = np.asarray(codes, dtype=np.uint64)
+        data = codes.astype(np.uint32)
+        stored = (codes >> np.uint64(32)).astype(np.uint8) & 0x7F
+        return data, SECDED32._check_batch(data) ^ SECDED32._STORED_FOLD_ARRAY[stored]
+
+    @staticmethod
+    def decode_batch(codes):
+        """Decodes an array of codewords. Returns (uint32 data, uint8 status codes)."""
+        data, key = SECDED32._syndrome_batch(codes)
+        return data ^ SECDED32._FIX_MASK_ARRAY[key], SECDED32._FIX_STATUS_ARRAY[key]
+
+    @staticmethod
+    def status_batch(codes):
+        """Status codes of an array of codewords, without correcting the data."""
+        return SECDED32._FIX_STATUS_ARRAY[SECDED32._syndrome_batch(codes)[1]]
+
+SECDED32._init_tables()
+
+
+class ReedSolomon:
+    """
+    Reed-Solomon RS(255,223) codec with the CCSDS parameters: GF(256) with
+    field polynomial 0x187, generator roots alpha^(11 * (112 + j)) for
+    j = 0..31, corrects up to 16 symbol errors per codeword. Symbols use the
+    conventional polynomial basis (no dual-basis transform).
+
+    Codeblocks interleave 'interleave' codewords symbol by symbol, so a
+    block of interleave * 223 data bytes (e.g. a 1115-byte transfer frame
+    with interleave=5) becomes interleave * 255 bytes. Parity and
+    syndromes are linear in the symbols, so both are computed for whole
+    batches by XOR-reducing precomputed per-position tables; only
+    codewords with a non-zero syndrome go through Berlekamp-Massey, Chien
+    search and Forney.
+    """
+
+    N = 255
+    K = 223
+    PARITY = 32
+    FIELD_POLY = 0x187
+    FIRST_ROOT = 112
+    ROOT_STEP = 11
+
+    # GF(256) antilog (doubled to skip a modulo) and log tables
+    _EXP = ()
+    _LOG = ()
+    _GENERATOR = ()
+
+    # Per-position tables as uint64 lanes: data byte value -> 32 parity
+    # bytes, codeword byte value -> 32 syndrome bytes
+    _PARITY_TABLE = None
+    _SYNDROME_TABLE = None
+    # Codewords per NumPy gather; bounds the temporaries
+    _BATCH = 1024
+
+    @classmethod
+    def _init_tables(cls):
+        """Populates the lookup tables."""
+        exp = [0] * 510
+        log = [0] * 256
+        x = 1
+        for i in range(255):
+            exp[i] = exp[i + 255] = x
+            log[x] = i
+            x <<= 1
+            if x & 0x100:
+                x ^= cls.FIELD_POLY
+        cls._EXP = tuple(exp)
+        cls._LOG = tuple(log)
+
+        exp_array = np.array(exp, dtype=np.uint8)
+        log_array = np.array(log, dtype=np.int64)
+        # Full multiplication table (64 KB) for building the slice tables
+        mul = exp_array[(log_array[:, None] + log_array[None, :]) % 255]
+        mul[0, :] = 0
+        mul[:, 0] = 0
+
+        # g(x) = prod (x + beta_j), highest degree first
+        generator = [1]
+        for j in range(cls.PARITY):
+            root = exp[(cls.ROOT_STEP * (cls.FIRST_ROOT + j)) % 255]
+            shifted = generator + [0]
+            for i, coef in enumerate(generator):
+                shifted[i + 1] ^= int(mul[coef, root])
+            generator = shifted
+        cls._GENERATOR = tuple(generator)
+
+        # Remainders x^d mod g(x) for d = 32..254; data byte i has degree 254 - i.
+        low = np.array(generator[1:], dtype=np.uint8)
+        remainders = np.zeros((cls.N, cls.PARITY), dtype=np.uint8)
+        r = low.copy()
+        for d in range(cls.PARITY, cls.N):
+            remainders[d] = r
+            top = r[0]
+            r = np.append(r[1:], np.uint8(0)) ^ mul[top, low]
+        degrees = cls.N - 1 - np.arange(cls.K)
+        values = np.arange(256)[None, :, None]
+        cls._PARITY_TABLE = np.ascontiguousarray(mul[values, remainders[degrees][:, None, :]]).view(np.uint64)
+
+        # beta_j ^ (254 - i) for every codeword position i and root j
+        powers = (cls.ROOT_STEP * (cls.FIRST_ROOT + np.arange(cls.PARITY))[None, :]
+                  * (cls.N - 1 - np.arange(cls.N))[:, None]) % 255
+        cls._SYNDROME_TABLE = np.ascontiguousarray(mul[values, exp_array[powers][:, None, :]]).view(np.uint64)
+
+    def __init__(self, interleave=1):
+        if interleave < 1:
+            raise ValueError("Interleave depth must be at least 1")
+        self.interleave = interleave
+
+    @staticmethod
+    def _xor_slices(table, symbols):
+        """XOR of table[i, symbols[:, i]] over positions i, as (B, 32) bytes."""
+        out = np.empty((len(symbols), 4), dtype=np.uint64)
+        positions = np.arange(symbols.shape[1])
+        for start in range(0, len(symbols), ReedSolomon._BATCH):
+            chunk = symbols[start:start + ReedSolomon._BATCH]
+            out[start:start + len(chunk)] = np.bitwise_xor.reduce(table[positions, chunk], axis=1)
+        return out.view(np.uint8)
+
+    @staticmethod
+    def encode_batch(data):
+        """Encodes a (B, 223) uint8 array into a (B, 255) array of codewords."""
+        data = np.asarray(data, dtype=np.uint8).reshape(-1, ReedSolomon.K)
+        return np.hstack((data, ReedSolomon._xor_slices(ReedSolomon._PARITY_TABLE, data)))
+
+    @staticmethod
+    def syndromes_batch(codewords):
+        """(B, 32) syndromes of a (B, 255) codeword array; all zero for valid codewords."""
+        codewords = np.asarray(codewords, dtype=np.uint8).reshape(-1, ReedSolomon.N)
+        return ReedSolomon._xor_slices(ReedSolomon._SYNDROME_TABLE, codewords)
+
+    @staticmethod
+    def decode_batch(codewords):
+        """
+        Corrects a (B, 255) codeword array. Returns (data, errors): the
+        (B, 223) data and, per codeword, the number of symbols corrected or
+        -1 if it was uncorrectable (its data is returned as received).
+        """
+        codewords = np.array(codewords, dtype=np.uint8).reshape(-1, ReedSolomon.N)
+        syndromes = ReedSolomon.syndromes_batch(codewords)
+        errors = np.zeros(len(codewords), dtype=np.int16)
+        for row in np.flatnonzero(syndromes.any(axis=1)).tolist():
+            fixes = ReedSolomon._correct(syndromes[row].tolist())
+            if fixes is None:
+                errors[row] = -1
+                continue
+            candidate = codewords[row].copy()
+            for position, magnitude in fixes:
+                candidate[position] ^= magnitude
+            if ReedSolomon.syndromes_batch(candidate).any():
+                errors[row] = -1
+                continue
+            codewords[row] = candidate
+            errors[row] = len(fixes)
+        return codewords[:, :ReedSolomon.K], errors
+
+    @staticmethod
+    def _correct(s):
+        """Berlekamp-Massey, Chien search and Forney; returns [(position, magnitude)] or None."""
+        exp = ReedSolomon._EXP
+        log = ReedSolomon._LOG
+
+        def mul(a, b):
+            return exp[log[a] + log[b]] if a and b else 0
+
+        # Error locator Lambda(x), lowest degree first
+        lam = [1] + [0] * ReedSolomon.PARITY
+        prev = [1] + [0] * ReedSolomon.PARITY
+        length, shift, prev_disc = 0, 1, 1
+        for n in range(ReedSolomon.PARITY):
+            disc = s[n]
+            for i in range(1, length + 1):
+                disc ^= mul(lam[i], s[n - i])
+            if disc == 0:
+                shift += 1
+                continue
+            coef = exp[log[disc] - log[prev_disc] + 255]
+            updated = lam[:]
+            for i in range(shift, ReedSolomon.PARITY + 1):
+                updated[i] ^= mul(coef, prev[i - shift])
+            if 2 * length <= n:
+                prev, prev_disc, length, shift = lam, disc, n + 1 - length, 1
+            else:
+                shift += 1
+            lam = updated
+        lam = lam[:length + 1]
+        if length == 0 or length > ReedSolomon.PARITY // 2:
+            return None
+
+        # Chien search: Lambda(X^-1) == 0 with X = alpha^(11 * p) for every degree p
+        coefs = np.array(lam, dtype=np.int64)
+        inverse = (-ReedSolomon.ROOT_STEP * np.arange(ReedSolomon.N)) % 255
+        terms = np.array(exp, dtype=np.uint8)[(np.array(log)[coefs][:, None] + np.arange(length + 1)[:, None] * inverse[None, :]) % 255]
+        terms[coefs == 0] = 0
+        roots = np.flatnonzero(np.bitwise_xor.reduce(terms, axis=0) == 0).tolist()
+        if len(roots) != length:
+            return None
+
+        # Error evaluator Omega(x) = S(x) Lambda(x) mod x^32
+        omega = [0] * ReedSolomon.PARITY
+        for i, a in enumerate(s):
+            if a:
+                for k in range(min(length + 1, ReedSolomon.PARITY - i)):
+                    omega[i + k] ^= mul(a, lam[k])
+
+        fixes = []
+        for p in roots:
+            x_inv = int(inverse[p])
+            num = 0
+            for k, coef in enumerate(omega):
+                if coef:
+                    num ^= exp[(log[coef] + k * x_inv) % 255]
+            den = 0
+            for k in range(1, length + 1, 2):
+                if lam[k]:
+                    den ^= exp[(log[lam[k]] + (k - 1) * x_inv) % 255]
+            if den == 0:
+                return None
+            # e = X^(1 - FIRST_ROOT) * Omega(X^-1) / Lambda'(X^-1)
+            x_log = (ReedSolomon.ROOT_STEP * p) % 255
+            magnitude = exp[(x_log * (1 - ReedSolomon.FIRST_ROOT) + log[num] - log[den]) % 255] if num else 0
+            fixes.append((ReedSolomon.N - 1 - p, magnitude))
+        return fixes
+
+    def encode(self, data):
+        """Encodes a bytes-like object of a multiple of interleave * 223 bytes into interleaved codeblocks."""
+        depth = self.interleave
+        data = np.frombuffer(data, dtype=np.uint8)
+        if len(data) % (self.K * depth):
+            raise ValueError(f"Data length must be a multiple of {self.K * depth} bytes")
+        words = data.reshape(-1, self.K, depth).transpose(0, 2, 1).reshape(-1, self.K)
+        codewords = self.encode_batch(words)
+        return codewords.reshape(-1, depth, self.N).transpose(0, 2, 1).tobytes()
+
+    def decode(self, codeblocks):
+        """
+        Decodes interleaved codeblocks. Returns (data, corrected, failed):
+        the data bytes, symbols corrected and uncorrectable codewords.
+        """
+        depth = self.interleave
+        blocks = np.frombuffer(codeblocks, dtype=np.uint8)
+        if len(blocks) % (self.N * depth):
+            raise ValueError(f"Codeblock length must be a multiple of {self.N * depth} bytes")
+        words = blocks.reshape(-1, self.N, depth).transpose(0, 2, 1).reshape(-1, self.N)
+        data, errors = self.decode_batch(words)
+        data = data.reshape(-1, depth, self.K).transpose(0, 2, 1).tobytes()
+        return data, int(errors[errors > 0].sum()), int(np.count_nonzero(errors < 0))
+
+ReedSolomon._init_tables()
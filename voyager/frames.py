@@ -0,0 +1,212 @@
+import struct
+from binascii import crc_hqx
+
+from .ccsds import TelemetryPacket, PacketDeframer
+
+# TM Transfer Frame primary header: frame identification, master channel
+# frame count, virtual channel frame count, frame data field status.
+_FRAME_HEADER_STRUCT = struct.Struct('>HBBH')
+_CRC_STRUCT = struct.Struct('>H')
+_unpack_frame_header = _FRAME_HEADER_STRUCT.unpack_from
+
+# First Header Pointer special values
+FHP_NO_PACKET_START = 0x7FF
+FHP_IDLE = 0x7FE
+
+# Data field status with segment length ID '11' (no secondary header,
+# synchronous flag 0, packet order flag 0).
+_STATUS_BASE = 0x1800
+
+IDLE_APID = 0x7FF
+_IDLE_HEADER_STRUCT = struct.Struct('>HHH')
+_MIN_IDLE_PACKET = 7 # Primary header (6) + at least one data octet
+# First Header Pointers up to 0x7FD are offsets, so the data field may hold
+# at most 0x7FE octets.
+MAX_DATA_FIELD_LENGTH = FHP_IDLE
+
+
+def _check_frame_length(frame_length, fecf):
+    data_length = frame_length - 6 - (2 if fecf else 0)
+    if data_length < _MIN_IDLE_PACKET:
+        raise ValueError("Frame length too small for a header and an idle packet")
+    if data_length > MAX_DATA_FIELD_LENGTH:
+        raise ValueError(f"Frame data field longer than {MAX_DATA_FIELD_LENGTH} octets; "
+                         "First Header Pointers would collide with the idle codes")
+
+
+class _VirtualChannel:
+    """Per-VC multiplexer state: a preallocated frame being filled in place."""
+    __slots__ = ("frame", "pos", "fhp", "count")
+
+    def __init__(self, frame_length):
+        self.frame = bytearray(frame_length)
+        self.pos = 6
+        self.fhp = FHP_NO_PACKET_START
+        self.count = 0
+
+
+class FrameMultiplexer:
+    """
+    Multiplexes Space Packets into fixed-length TM Transfer Frames on up to
+    eight virtual channels.
+
+    Each virtual channel fills one preallocated frame buffer in place; packets
+    that do not fit spill into the next frame of the same channel, and the
+    First Header Pointer records where the first new packet starts. push()
+    and flush() return the frames they complete, each as an immutable bytes
+    snapshot of the channel buffer.
+    """
+
+    def __init__(self, spacecraft_id, frame_length=1115, fecf=True):
+        _check_frame_length(frame_length, fecf)
+        self.spacecraft_id = spacecraft_id & 0x3FF
+        self.frame_length = frame_length
+        self.fecf = fecf
+        self.data_end = frame_length - 2 if fecf else frame_length
+        self.master_count = 0
+        self._channels = [None] * 8
+
+    def _channel(self, vcid):
+        vc = self._channels[vcid]
+        if vc is None:
+            vc = self._channels[vcid] = _VirtualChannel(self.frame_length)
+        return vc
+
+    def _emit(self, vcid, vc):
+        frame = vc.frame
+        _FRAME_HEADER_STRUCT.pack_into(
+            frame, 0,
+            (self.spacecraft_id << 4) | (vcid << 1),
+            self.master_count,
+            vc.count,
+            _STATUS_BASE | vc.fhp
+        )
+        if self.fecf:
+            _CRC_STRUCT.pack_into(frame, self.data_end, crc_hqx(memoryview(frame)[:self.data_end], 0xFFFF))
+
+        self.master_count = (self.master_count + 1) & 0xFF
+        vc.count = (vc.count + 1) & 0xFF
+        vc.pos = 6
+        vc.fhp = FHP_NO_PACKET_START
+        return bytes(frame)
+
+    def push(self, vcid, packet):
+        """
+        Appends one packet (bytes-like or TelemetryPacket) to virtual channel
+        'vcid' and returns the list of frames it completed (often empty).
+        """
+        if isinstance(packet, TelemetryPacket):
+            packet = packet.to_bytes()
+        vc = self._channels[vcid] or self._channel(vcid)
+        data_end = self.data_end
+        frame = vc.frame
+        pos = vc.pos
+
+        if vc.fhp == FHP_NO_PACKET_START:
+            vc.fhp = pos - 6
+
+        n = len(packet)
+        # Optimization: Fast path for the common case of a packet that fits
+        # in the current frame; no memoryview or list is created.
+        if pos + n < data_end:
+            frame[pos:pos + n] = packet
+            vc.pos = pos + n
+            return ()
+
+        frames = []
+        src = memoryview(packet)
+        start = 0
+        while start < n:
+            take = min(n - start, data_end - pos)
+            frame[pos:pos + take] = src[start:start + take]
+            start += take
+            pos += take
+            if pos == data_end:
+                frames.append(self._emit(vcid, vc))
+                pos = 6
+        vc.pos = pos
+        return frames
+
+    def flush(self, vcid):
+        """
+        Completes the partially filled frame of 'vcid' with an idle packet.
+        If the gap is smaller than an idle packet, the idle packet spills into
+        a further frame, which is completed as well.
+        """
+        vc = self._channels[vcid]
+        frames = []
+        while vc is not None and vc.pos != 6:
+            room = self.data_end - vc.pos
+            size = max(room, _MIN_IDLE_PACKET)
+            idle = bytearray(size)
+            _IDLE_HEADER_STRUCT.pack_into(idle, 0, IDLE_APID, 0xC000, size - 7)
+            frames.extend(self.push(vcid, idle))
+        return frames
+
+    def idle_frame(self, vcid=7):
+        """Returns an OID frame (First Header Pointer 0x7FE) filled with idle data."""
+        vc = self._channel(vcid)
+        if vc.pos != 6:
+            raise ValueError("Virtual channel has a partially filled frame; flush it first")
+        frame = vc.frame
+        frame[6:self.data_end] = bytes(self.data_end - 6)
+        vc.fhp = FHP_IDLE
+        return self._emit(vcid, vc)
+
+
+class FrameDemultiplexer:
+    """
+    Extracts Space Packets from TM Transfer Frames.
+
+    The data fields of each virtual channel form a packet stream that is fed
+    to a per-channel PacketDeframer, so packets spanning frames are
+    reassembled and packets wholly inside a frame are returned as zero-copy
+    views of it. A frame CRC failure or a virtual channel frame count gap
+    discards the channel's partial packet and resynchronises on the next
+    First Header Pointer. Idle packets and idle frames are dropped.
+    """
+
+    def __init__(self, frame_length=1115, fecf=True, check_crc=True):
+        _check_frame_length(frame_length, fecf)
+        self.frame_length = frame_length
+        self.fecf = fecf
+        self.check_crc = check_crc
+        self.data_end = frame_length - 2 if fecf else frame_length
+        self.bad_frames = 0
+        self.lost_frames = 0
+        self._deframers = [None] * 8
+        self._expected = [None] * 8
+
+    def feed(self, frame):
+        """Yields (vcid, PacketView) for every packet completed by this frame."""
+        if len(frame) != self.frame_length:
+            raise ValueError(f"Expected a {self.frame_length} byte frame, got {len(frame)}")
+        if self.fecf and crc_hqx(frame, 0xFFFF):
+            self.bad_frames += 1
+            return
+
+        word0, _, vc_count, status = _unpack_frame_header(frame)
+        vcid = (word0 >> 1) & 7
+        fhp = status & 0x7FF
+
+        expected = self._expected[vcid]
+        self._expected[vcid] = (vc_count + 1) & 0xFF
+        deframer = self._deframers[vcid]
+        if expected is not None and vc_count != expected:
+            self.lost_frames += (vc_count - expected) & 0xFF
+            # The partial packet is lost too, even if an idle frame follows.
+            deframer = self._deframers[vcid] = None
+        if fhp == FHP_IDLE:
+            return
+
+        data = memoryview(frame)[6:self.data_end]
+        if deframer is None:
+            # Out of sync: skip the tail of a packet whose start was lost.
+            if fhp == FHP_NO_PACKET_START:
+                return
+            data = data[fhp:]
+            deframer = self._deframers[vcid] = PacketDeframer(check_crc=self.check_crc)
+
+        for view in deframer.feed(data):
+            if view.apid != IDLE_APID:
+                yield vcid, view
@@ -1,12 +1,150 @@
+import os
+import time
 from array import array
-from .fdir import EDAC
+
+import numpy as np
+
+from .fdir import EDAC, SECDED32
+
+
+def _scrub_words(words, edac, stats=None, base=0):
+    """
+    Corrects a NumPy view of protected words in place. Returns (corrected,
+    uncorrectable); uncorrectable words are left as they are. Bad words are
+    recorded in 'stats' (an EDACStats) if given, 'base' being the bank
+    address of words[0].
+    """
+    # Optimization: Locate bad words with one vectorized syndrome check and
+    # decode/re-encode only those; clean chunks cost one pass.
+    status = edac.status_batch(words)
+    bad = np.flatnonzero(status)
+    if not len(bad):
+        return 0, 0
+    fixable = bad[status[bad] == edac.STATUS_CORRECTED]
+    words[fixable] = edac.encode_batch(edac.decode_batch(words[fixable])[0])
+    if stats is not None:
+        stats.record_batch(base + bad, status[bad], status[bad] == edac.STATUS_CORRECTED)
+    return len(fixable), len(bad) - len(fixable)
+
+
+def _block_data(buffer, dtype):
+    """
+    Converts a write_block() argument to a NumPy array of 'dtype' words.
+    bytes, bytearray and memoryview objects are raw little-endian words;
+    anything else is a sequence or array of ints, masked to the word width.
+    """
+    dtype = np.dtype(dtype)
+    if isinstance(buffer, (bytes, bytearray, memoryview)):
+        return np.frombuffer(buffer, dtype=dtype)
+    data = np.asarray(buffer)
+    if data.dtype == dtype:
+        return data
+    return (data.astype(np.int64) & ((1 << (dtype.itemsize * 8)) - 1)).astype(dtype)
+
+
+class EDACStats:
+    """
+    Error counters of one protected bank.
+
+    Keeps totals of corrected and uncorrectable words and of scrub
+    write-backs, a histogram of errors per page of page_words words, and a
+    ring buffer of the last 'recent' errors (address, status code,
+    wall-clock time). All storage is preallocated NumPy arrays, so recording
+    never allocates. Created by MemoryBank.enable_stats().
+    """
+
+    def __init__(self, size, page_words=4096, recent=256, status_map=None):
+        if page_words < 1 or recent < 1:
+            raise ValueError("page_words and recent must be positive")
+        self.page_words = page_words
+        self.status_map = status_map or EDAC.STATUS_MAP
+        self.corrected = 0
+        self.uncorrectable = 0
+        self.scrub_writebacks = 0
+        self.page_errors = np.zeros(-(-size // page_words), dtype=np.int64)
+        self._recent_addrs = np.zeros(recent, dtype=np.int64)
+        self._recent_status = np.zeros(recent, dtype=np.uint8)
+        self._recent_times = np.zeros(recent, dtype=np.float64)
+        # Errors recorded so far; the next ring slot is this modulo 'recent'
+        self._recorded = 0
+
+    def record(self, addr, status, written_back=False):
+        """Records one bad word (status is the codec's non-OK status code)."""
+        if status == EDAC.STATUS_CORRECTED:
+            self.corrected += 1
+        else:
+            self.uncorrectable += 1
+        if written_back:
+            self.scrub_writebacks += 1
+        self.page_errors[addr // self.page_words] += 1
+        slot = self._recorded % len(self._recent_addrs)
+        self._recent_addrs[slot] = addr
+        self._recent_status[slot] = status
+        self._recent_times[slot] = time.time()
+        self._recorded += 1
+
+    def record_batch(self, addrs, statuses, written_back=False):
+        """Vectorized record(); 'written_back' may be a bool or a mask per word."""
+        n = len(addrs)
+        if not n:
+            return
+        corrected = int(np.count_nonzero(statuses == EDAC.STATUS_CORRECTED))
+        self.corrected += corrected
+        self.uncorrectable += n - corrected
+        self.scrub_writebacks += int(np.count_nonzero(np.broadcast_to(written_back, n)))
+        np.add.at(self.page_errors, addrs // self.page_words, 1)
+
+        # Only the newest 'recent' errors of the batch survive in the ring.
+        capacity = len(self._recent_addrs)
+        keep = min(n, capacity)
+        slots = (self._recorded + np.arange(n - keep, n)) % capacity
+        self._recent_addrs[slots] = addrs[n - keep:]
+        self._recent_status[slots] = statuses[n - keep:]
+        self._recent_times[slots] = time.time()
+        self._recorded += n
+
+    def recent(self):
+        """Returns the buffered errors, oldest first, as (addr, status, time) tuples."""
+        capacity = len(self._recent_addrs)
+        count = min(self._recorded, capacity)
+        order = (self._recorded - count + np.arange(count)) % capacity
+        return list(zip(self._recent_addrs[order].tolist(),
+                        self._recent_status[order].tolist(),
+                        self._recent_times[order].tolist()))
+
+    def to_dict(self):
+        """JSON-ready summary; the histogram lists only pages with errors as [page, count]."""
+        pages = np.flatnonzero(self.page_errors)
+        return {
+            "corrected": self.corrected,
+            "uncorrectable": self.uncorrectable,
+            "scrub_writebacks": self.scrub_writebacks,
+            "page_words": self.page_words,
+            "page_errors": np.stack([pages, self.page_errors[pages]], axis=1).tolist(),
+            "recent": [
+                {"addr": addr, "status": self.status_map[status], "time": t}
+                for addr, status, t in self.recent()
+            ]
+        }
+
 
 class MemoryBank:
-    def __init__(self, size=1024, protected=False):
+    # Words processed per NumPy call by scrub(); bounds temporaries on huge banks.
+    SCRUB_CHUNK = 1 << 22
+    # EDACStats while instrumentation is enabled
+    stats = None
+
+    def __init__(self, size=1024, protected=False, edac=EDAC):
         self.size = size
         self.protected = protected
+        # EDAC codec of protected banks: EDAC (SEC) or SECDED
+        self.edac = edac
+        # Optimization: Bind the codec's decode table and mask per bank so the
+        # read hot path is one bytes lookup with no function call.
+        self._decode_data = edac._DECODE_DATA_TABLE
+        self._code_mask = edac.CODE_MASK
         # Optimization: Use array for memory efficiency and faster access.
-        # 'H' is unsigned short (2 bytes), which fits 12-bit EDAC codes perfectly.
+        # 'H' is unsigned short (2 bytes), which fits 12-bit EDAC and 13-bit SECDED codes.
         # 'B' is unsigned char (1 byte), which is 2x more efficient for unprotected 8-bit memory.
         if self.protected:
             self.memory = array('H', [0]) * size
@@ -18,7 +156,7 @@ class MemoryBank:
             raise IndexError("Memory access out of bounds")
 
         if self.protected:
-            self.memory[addr] = EDAC.encode(data)
+            self.memory[addr] = self.edac.encode(data)
         else:
             self.memory[addr] = data & 0xFF
 
@@ -29,9 +167,9 @@ class MemoryBank:
         val = self.memory[addr]
         if self.protected:
             # On standard read, EDAC corrects on the fly but doesn't scrub (write back)
-            # Optimization: Use decode_data_only to avoid tuple creation and status lookup
-            # This is significantly faster for the hot path where status is ignored.
-            return EDAC.decode_data_only(val)
+            # Optimization: Index the decode data table directly (what decode_data_only
+            # does) to avoid tuple creation, status lookup and the call itself.
+            return self._decode_data[val & self._code_mask]
         else:
             return val
 
@@ -42,16 +180,19 @@ class MemoryBank:
         if addr < 0 or addr >= self.size:
             raise IndexError("Memory access out of bounds")
 
+        edac = self.edac
         val = self.memory[addr]
         # Optimization: Use decode_fast to avoid intermediate tuple creation and string comparison
-        decoded, status_code = EDAC.decode_fast(val)
+        decoded, status_code = edac.decode_fast(val)
 
-        if status_code == EDAC.STATUS_CORRECTED:
+        if status_code == edac.STATUS_CORRECTED:
             # Scrub: write back corrected value
             # We re-encode the corrected data to ensure parity bits are also correct
-            self.memory[addr] = EDAC.encode(decoded)
+            self.memory[addr] = edac.encode(decoded)
+        if status_code and self.stats is not None:
+            self.stats.record(addr, status_code, status_code == edac.STATUS_CORRECTED)
 
-        return decoded, EDAC.STATUS_MAP[status_code]
+        return decoded, edac.STATUS_MAP[status_code]
 
     def inject_seu(self, addr, bit):
         if addr < 0 or addr >= self.size:
@@ -68,3 +209,684 @@ class MemoryBank:
                 raise ValueError(f"Bit index {bit} out of range for 16-bit memory")
 
         self.memory[addr] ^= (1 << bit)
+
+    def inject_seus(self, addrs, bits):
+        """
+        Flips bit bits[i] of word addrs[i] for every i (vectorized). Repeated
+        addresses accumulate, so two hits on the same bit cancel out.
+        """
+        addrs = np.asarray(addrs, dtype=np.int64)
+        bits = np.asarray(bits, dtype=np.int64)
+        if len(addrs) and (addrs.min() < 0 or addrs.max() >= self.size):
+            raise IndexError("Memory access out of bounds")
+        words = self._words()
+        width = words.itemsize * 8
+        if len(bits) and (bits.min() < 0 or bits.max() >= width):
+            raise ValueError(f"Bit index out of range for {width}-bit memory")
+
+        masks = np.left_shift(1, bits).astype(words.dtype)
+        # ufunc.at is unbuffered, so duplicate addresses are applied in turn.
+        np.bitwise_xor.at(words, addrs, masks)
+
+    def _check_range(self, addr, length):
+        if addr < 0 or length < 0 or addr + length > self.size:
+            raise IndexError("Memory access out of bounds")
+
+    def _words(self):
+        """NumPy view sharing the bank's storage (no copy)."""
+        return np.frombuffer(self.memory, dtype=np.uint16 if self.protected else np.uint8)
+
+    def write_block(self, addr, buffer):
+        """
+        Writes bytes, a bytearray or a memoryview (or a sequence or array of
+        ints, masked to 8 bits) starting at addr. Bounds are checked once
+        for the whole block.
+        """
+        data = _block_data(buffer, np.uint8)
+        self._check_range(addr, len(data))
+
+        # Optimization: Encode the whole block with one gather on the EDAC
+        # table, writing straight into the bank's buffer through a NumPy
+        # view. Unprotected banks store raw bytes, so it is a plain copy.
+        if self.protected:
+            self._words()[addr:addr + len(data)] = self.edac._ENCODE_ARRAY[data]
+        else:
+            self._words()[addr:addr + len(data)] = data
+
+    def read_block(self, addr, length):
+        """Reads 'length' bytes starting at addr, correcting on the fly without scrubbing."""
+        self._check_range(addr, length)
+        words = self._words()[addr:addr + length]
+        if self.protected:
+            masked = words & self.edac.CODE_MASK
+            if self.stats is not None:
+                self._record_block(addr, self.edac._DECODE_STATUS_ARRAY[masked], False)
+            return self.edac._DECODE_DATA_ARRAY[masked].tobytes()
+        return words.tobytes()
+
+    def read_block_with_scrub(self, addr, length):
+        """
+        Reads 'length' bytes starting at addr and writes corrected codewords
+        back. Returns (data, corrected_count); uncorrectable words are
+        returned as stored and left in place.
+        """
+        self._check_range(addr, length)
+        if not self.protected:
+            return self.read_block(addr, length), 0
+
+        edac = self.edac
+        words = self._words()[addr:addr + length]
+        masked = words & edac.CODE_MASK
+        decoded = edac._DECODE_DATA_ARRAY[masked]
+        status = edac._DECODE_STATUS_ARRAY[masked]
+        corrected = np.flatnonzero(status == edac.STATUS_CORRECTED)
+        if len(corrected):
+            words[corrected] = edac._ENCODE_ARRAY[decoded[corrected]]
+        if self.stats is not None:
+            self._record_block(addr, status, True)
+        return decoded.tobytes(), len(corrected)
+
+    def scrub(self, addr=0, length=None):
+        """
+        Corrects every word in [addr, addr + length) in place, chunk by
+        chunk. Returns the number of words rewritten.
+        """
+        if length is None:
+            length = self.size - addr
+        self._check_range(addr, length)
+        if not self.protected:
+            return 0
+
+        corrected = 0
+        end = addr + length
+        for start in range(addr, end, self.SCRUB_CHUNK):
+            corrected += self._scrub_range(start, min(start + self.SCRUB_CHUNK, end))[0]
+        return corrected
+
+    def _scrub_range(self, start, end):
+        """Scrubs words [start, end); returns (corrected, uncorrectable)."""
+        return _scrub_words(self._words()[start:end], self.edac, self.stats, start)
+
+    @property
+    def word_bits(self):
+        """Width of the stored words in bits."""
+        return self._words().itemsize * 8
+
+    def copy(self):
+        """Returns an independent copy of the bank; statistics are not copied."""
+        # Only the storage and codec fields are copied, so nothing bound to
+        # this bank (such as an instrumented read) leaks into the clone.
+        clone = object.__new__(type(self))
+        clone.size = self.size
+        clone.protected = self.protected
+        clone.edac = self.edac
+        clone._decode_data = self._decode_data
+        clone._code_mask = self._code_mask
+        clone.memory = self._copy_memory()
+        return clone
+
+    def _copy_memory(self):
+        # Slicing an array copies it
+        return self.memory[:]
+
+    def enable_stats(self, page_words=4096, recent=256):
+        """
+        Starts recording EDAC errors in a fresh EDACStats (bank.stats), which
+        is returned. Errors are counted when a read, block read or scrub
+        decodes a bad word; corrected words written back count as scrub
+        write-backs.
+        """
+        if not self.protected:
+            raise ValueError("EDAC statistics require an EDAC protected bank")
+        self.stats = EDACStats(self.size, page_words, recent, self.edac.STATUS_MAP)
+        # Optimization: Shadow read() with the instrumented version on this
+        # instance only, so banks without statistics keep the plain table
+        # lookup and pay nothing for the feature.
+        self.read = self._read_instrumented
+        return self.stats
+
+    def disable_stats(self):
+        """Stops recording and drops the statistics."""
+        self.stats = None
+        self.__dict__.pop('read', None)
+
+    def _load(self, addr):
+        """Raw stored word at addr."""
+        return self.memory[addr]
+
+    def _read_instrumented(self, addr):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        decoded, status_code = self.edac.decode_fast(self._load(addr))
+        if status_code:
+            self.stats.record(addr, status_code)
+        return decoded
+
+    def _record_block(self, addr, status, written_back):
+        """Records the bad words of a block whose status array starts at addr."""
+        bad = np.flatnonzero(status)
+        if len(bad):
+            fixed = status[bad] == self.edac.STATUS_CORRECTED if written_back else False
+            self.stats.record_batch(addr + bad, status[bad], fixed)
+
+
+class MassMemoryBank(MemoryBank):
+    """
+    Solid State Recorder bank backed by a NumPy array.
+
+    Keeps the MemoryBank read/write/read_with_scrub/inject_seu semantics,
+    but storage is a single uint16 (protected) or uint8 ndarray, so whole
+    ranges are encoded, decoded, scrubbed and upset with fancy indexing on
+    the EDAC tables. np.zeros maps untouched pages lazily, so gigabyte banks
+    only cost memory for the regions actually written. Per-word access is
+    slower than the array-backed bank; use the block and batch methods.
+    """
+
+    def __init__(self, size=1024, protected=False, edac=EDAC):
+        self.size = size
+        self.protected = protected
+        self.edac = edac
+        self._decode_data = edac._DECODE_DATA_TABLE
+        self._code_mask = edac.CODE_MASK
+        self.memory = np.zeros(size, dtype=np.uint16 if protected else np.uint8)
+
+    def _words(self):
+        return self.memory
+
+    def _load(self, addr):
+        return int(self.memory[addr])
+
+    def _copy_memory(self):
+        return self.memory.copy()
+
+    def write(self, addr, data):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        if self.protected:
+            self.memory[addr] = self.edac.encode(data)
+        else:
+            self.memory[addr] = data & 0xFF
+
+    def read(self, addr):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        val = int(self.memory[addr])
+        if self.protected:
+            return self._decode_data[val & self._code_mask]
+        return val
+
+    def read_with_scrub(self, addr):
+        if not self.protected:
+            return self.read(addr), "OK"
+
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        edac = self.edac
+        decoded, status_code = edac.decode_fast(int(self.memory[addr]))
+        if status_code == edac.STATUS_CORRECTED:
+            self.memory[addr] = edac.encode(decoded)
+        if status_code and self.stats is not None:
+            self.stats.record(addr, status_code, status_code == edac.STATUS_CORRECTED)
+        return decoded, edac.STATUS_MAP[status_code]
+
+    def inject_seu(self, addr, bit):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        width = self.memory.itemsize * 8
+        if bit >= width:
+            raise ValueError(f"Bit index {bit} out of range for {width}-bit memory")
+        self.memory[addr] ^= (1 << bit)
+
+
+class Scrubber:
+    """
+    Background scrubber that walks a protected bank a chunk at a time.
+
+    Each tick() scrubs at most words_per_tick words from where the previous
+    tick stopped, wrapping around at the end of the bank, so latent upsets
+    in unread memory are corrected once per full pass. Add it to a
+    Simulation (sim.scrubbers.append(scrubber)) to run it on every step.
+    """
+
+    def __init__(self, bank, words_per_tick=4096):
+        if not bank.protected:
+            raise ValueError("Scrubbing requires an EDAC protected bank")
+        if words_per_tick < 1:
+            raise ValueError("words_per_tick must be positive")
+        self.bank = bank
+        self.words_per_tick = words_per_tick
+        self.cursor = 0
+        self.words_scrubbed = 0
+        self.corrected = 0
+        # Words with detected but uncorrectable errors (SECDED banks)
+        self.uncorrectable = 0
+        self.passes = 0
+        self.wall_time = 0.0
+        # Simulated and wall-clock duration of the last completed pass
+        self.last_pass_time = None
+        self.last_pass_wall_time = None
+        self._pass_time = 0.0
+        self._pass_wall_time = 0.0
+
+    def tick(self, dt=0.0):
+        """Scrubs the next words_per_tick words; returns the number corrected."""
+        start_wall = time.perf_counter()
+        bank = self.bank
+        budget = self.words_per_tick
+        corrected = 0
+        uncorrectable = 0
+        self._pass_time += dt
+
+        while budget:
+            end = min(self.cursor + budget, bank.size)
+            fixed, failed = bank._scrub_range(self.cursor, end)
+            corrected += fixed
+            uncorrectable += failed
+            budget -= end - self.cursor
+            self.words_scrubbed += end - self.cursor
+            self.cursor = end
+            if end == bank.size:
+                self.cursor = 0
+                self.passes += 1
+                elapsed = time.perf_counter() - start_wall
+                self.last_pass_time = self._pass_time
+                self.last_pass_wall_time = self._pass_wall_time + elapsed
+                self._pass_time = 0.0
+                # The rest of this tick counts towards the next pass.
+                self._pass_wall_time = -elapsed
+                if bank.size <= self.words_per_tick:
+                    # The whole bank fits in one tick's budget.
+                    break
+
+        elapsed = time.perf_counter() - start_wall
+        self._pass_wall_time += elapsed
+        self.wall_time += elapsed
+        self.corrected += corrected
+        self.uncorrectable += uncorrectable
+        return corrected
+
+    def stats(self):
+        """Scrub counters, throughput (words per wall-clock second) and last pass durations."""
+        return {
+            "words_scrubbed": self.words_scrubbed,
+            "corrected": self.corrected,
+            "uncorrectable": self.uncorrectable,
+            "passes": self.passes,
+            "scrub_rate": self.words_scrubbed / self.wall_time if self.wall_time else 0.0,
+            "wall_time": self.wall_time,
+            "last_pass_time": self.last_pass_time,
+            "last_pass_wall_time": self.last_pass_wall_time
+        }
+
+
+
+class MappedMemoryBank(MassMemoryBank):
+    """
+    MassMemoryBank backed by a memory-mapped image file.
+
+    Protected banks store codewords as little-endian uint16, unprotected
+    banks raw bytes, with no header, so the file is the recorder image
+    itself. Opening only maps the file: pages are read when touched and
+    writes reach the file through the page cache (flush() forces them out),
+    so the contents survive restarts. Open with writable=False to share one
+    image between processes; pickling a bank reopens the same file instead
+    of copying its contents.
+    """
+
+    def __init__(self, path, size=None, protected=False, edac=EDAC, writable=True):
+        self.path = os.fspath(path)
+        self.protected = protected
+        self.edac = edac
+        self._decode_data = edac._DECODE_DATA_TABLE
+        self._code_mask = edac.CODE_MASK
+        self.writable = writable
+        dtype = np.dtype('<u2' if protected else 'u1')
+
+        if writable and size is not None:
+            # Create the image, or grow it; new regions are sparse zeros.
+            with open(self.path, 'ab') as f:
+                if f.tell() < size * dtype.itemsize:
+                    f.truncate(size * dtype.itemsize)
+        if size is None:
+            size = os.path.getsize(self.path) // dtype.itemsize
+        if size <= 0:
+            raise ValueError("Memory image is empty; pass a size to create it")
+
+        self.size = size
+        self.memory = np.memmap(self.path, dtype=dtype, mode='r+' if writable else 'r', shape=(size,))
+
+    def __reduce__(self):
+        return (MappedMemoryBank, (self.path, self.size, self.protected, self.edac, self.writable))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def copy(self):
+        """Returns an in-memory MassMemoryBank holding a copy of the image."""
+        clone = MassMemoryBank(0, self.protected, self.edac)
+        clone.size = self.size
+        clone.memory = np.array(self.memory)
+        return clone
+
+    def flush(self):
+        if self.writable:
+            self.memory.flush()
+
+    def close(self):
+        """Flushes and unmaps the image; the bank is unusable afterwards."""
+        self.flush()
+        self.memory = None
+
+
+class WordMemoryBank(MassMemoryBank):
+    """
+    Word-oriented bank of 32-bit words. Protected banks store 39-bit
+    SECDED32 codewords in a uint64 array; unprotected banks store uint32.
+    Addresses count words; block methods take and return little-endian
+    bytes (4 per word) or arrays of ints.
+    """
+
+    def __init__(self, size=1024, protected=False, edac=SECDED32):
+        self.size = size
+        self.protected = protected
+        self.edac = edac
+        self.memory = np.zeros(size, dtype=np.uint64 if protected else np.uint32)
+
+    def copy(self):
+        """Returns an independent copy of the bank; statistics are not copied."""
+        clone = object.__new__(WordMemoryBank)
+        clone.size = self.size
+        clone.protected = self.protected
+        clone.edac = self.edac
+        clone.memory = self.memory.copy()
+        return clone
+
+    def write(self, addr, data):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        if self.protected:
+            self.memory[addr] = self.edac.encode(data)
+        else:
+            self.memory[addr] = data & 0xFFFFFFFF
+
+    def read(self, addr):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        val = int(self.memory[addr])
+        if self.protected:
+            return self.edac.decode_data_only(val)
+        return val
+
+    def write_block(self, addr, buffer):
+        """
+        Writes little-endian 32-bit words from bytes, a bytearray or a
+        memoryview (length a multiple of 4) or a sequence or array of ints
+        (masked to 32 bits) at addr.
+        """
+        data = _block_data(buffer, '<u4')
+        self._check_range(addr, len(data))
+
+        if self.protected:
+            self.memory[addr:addr + len(data)] = self.edac.encode_batch(data)
+        else:
+            self.memory[addr:addr + len(data)] = data
+
+    def read_block(self, addr, length):
+        """Reads 'length' words as little-endian bytes, correcting on the fly without scrubbing."""
+        self._check_range(addr, length)
+        words = self.memory[addr:addr + length]
+        if self.protected:
+            words, status = self.edac.decode_batch(words)
+            if self.stats is not None:
+                self._record_block(addr, status, False)
+        return words.astype('<u4').tobytes()
+
+    def read_block_with_scrub(self, addr, length):
+        """
+        Reads 'length' words as little-endian bytes and writes corrected
+        codewords back. Returns (data, corrected_count).
+        """
+        self._check_range(addr, length)
+        if not self.protected:
+            return self.read_block(addr, length), 0
+
+        edac = self.edac
+        words = self.memory[addr:addr + length]
+        decoded, status = edac.decode_batch(words)
+        corrected = np.flatnonzero(status == edac.STATUS_CORRECTED)
+        if len(corrected):
+            words[corrected] = edac.encode_batch(decoded[corrected])
+        if self.stats is not None:
+            self._record_block(addr, status, True)
+        return decoded.astype('<u4').tobytes(), len(corrected)
+
+
+class PagedMemoryBank(MemoryBank):
+    """
+    Sparse bank of fixed-size pages allocated on first write.
+
+    Pages are NumPy arrays in a dict keyed by page number; pages never
+    written read as zero codewords, so a mostly empty 4G word address space
+    costs only the pages in use. snapshot() returns a copy-on-write clone
+    that shares every page with this bank: it copies the page table only
+    (O(pages touched)), and whichever bank writes to a shared page first
+    copies that one page. Fault campaigns can branch many scenarios from
+    one baseline this way.
+    """
+
+    def __init__(self, size=1024, protected=False, edac=EDAC, page_words=4096):
+        if page_words <= 0 or page_words & (page_words - 1):
+            raise ValueError("page_words must be a power of two")
+        self.size = size
+        self.protected = protected
+        self.edac = edac
+        self._decode_data = edac._DECODE_DATA_TABLE
+        self._code_mask = edac.CODE_MASK
+        self.page_words = page_words
+        self._page_shift = page_words.bit_length() - 1
+        self._dtype = np.dtype(np.uint16 if protected else np.uint8)
+        self.pages = {}
+        # Pages this bank may modify in place; all others are shared
+        self._owned = set()
+
+    @property
+    def word_bits(self):
+        return self._dtype.itemsize * 8
+
+    @property
+    def resident_bytes(self):
+        """Bytes held by allocated pages (shared pages count in every bank)."""
+        return len(self.pages) * self.page_words * self._dtype.itemsize
+
+    def snapshot(self):
+        """Returns a copy-on-write clone; both banks then share all current pages."""
+        clone = object.__new__(PagedMemoryBank)
+        clone.__dict__.update(self.__dict__)
+        clone.pages = dict(self.pages)
+        clone._owned = set()
+        # Statistics stay with this bank; the clone starts without them and
+        # must not inherit a read() bound to this bank.
+        clone.__dict__.pop('read', None)
+        clone.stats = None
+        self._owned = set()
+        return clone
+
+    def copy(self):
+        """Same as snapshot(): pages are shared until either bank writes them."""
+        return self.snapshot()
+
+    def _writable_page(self, index):
+        page = self.pages.get(index)
+        if page is None:
+            page = np.zeros(self.page_words, dtype=self._dtype)
+        elif index in self._owned:
+            return page
+        else:
+            page = page.copy()
+        self.pages[index] = page
+        self._owned.add(index)
+        return page
+
+    def _spans(self, addr, length):
+        """Yields (page_index, start_in_page, end_in_page, offset_in_block) covering a range."""
+        pos = addr
+        end = addr + length
+        while pos < end:
+            index = pos >> self._page_shift
+            start = pos & (self.page_words - 1)
+            n = min(self.page_words - start, end - pos)
+            yield index, start, start + n, pos - addr
+            pos += n
+
+    def write(self, addr, data):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        page = self._writable_page(addr >> self._page_shift)
+        if self.protected:
+            page[addr & (self.page_words - 1)] = self.edac.encode(data)
+        else:
+            page[addr & (self.page_words - 1)] = data & 0xFF
+
+    def _load(self, addr):
+        page = self.pages.get(addr >> self._page_shift)
+        return 0 if page is None else int(page[addr & (self.page_words - 1)])
+
+    def read(self, addr):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        val = self._load(addr)
+        if self.protected:
+            return self._decode_data[val & self._code_mask]
+        return val
+
+    def read_with_scrub(self, addr):
+        if not self.protected:
+            return self.read(addr), "OK"
+
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        edac = self.edac
+        decoded, status_code = edac.decode_fast(self._load(addr))
+        if status_code == edac.STATUS_CORRECTED:
+            self._writable_page(addr >> self._page_shift)[addr & (self.page_words - 1)] = edac.encode(decoded)
+        if status_code and self.stats is not None:
+            self.stats.record(addr, status_code, status_code == edac.STATUS_CORRECTED)
+        return decoded, edac.STATUS_MAP[status_code]
+
+    def inject_seu(self, addr, bit):
+        if addr < 0 or addr >= self.size:
+            raise IndexError("Memory access out of bounds")
+
+        if bit >= self.word_bits:
+            raise ValueError(f"Bit index {bit} out of range for {self.word_bits}-bit memory")
+        self._writable_page(addr >> self._page_shift)[addr & (self.page_words - 1)] ^= (1 << bit)
+
+    def inject_seus(self, addrs, bits):
+        """Vectorized inject_seu(); flips are grouped so each touched page is visited once."""
+        addrs = np.asarray(addrs, dtype=np.int64)
+        bits = np.asarray(bits, dtype=np.int64)
+        if len(addrs) and (addrs.min() < 0 or addrs.max() >= self.size):
+            raise IndexError("Memory access out of bounds")
+        if len(bits) and (bits.min() < 0 or bits.max() >= self.word_bits):
+            raise ValueError(f"Bit index out of range for {self.word_bits}-bit memory")
+
+        order = np.argsort(addrs >> self._page_shift, kind='stable')
+        page_ids = addrs[order] >> self._page_shift
+        offsets = addrs[order] & (self.page_words - 1)
+        masks = np.left_shift(1, bits[order]).astype(self._dtype)
+        bounds = np.flatnonzero(np.diff(page_ids)) + 1
+        for lo, hi in zip(np.r_[0, bounds].tolist(), np.r_[bounds, len(page_ids)].tolist()):
+            np.bitwise_xor.at(self._writable_page(int(page_ids[lo])), offsets[lo:hi], masks[lo:hi])
+
+    def write_block(self, addr, buffer):
+        """Writes bytes, a bytearray or a memoryview (or ints, masked to 8 bits) starting at addr."""
+        data = _block_data(buffer, np.uint8)
+        self._check_range(addr, len(data))
+
+        if self.protected:
+            data = self.edac._ENCODE_ARRAY[data]
+        for index, start, end, offset in self._spans(addr, len(data)):
+            self._writable_page(index)[start:end] = data[offset:offset + end - start]
+
+    def _gather(self, addr, length):
+        words = np.zeros(length, dtype=self._dtype)
+        for index, start, end, offset in self._spans(addr, length):
+            page = self.pages.get(index)
+            if page is not None:
+                words[offset:offset + end - start] = page[start:end]
+        return words
+
+    def read_block(self, addr, length):
+        """Reads 'length' bytes starting at addr, correcting on the fly without scrubbing."""
+        self._check_range(addr, length)
+        words = self._gather(addr, length)
+        if self.protected:
+            masked = words & self.edac.CODE_MASK
+            if self.stats is not None:
+                self._record_block(addr, self.edac._DECODE_STATUS_ARRAY[masked], False)
+            return self.edac._DECODE_DATA_ARRAY[masked].tobytes()
+        return words.tobytes()
+
+    def read_block_with_scrub(self, addr, length):
+        """
+        Reads 'length' bytes starting at addr and writes corrected codewords
+        back. Returns (data, corrected_count).
+        """
+        self._check_range(addr, length)
+        if not self.protected:
+            return self.read_block(addr, length), 0
+        corrected = self._scrub_range(addr, addr + length)[0]
+        # Decode directly: the scrub above already recorded any errors.
+        words = self._gather(addr, length)
+        return self.edac._DECODE_DATA_ARRAY[words & self.edac.CODE_MASK].tobytes(), corrected
+
+    def scrub(self, addr=0, length=None):
+        """
+        Corrects every word in [addr, addr + length) in place. Returns the
+        number of words rewritten. Only allocated pages are visited.
+        """
+        if length is None:
+            length = self.size - addr
+        self._check_range(addr, length)
+        if not self.protected:
+            return 0
+        return self._scrub_range(addr, addr + length)[0]
+
+    def _scrub_range(self, start, end):
+        corrected = uncorrectable = 0
+        if start >= end:
+            return corrected, uncorrectable
+        edac = self.edac
+        shift = self._page_shift
+        first, last = start >> shift, (end - 1) >> shift
+        # Optimization: Unallocated pages read as zero codewords, which are
+        # valid, so only allocated pages are visited: the cost grows with the
+        # pages in use rather than with the size of the address space.
+        if last - first < len(self.pages):
+            indices = [index for index in range(first, last + 1) if index in self.pages]
+        else:
+            indices = sorted(index for index in self.pages if first <= index <= last)
+        for index in indices:
+            base = index << shift
+            lo = max(start - base, 0)
+            hi = min(end - base, self.page_words)
+            # Check the shared page first so clean pages are never copied.
+            if not np.any(edac.status_batch(self.pages[index][lo:hi])):
+                continue
+            fixed, failed = _scrub_words(self._writable_page(index)[lo:hi], edac, self.stats, base + lo)
+            corrected += fixed
+            uncorrectable += failed
+        return corrected, uncorrectable
@@ -1,5 +1,9 @@
+import heapq
+import itertools
 import math
 
+import numpy as np
+
 class SimulationError(ValueError):
     """Exception raised for invalid simulation parameters."""
     pass
@@ -27,6 +31,12 @@ class OnBoardComputer:
         """Resets the watchdog timer."""
         self.watchdog_timer = 0.0
 
+    def time_to_watchdog(self):
+        """Seconds until the watchdog fires; infinite unless the OBC is on and hung."""
+        if self.mode == "OFF" or not self.frozen:
+            return math.inf
+        return max(0.0, self.watchdog_timeout - self.watchdog_timer)
+
     def tick(self, dt):
         """
         Advances the state of the OBC by dt seconds.
@@ -60,16 +70,235 @@ class OnBoardComputer:
         self.frozen = False
         print("OBC Rebooted into SAFE_MODE.")
 
+class OBCFleet:
+    """
+    N OnBoardComputers stored as a struct of NumPy arrays.
+
+    Holds mode (a code indexing MODES), watchdog timer, watchdog timeout,
+    frozen flag and reboot count per OBC. tick(dt) follows
+    OnBoardComputer.tick exactly for every OBC at once, including watchdog
+    reboots into SAFE_MODE, in a few vectorized operations and without
+    printing. Commands take an index (int, slice, index array or boolean
+    mask); None addresses the whole fleet.
+    """
+
+    MODE_OFF = 0
+    MODE_NORMAL = 1
+    MODE_SAFE = 2
+    MODES = ("OFF", "NORMAL", "SAFE_MODE")
+
+    def __init__(self, n, watchdog_timeout=5.0):
+        self.mode = np.zeros(n, dtype=np.uint8)
+        self.watchdog_timer = np.zeros(n)
+        self.watchdog_timeout = np.full(n, watchdog_timeout, dtype=np.float64)
+        self.frozen = np.zeros(n, dtype=bool)
+        self.reboot_count = np.zeros(n, dtype=np.int64)
+        # Scratch masks reused by tick() so it allocates nothing per OBC
+        self._on = np.empty(n, dtype=bool)
+        self._running = np.empty(n, dtype=bool)
+        self._mask = np.empty(n, dtype=bool)
+
+    def __len__(self):
+        return len(self.mode)
+
+    def _select(self, index):
+        return slice(None) if index is None else index
+
+    def boot(self, index=None):
+        index = self._select(index)
+        self.mode[index] = OBCFleet.MODE_NORMAL
+        self.frozen[index] = False
+        self.watchdog_timer[index] = 0.0
+
+    def freeze(self, index=None):
+        """Simulates software hangs."""
+        self.frozen[self._select(index)] = True
+
+    def kick_watchdog(self, index=None):
+        self.watchdog_timer[self._select(index)] = 0.0
+
+    def reboot(self, index=None):
+        index = self._select(index)
+        self.reboot_count[index] += 1
+        self.mode[index] = OBCFleet.MODE_SAFE
+        self.watchdog_timer[index] = 0.0
+        self.frozen[index] = False
+
+    def tick(self, dt):
+        """
+        Advances every OBC by dt seconds, as OnBoardComputer.tick does.
+        Returns the number of watchdog reboots.
+        """
+        if not math.isfinite(dt):
+            raise SimulationError("Time step must be finite")
+        if dt < 0:
+            raise SimulationError("Time step must be non-negative")
+
+        on = np.not_equal(self.mode, OBCFleet.MODE_OFF, out=self._on)
+        running = np.greater(on, self.frozen, out=self._running)
+        mask = self._mask
+        timer = self.watchdog_timer
+        # Optimization: Running OBCs almost always have a zero timer already
+        # and hung OBCs are few, so both updates go through a boolean pass
+        # and touch only the OBCs that change.
+        np.not_equal(timer, 0.0, out=mask)
+        mask &= running
+        if mask.any():
+            timer[mask] = 0.0
+        hung = np.flatnonzero(np.logical_and(on, self.frozen, out=mask))
+        timer[hung] += dt
+
+        np.greater_equal(timer, self.watchdog_timeout, out=mask)
+        mask &= on
+        expired = np.flatnonzero(mask)
+        if len(expired):
+            self.reboot(expired)
+        return len(expired)
+
+    def status(self, i):
+        """Status dict of OBC i, as served by the API for the single OBC."""
+        return {
+            "mode": OBCFleet.MODES[self.mode[i]],
+            "reboot_count": int(self.reboot_count[i]),
+            "watchdog_timer": float(self.watchdog_timer[i]),
+            "frozen": bool(self.frozen[i])
+        }
+
+    def counts(self):
+        """Number of OBCs in each mode, keyed by mode name."""
+        return dict(zip(OBCFleet.MODES, np.bincount(self.mode, minlength=len(OBCFleet.MODES)).tolist()))
+
+
+class Event:
+    """A scheduled callback; cancel() stops it (and its repeats) from firing."""
+    __slots__ = ("time", "period", "callback", "args")
+
+    def __init__(self, time, period, callback, args):
+        self.time = time
+        self.period = period
+        self.callback = callback
+        self.args = args
+
+    def cancel(self):
+        self.callback = None
+
+    @property
+    def cancelled(self):
+        return self.callback is None
+
+
+def _check_time(value, name):
+    if not math.isfinite(value):
+        raise SimulationError(f"{name} must be finite")
+    if value < 0:
+        raise SimulationError(f"{name} must be non-negative")
+
+
 class Simulation:
+    """
+    Discrete-event simulation of an OBC and its background tasks.
+
+    Components schedule callbacks at future times with schedule(),
+    schedule_at() or every(); run_until() pops them from a heap in time
+    order and jumps straight from one event to the next, advancing the OBC
+    by the whole gap in one tick. The watchdog expiry of a hung OBC is
+    computed from its timer and treated as an event too, so the cost of a
+    run is proportional to the number of events, not to its duration.
+    Events at the same time fire in the order they were scheduled.
+    """
+
     def __init__(self, obc):
         self.obc = obc
         self.time = 0.0
+        # Background tasks with a tick(dt) method, e.g. memory.Scrubber,
+        # ticked once per step(). Use every() to run them periodically.
+        self.scrubbers = []
+        self.events_processed = 0
+        # Heap of (time, sequence, Event); the sequence breaks ties in FIFO order
+        self._queue = []
+        self._sequence = itertools.count()
+
+    def schedule_at(self, time, callback, *args):
+        """Calls callback(*args) at simulation time 'time'; returns the Event."""
+        _check_time(time, "Event time")
+        if time < self.time:
+            raise SimulationError("Cannot schedule an event in the past")
+        event = Event(time, None, callback, args)
+        heapq.heappush(self._queue, (time, next(self._sequence), event))
+        return event
+
+    def schedule(self, delay, callback, *args):
+        """Calls callback(*args) 'delay' seconds from now; returns the Event."""
+        _check_time(delay, "Delay")
+        return self.schedule_at(self.time + delay, callback, *args)
+
+    def every(self, period, callback, *args, start=None):
+        """
+        Calls callback(*args) every 'period' seconds, first at 'start'
+        (default: one period from now), until the returned Event is cancelled.
+        """
+        _check_time(period, "Period")
+        if period == 0:
+            raise SimulationError("Period must be positive")
+        event = self.schedule_at(self.time + period if start is None else start, callback, *args)
+        event.period = period
+        return event
+
+    @property
+    def next_event_time(self):
+        """Time of the next scheduled event, or None."""
+        queue = self._queue
+        while queue and queue[0][2].cancelled:
+            heapq.heappop(queue)
+        return queue[0][0] if queue else None
+
+    def run_until(self, end):
+        """
+        Processes every event up to and including time 'end', then advances
+        the clock to 'end'. Returns the number of events fired.
+        """
+        _check_time(end, "End time")
+        if end < self.time:
+            raise SimulationError("Cannot run backwards in time")
+
+        queue = self._queue
+        obc = self.obc
+        fired = 0
+        while True:
+            target = queue[0][0] if queue and queue[0][0] <= end else end
+            # Optimization: Jump straight to the watchdog expiry instead of
+            # ticking the hung OBC until it fires.
+            expiry = obc.time_to_watchdog()
+            if self.time + expiry <= target:
+                self.time += expiry
+                obc.tick(expiry)
+                continue
+
+            if target > self.time:
+                obc.tick(target - self.time)
+                self.time = target
+            if not queue or queue[0][0] > end:
+                break
+
+            event = heapq.heappop(queue)[2]
+            callback = event.callback
+            if callback is None:
+                continue
+            if event.period is not None:
+                event.time += event.period
+                heapq.heappush(queue, (event.time, next(self._sequence), event))
+            callback(*event.args)
+            fired += 1
+
+        self.events_processed += fired
+        return fired
 
     def step(self, seconds):
         """
-        Advances the simulation time.
+        Advances the simulation time by 'seconds', firing the events due in
+        that span, then ticks each scrubber once.
         """
-        # We step in small increments to catch events accurately if needed,
-        # or just jump. For WDT, jumping is fine as long as we check logic.
-        self.time += seconds
-        self.obc.tick(seconds)
+        _check_time(seconds, "Time step")
+        self.run_until(self.time + seconds)
+        for scrubber in self.scrubbers:
+            scrubber.tick(seconds)
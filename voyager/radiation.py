@@ -0,0 +1,101 @@
+import numpy as np
+
+
+class RadiationModel:
+    """
+    Radiation environment acting on one memory bank.
+
+    Upset events arrive as a Poisson process with rate
+    cross_section (cm^2 per bit) * flux (particles per cm^2 per second) *
+    number of bits in the bank. Each event hits a uniformly chosen word; it is
+    a single-bit upset, or with the probabilities in mbu_sizes
+    ({cluster_size: probability}) a multi-bit upset flipping that many
+    adjacent bits of the word. A tick draws every event of the time step at
+    once and applies all flips with a single inject_seus() call, so the cost
+    per step is a few NumPy calls however many upsets it contains. 'flux'
+    may be changed between ticks (e.g. for SAA passes).
+    """
+
+    def __init__(self, bank, cross_section, flux, mbu_sizes=None, seed=None):
+        self.bank = bank
+        self.cross_section = cross_section
+        self.flux = flux
+        # Upsets only land in the codeword bits of protected banks.
+        if bank.protected:
+            self.word_bits = bank.edac.CODE_BITS
+        else:
+            self.word_bits = bank.word_bits
+
+        mbu_sizes = dict(mbu_sizes or {})
+        if any(size < 2 or size > self.word_bits for size in mbu_sizes):
+            raise ValueError(f"MBU cluster sizes must be between 2 and {self.word_bits} bits")
+        if any(p < 0 for p in mbu_sizes.values()) or sum(mbu_sizes.values()) > 1:
+            raise ValueError("MBU probabilities must be non-negative and sum to at most 1")
+        self._cluster_sizes = np.array([1] + sorted(mbu_sizes), dtype=np.int64)
+        self._cluster_cdf = np.cumsum([1 - sum(mbu_sizes.values())] + [mbu_sizes[s] for s in sorted(mbu_sizes)])
+
+        self.rng = np.random.default_rng(seed)
+        self.time = 0.0
+        self.events = 0
+        self.mbu_events = 0
+        self.bit_flips = 0
+
+    @property
+    def upset_rate(self):
+        """Expected upset events per second over the whole bank."""
+        return self.cross_section * self.flux * self.bank.size * self.word_bits
+
+    def _draw(self, dt):
+        rng = self.rng
+        n = rng.poisson(self.upset_rate * dt)
+        addrs = rng.integers(0, self.bank.size, n)
+        if len(self._cluster_sizes) == 1:
+            return addrs, rng.integers(0, self.word_bits, n), n, 0
+
+        index = np.searchsorted(self._cluster_cdf, rng.random(n), side='right')
+        sizes = self._cluster_sizes[np.minimum(index, len(self._cluster_sizes) - 1)]
+        # Place each cluster so that it fits inside the word.
+        starts = (rng.random(n) * (self.word_bits - sizes + 1)).astype(np.int64)
+        # Expand clusters into consecutive bits: start, start + 1, ...
+        total = int(sizes.sum())
+        offsets = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        bits = np.repeat(starts, sizes) + offsets
+        return np.repeat(addrs, sizes), bits, n, int(np.count_nonzero(sizes > 1))
+
+    def draw(self, dt):
+        """
+        Draws the upsets of one dt second step without applying them.
+        Returns (addrs, bits) arrays with one entry per flipped bit.
+        """
+        return self._draw(dt)[:2]
+
+    def tick(self, dt):
+        """Applies one step of upsets to the bank; returns the number of events."""
+        addrs, bits, events, mbu_events = self._draw(dt)
+        if len(addrs):
+            self.bank.inject_seus(addrs, bits)
+        self.events += events
+        self.mbu_events += mbu_events
+        self.bit_flips += len(addrs)
+        self.time += dt
+        return events
+
+    def run(self, duration, dt, scrubber=None):
+        """
+        Irradiates the bank for 'duration' seconds in steps of dt, ticking
+        'scrubber' (a memory.Scrubber) after each step if given.
+        Returns the number of events.
+        """
+        steps = int(round(duration / dt))
+        if scrubber is None:
+            # Optimization: With nothing acting between steps, the sum of the
+            # per-step Poisson draws is one Poisson draw over the whole span,
+            # so the run collapses into a single vectorized tick.
+            return self.tick(steps * dt)
+
+        events = 0
+        for _ in range(steps):
+            events += self.tick(dt)
+            if scrubber is not None:
+                scrubber.tick(dt)
+        return events
@@ -0,0 +1,287 @@
+import contextlib
+import csv
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .campaign import CODECS
+from .fdir import SECDED32
+from .memory import MassMemoryBank, WordMemoryBank, Scrubber
+from .obc import OnBoardComputer, Simulation
+
+SCENARIO_KEYS = {
+    "name", "duration", "tick", "boot", "watchdog_timeout", "freeze", "commands",
+    "memory", "seus", "random_seus", "expect"
+}
+MEMORY_KEYS = {"size", "codec", "scrub_period", "words_per_tick"}
+COMMANDS = ("boot", "freeze", "reboot", "kick_watchdog")
+OUTCOME_FIELDS = ("mode", "reboot_count", "frozen", "corrected", "uncorrectable", "latent_errors", "data_errors")
+
+RESULT_FIELDS = ("index", "name", "passed", "failures") + OUTCOME_FIELDS + ("sim_time", "events", "wall_time")
+
+
+def _check_time(value, what, positive=False):
+    if not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0 or (positive and value == 0):
+        raise ValueError(f"{what} must be a finite {'positive' if positive else 'non-negative'} number, got {value!r}")
+
+
+def validate_scenario(scenario):
+    """
+    Raises ValueError if a scenario dict has unknown keys, commands or
+    expectations, or event times, SEU addresses or bit indices that the
+    simulation would reject.
+    """
+    unknown = set(scenario) - SCENARIO_KEYS
+    if unknown:
+        raise ValueError(f"Unknown scenario keys: {sorted(unknown)}")
+    if "duration" not in scenario:
+        raise ValueError("Scenario needs a duration")
+    _check_time(scenario["duration"], "duration")
+    if scenario.get("tick") is not None:
+        _check_time(scenario["tick"], "tick", positive=True)
+    if "watchdog_timeout" in scenario:
+        _check_time(scenario["watchdog_timeout"], "watchdog_timeout")
+    for t in scenario.get("freeze", ()):
+        _check_time(t, "freeze time")
+    for t, command in scenario.get("commands", ()):
+        _check_time(t, "command time")
+        if command not in COMMANDS:
+            raise ValueError(f"Unknown command {command!r}")
+
+    memory = scenario.get("memory")
+    if memory is None:
+        if scenario.get("seus") or scenario.get("random_seus"):
+            raise ValueError("SEU injection needs a memory section")
+    else:
+        if set(memory) - MEMORY_KEYS:
+            raise ValueError(f"Unknown memory keys: {sorted(set(memory) - MEMORY_KEYS)}")
+        codec = CODECS.get(memory.get("codec", "EDAC"))
+        if codec is None:
+            raise ValueError(f"Unknown codec {memory['codec']!r}")
+        size = memory.get("size", 1024)
+        if not isinstance(size, int) or size < 1:
+            raise ValueError(f"memory size must be a positive integer, got {size!r}")
+        if memory.get("scrub_period") is not None:
+            _check_time(memory["scrub_period"], "scrub_period", positive=True)
+        if memory.get("words_per_tick", 1) < 1:
+            raise ValueError("words_per_tick must be positive")
+        for t, addr, bit in scenario.get("seus", ()):
+            _check_time(t, "SEU time")
+            if not 0 <= addr < size:
+                raise ValueError(f"SEU address {addr} outside a {size} word bank")
+            if not 0 <= bit < codec.CODE_BITS:
+                raise ValueError(f"SEU bit {bit} outside a {codec.CODE_BITS}-bit codeword")
+        random_seus = scenario.get("random_seus", 0)
+        if not isinstance(random_seus, int) or random_seus < 0:
+            raise ValueError(f"random_seus must be a non-negative integer, got {random_seus!r}")
+
+    unknown = set(scenario.get("expect", {})) - set(OUTCOME_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown expectations: {sorted(unknown)}")
+
+
+def run_scenario(scenario, seed=0, index=0):
+    """
+    Runs one declarative FDIR scenario on an event-driven Simulation and
+    returns its result dict.
+
+    Scenario keys:
+      duration         simulated seconds to run (required)
+      tick             step size; if given the run advances with
+                       Simulation.step(tick), otherwise event to event
+      boot             boot the OBC at t=0 (default True)
+      watchdog_timeout OBC watchdog timeout in seconds
+      freeze           times at which the OBC software hangs
+      commands         [time, command] pairs, command one of COMMANDS
+      memory           protected bank: size, codec (a campaign.CODECS
+                       name), scrub_period and words_per_tick
+      seus             [time, addr, bit] upsets to inject
+      random_seus      number of upsets at uniform random times, words and
+                       codeword bits
+      expect           expected values of OUTCOME_FIELDS at the end
+
+    Random bank contents and upsets are drawn from
+    SeedSequence(seed, spawn_key=(index,)), so a scenario's result depends
+    only on the seed and its position in the batch.
+    """
+    validate_scenario(scenario)
+    start_wall = time.perf_counter()
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    duration = scenario["duration"]
+
+    obc = OnBoardComputer()
+    obc.watchdog_timeout = scenario.get("watchdog_timeout", obc.watchdog_timeout)
+    if scenario.get("boot", True):
+        obc.boot()
+    sim = Simulation(obc)
+    for t in scenario.get("freeze", ()):
+        sim.schedule_at(t, obc.freeze)
+    for t, command in scenario.get("commands", ()):
+        sim.schedule_at(t, getattr(obc, command))
+
+    bank = None
+    memory = scenario.get("memory")
+    if memory is not None:
+        codec = CODECS[memory.get("codec", "EDAC")]
+        size = memory.get("size", 1024)
+        if codec is SECDED32:
+            bank = WordMemoryBank(size=size, protected=True, edac=codec)
+            data_dtype = np.dtype('<u4')
+        else:
+            bank = MassMemoryBank(size=size, protected=True, edac=codec)
+            data_dtype = np.dtype(np.uint8)
+        data = rng.integers(0, np.iinfo(data_dtype).max, size, dtype=data_dtype, endpoint=True)
+        bank.write_block(0, data)
+        stats = bank.enable_stats(page_words=size)
+
+        period = memory.get("scrub_period")
+        if period:
+            scrubber = Scrubber(bank, memory.get("words_per_tick", size))
+            sim.every(period, scrubber.tick, period)
+        for t, addr, bit in scenario.get("seus", ()):
+            sim.schedule_at(t, bank.inject_seu, addr, bit)
+        n = scenario.get("random_seus", 0)
+        times = rng.uniform(0.0, duration, n).tolist()
+        addrs = rng.integers(0, size, n).tolist()
+        bits = rng.integers(0, codec.CODE_BITS, n).tolist()
+        for t, addr, bit in zip(times, addrs, bits):
+            sim.schedule_at(t, bank.inject_seu, addr, bit)
+
+    tick = scenario.get("tick")
+    if tick:
+        while sim.time < duration:
+            sim.step(min(tick, duration - sim.time))
+    else:
+        sim.run_until(duration)
+
+    outcome = {
+        "mode": obc.mode,
+        "reboot_count": obc.reboot_count,
+        "frozen": obc.frozen,
+        "corrected": 0,
+        "uncorrectable": 0,
+        "latent_errors": 0,
+        "data_errors": 0
+    }
+    if bank is not None:
+        outcome["corrected"] = stats.corrected
+        outcome["uncorrectable"] = stats.uncorrectable
+        bank.disable_stats()
+        outcome["latent_errors"] = int(np.count_nonzero(bank.edac.status_batch(bank._words())))
+        decoded = np.frombuffer(bank.read_block(0, size), dtype=data_dtype)
+        outcome["data_errors"] = int(np.count_nonzero(decoded != data))
+
+    failures = [
+        f"{key}: expected {expected!r}, got {outcome[key]!r}"
+        for key, expected in scenario.get("expect", {}).items()
+        if outcome[key] != expected
+    ]
+    result = {"index": index, "name": scenario.get("name", f"scenario-{index}"), "passed": not failures,
+              "failures": "; ".join(failures)}
+    result.update(outcome)
+    result["sim_time"] = sim.time
+    result["events"] = sim.events_processed
+    result["wall_time"] = time.perf_counter() - start_wall
+    return result
+
+
+def _error_result(scenario, index, error, wall_time):
+    result = {"index": index, "name": scenario.get("name", f"scenario-{index}"), "passed": False,
+              "failures": f"{type(error).__name__}: {error}"}
+    result.update(dict.fromkeys(OUTCOME_FIELDS))
+    result["sim_time"] = 0.0
+    result["events"] = 0
+    result["wall_time"] = wall_time
+    return result
+
+
+def run_batch(scenarios, indices, seed=0):
+    """
+    Runs scenarios[i] with index indices[i]; returns the result dicts. A
+    scenario that raises becomes a failed result with the error in
+    'failures', so it cannot stop the rest of the batch. OBC console output
+    is discarded.
+    """
+    results = []
+    # print() is a no-op while sys.stdout is None.
+    with contextlib.redirect_stdout(None):
+        for scenario, index in zip(scenarios, indices):
+            start = time.perf_counter()
+            try:
+                results.append(run_scenario(scenario, seed, index))
+            except Exception as error:
+                results.append(_error_result(scenario, index, error, time.perf_counter() - start))
+    return results
+
+
+def run_scenarios(scenarios, workers=None, seed=0, batch_size=64, output=None):
+    """
+    Runs a list of scenario dicts (see run_scenario) and yields each result
+    dict as soon as its batch finishes, so results stream in completion
+    order; 'index' gives the position in 'scenarios'.
+
+    Scenarios are validated up front, then sent to a ProcessPoolExecutor in
+    batches of batch_size to amortize inter-process overhead ('workers'
+    processes, default all cores; 0 or 1 runs in-process). Results do not
+    depend on the number of workers or on batching. If 'output' is a text
+    file, each result is also written to it as a CSV row.
+    """
+    scenarios = list(scenarios)
+    for scenario in scenarios:
+        validate_scenario(scenario)
+
+    writer = None
+    if output is not None:
+        writer = csv.DictWriter(output, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+
+    batches = [
+        (scenarios[start:start + batch_size], range(start, min(start + batch_size, len(scenarios))))
+        for start in range(0, len(scenarios), batch_size)
+    ]
+
+    def finish(results):
+        if writer is not None:
+            writer.writerows(results)
+            output.flush()
+        return results
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for batch, indices in batches:
+            yield from finish(run_batch(batch, indices, seed))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_batch, batch, indices, seed) for batch, indices in batches]
+        for future in as_completed(futures):
+            yield from finish(future.result())
+
+
+def summarize(results, elapsed=None):
+    """
+    Aggregates result dicts: pass/fail counts, total simulated and
+    scenario wall time, and, given the batch's elapsed wall time,
+    scenarios and simulated seconds per wall-clock second.
+    """
+    results = list(results)
+    wall_time = sum(r["wall_time"] for r in results)
+    sim_time = sum(r["sim_time"] for r in results)
+    summary = {
+        "scenarios": len(results),
+        "passed": sum(1 for r in results if r["passed"]),
+        "failed": [r["name"] for r in results if not r["passed"]],
+        "sim_time": sim_time,
+        "wall_time": wall_time,
+        "max_wall_time": max((r["wall_time"] for r in results), default=0.0),
+        "speedup": sim_time / wall_time if wall_time else 0.0
+    }
+    if elapsed is not None:
+        summary["elapsed"] = elapsed
+        summary["scenarios_per_second"] = len(results) / elapsed if elapsed else 0.0
+        summary["sim_seconds_per_second"] = sim_time / elapsed if elapsed else 0.0
+    return summary
@@ -0,0 +1,209 @@
+import time
+import binascii
+
+from .ccsds import (
+    _HEADER_STRUCT, _CRC_STRUCT,
+    SEQ_CONTINUATION, SEQ_FIRST, SEQ_LAST, SEQ_UNSEGMENTED
+)
+
+# CCSDS packet length field is 16 bits: data + CRC <= 65536 octets.
+MAX_SEGMENT_LENGTH = 65534
+
+
+def _buffer_segments(payload, max_data_length):
+    """Yields (packet, n) with each segment copied once from the source buffer."""
+    src = memoryview(payload).cast('B')
+    total = len(src)
+    pos = 0
+    while True:
+        n = min(max_data_length, total - pos)
+        packet = bytearray(n + 8)
+        packet[6:6 + n] = src[pos:pos + n]
+        pos += n
+        yield packet, n
+        if pos >= total:
+            break
+
+
+def _file_segments(source, max_data_length):
+    """Yields (packet, n) with each segment read straight into its packet buffer."""
+    first = True
+    while True:
+        packet = bytearray(max_data_length + 8)
+        n = 0
+        with memoryview(packet) as view:
+            # readinto may return short counts on pipes and sockets.
+            while n < max_data_length:
+                got = source.readinto(view[6 + n:6 + max_data_length])
+                if not got:
+                    break
+                n += got
+        if n == 0 and not first:
+            # Source ended exactly on a segment boundary.
+            break
+        first = False
+        if n < max_data_length:
+            del packet[6 + n + 2:]
+        yield packet, n
+        if n < max_data_length:
+            break
+
+
+def segment_payload(apid, payload, sequence_count=0, max_data_length=4096):
+    """
+    Splits a large payload into first/continuation/last Space Packets.
+
+    'payload' is a bytes-like object (bytes, bytearray, memoryview, mmap) or
+    a binary file object. Buffers are sliced through a memoryview and files
+    are read directly into each packet, so the source is never copied as a
+    whole and memory use stays at one or two packets. Yields encoded packets
+    (bytearray) with consecutive 14-bit sequence counts; a payload that fits
+    in one packet is sent unsegmented.
+    """
+    if not 1 <= max_data_length <= MAX_SEGMENT_LENGTH:
+        raise ValueError(f"max_data_length must be between 1 and {MAX_SEGMENT_LENGTH}")
+
+    if hasattr(payload, 'readinto'):
+        segments = _file_segments(payload, max_data_length)
+    else:
+        segments = _buffer_segments(payload, max_data_length)
+
+    word0 = 0x0800 | (apid & 0x7FF)
+    pack_header = _HEADER_STRUCT.pack_into
+    pack_crc = _CRC_STRUCT.pack_into
+    crc_hqx = binascii.crc_hqx
+
+    def finish(packet, n, seq, flags):
+        pack_header(packet, 0, word0, (flags << 14) | (seq & 0x3FFF), n + 1)
+        with memoryview(packet) as view:
+            pack_crc(packet, 6 + n, crc_hqx(view[:6 + n], 0xFFFF))
+        return packet
+
+    # One packet of lookahead decides whether the held packet is the last.
+    held = None
+    seq = sequence_count
+    flags = SEQ_FIRST
+    for packet, n in segments:
+        if held is not None:
+            yield finish(held[0], held[1], seq, flags)
+            seq += 1
+            flags = SEQ_CONTINUATION
+        held = (packet, n)
+
+    yield finish(held[0], held[1], seq, SEQ_UNSEGMENTED if flags == SEQ_FIRST else SEQ_LAST)
+
+
+class _SegmentGroup:
+    __slots__ = ("sink", "append", "expected", "length", "last_seen")
+
+    def __init__(self, sink, append, expected, now):
+        self.sink = sink
+        self.append = append
+        self.expected = expected
+        self.length = 0
+        self.last_seen = now
+
+
+class SegmentReassembler:
+    """
+    Rebuilds segmented payloads per APID from a packet stream.
+
+    Accepts PacketView, TelemetryPacket or any object with apid,
+    sequence_flags, sequence_count and data. Segments are appended to a
+    per-APID sink: a bytearray by default, or whatever sink_factory(apid)
+    returns (any object with write(), e.g. a file) to keep memory flat for
+    very large payloads. Groups with a sequence gap, exceeding
+    max_payload_length, or idle for longer than 'timeout' seconds are
+    discarded; discarded sinks are closed if they have a close() method.
+    """
+
+    def __init__(self, timeout=60.0, max_payload_length=256 * 1024 * 1024, sink_factory=None):
+        self.timeout = timeout
+        self.max_payload_length = max_payload_length
+        self.sink_factory = sink_factory
+        self.completed = 0
+        self.discarded = 0
+        self.orphaned = 0
+        self._groups = {}
+
+    def _open(self, apid, seq, now):
+        if self.sink_factory is None:
+            sink = bytearray()
+            append = sink.extend
+        else:
+            sink = self.sink_factory(apid)
+            append = sink.write
+        group = _SegmentGroup(sink, append, (seq + 1) & 0x3FFF, now)
+        self._groups[apid] = group
+        return group
+
+    def _discard(self, apid):
+        group = self._groups.pop(apid)
+        self.discarded += 1
+        close = getattr(group.sink, 'close', None)
+        if close is not None:
+            close()
+
+    def feed(self, packet, now=None):
+        """
+        Consumes one packet. Returns (apid, payload) when it completes a
+        payload, otherwise None. Unsegmented packets return their data as is;
+        segmented payloads are returned as the sink they were written to.
+        """
+        apid = packet.apid
+        flags = packet.sequence_flags
+        if now is None:
+            now = time.monotonic()
+
+        group = self._groups.get(apid)
+        if group is not None and now - group.last_seen > self.timeout:
+            self._discard(apid)
+            group = None
+
+        if flags == SEQ_UNSEGMENTED:
+            if group is not None:
+                self._discard(apid)
+            return apid, packet.data
+
+        if flags == SEQ_FIRST:
+            if group is not None:
+                self._discard(apid)
+            group = self._open(apid, packet.sequence_count, now)
+        elif group is None:
+            # Continuation or last segment whose first segment was lost.
+            self.orphaned += 1
+            return None
+        elif packet.sequence_count != group.expected:
+            self._discard(apid)
+            return None
+        else:
+            group.expected = (group.expected + 1) & 0x3FFF
+            group.last_seen = now
+
+        data = packet.data
+        group.length += len(data)
+        if group.length > self.max_payload_length:
+            self._discard(apid)
+            return None
+        group.append(data)
+
+        if flags == SEQ_LAST:
+            del self._groups[apid]
+            self.completed += 1
+            return apid, group.sink
+        return None
+
+    def expire(self, now=None):
+        """Discards groups idle for longer than the timeout; returns how many."""
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - self.timeout
+        stale = [apid for apid, group in self._groups.items() if group.last_seen < cutoff]
+        for apid in stale:
+            self._discard(apid)
+        return len(stale)
+
+    @property
+    def pending(self):
+        """APIDs with a partially reassembled payload."""
+        return list(self._groups)
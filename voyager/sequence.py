@@ -0,0 +1,167 @@
+from array import array
+from collections import deque
+
+import numpy as np
+
+# Sequence count is 14 bits; counts less than half the range ahead of the
+# last accepted packet are treated as forward, the rest as late/duplicate.
+_SEQ_MODULUS = 0x4000
+_SEQ_MASK = 0x3FFF
+_SEQ_HALF = 0x2000
+_NUM_APIDS = 0x800
+
+
+class SequenceTracker:
+    """
+    Tracks Space Packet sequence counts per APID to detect lost packets,
+    duplicates and 14-bit counter wraps.
+
+    State lives in flat arrays indexed by the 11-bit APID, so each update is
+    a handful of array lookups. update() handles one packet; update_batch()
+    processes NumPy arrays of (apid, sequence_count) for whole archives and
+    continues from (and updates) the same state.
+    """
+
+    # Status codes
+    STATUS_OK = 0
+    STATUS_GAP = 1
+    STATUS_DUPLICATE = 2
+
+    STATUS_MAP = {
+        STATUS_OK: "OK",
+        STATUS_GAP: "SEQUENCE_GAP",
+        STATUS_DUPLICATE: "DUPLICATE_OR_LATE"
+    }
+
+    def __init__(self, max_recent_gaps=1024):
+        # 'q' (signed 64-bit) so NumPy can share the buffers in update_batch.
+        self._last = array('q', [-1]) * _NUM_APIDS
+        self._received = array('q', [0]) * _NUM_APIDS
+        self._lost = array('q', [0]) * _NUM_APIDS
+        self._duplicates = array('q', [0]) * _NUM_APIDS
+        self._wraps = array('q', [0]) * _NUM_APIDS
+        # Bounded log of (apid, first_missing_count, number_missing)
+        self.recent_gaps = deque(maxlen=max_recent_gaps)
+
+    def update(self, apid, sequence_count):
+        """Records one packet and returns its status code."""
+        apid &= 0x7FF
+        sequence_count &= _SEQ_MASK
+        self._received[apid] += 1
+        last = self._last[apid]
+        if last < 0:
+            self._last[apid] = sequence_count
+            return SequenceTracker.STATUS_OK
+
+        diff = (sequence_count - last) & _SEQ_MASK
+        if diff == 0 or diff >= _SEQ_HALF:
+            # Repeated or older than the last accepted packet; state is kept.
+            self._duplicates[apid] += 1
+            return SequenceTracker.STATUS_DUPLICATE
+
+        self._last[apid] = sequence_count
+        if sequence_count < last:
+            self._wraps[apid] += 1
+        if diff == 1:
+            return SequenceTracker.STATUS_OK
+
+        self._lost[apid] += diff - 1
+        self.recent_gaps.append((apid, (last + 1) & _SEQ_MASK, diff - 1))
+        return SequenceTracker.STATUS_GAP
+
+    def feed(self, views):
+        """Updates from an iterable of PacketView (or any objects with apid/sequence_count)."""
+        update = self.update
+        for view in views:
+            update(view.apid, view.sequence_count)
+
+    def update_batch(self, apids, sequence_counts):
+        """
+        Vectorized update() over arrays of APIDs and sequence counts in arrival
+        order. Returns a NumPy array of status codes, one per packet.
+        Matches update() as long as late packets arrive less than half the
+        counter range behind the packets before them.
+        """
+        apids = np.asarray(apids, dtype=np.int64) & 0x7FF
+        seqs = np.asarray(sequence_counts, dtype=np.int64) & _SEQ_MASK
+        n = len(apids)
+        if n == 0:
+            return np.zeros(0, dtype=np.int8)
+
+        # Group by APID while keeping arrival order inside each group.
+        order = np.argsort(apids.astype(np.uint16), kind='stable')
+        a = apids[order]
+        s = seqs[order]
+        first = np.ones(n, dtype=bool)
+        first[1:] = a[1:] != a[:-1]
+        group = np.cumsum(first) - 1
+        starts = np.flatnonzero(first)
+
+        # Base of each group: the stored last accepted count, or the first
+        # packet itself for a never-seen APID.
+        last = np.frombuffer(self._last, dtype=np.int64)
+        base = last[a[starts]]
+        unseen = base < 0
+        base[unseen] = s[starts][unseen]
+
+        # Optimization: Unwrap the 14-bit counter into a monotonic integer
+        # with a cumulative sum of signed steps, then take a per-group running
+        # maximum (the high-water mark). One pass of NumPy ops replaces the
+        # per-packet branching of update().
+        prev = np.empty(n, dtype=np.int64)
+        prev[1:] = s[:-1]
+        prev[starts] = base
+        step = ((s - prev + _SEQ_HALF) & _SEQ_MASK) - _SEQ_HALF
+        csum = np.cumsum(step)
+        unwrapped = csum - (csum[starts] - step[starts])[group] + base[group]
+
+        span = 2 * (_SEQ_MODULUS + _SEQ_HALF * n) + 1
+        lifted = unwrapped + group * span
+        high = np.maximum(np.maximum.accumulate(lifted) - group * span, base[group])
+        high_prev = np.empty(n, dtype=np.int64)
+        high_prev[1:] = high[:-1]
+        high_prev[starts] = base
+
+        delta = unwrapped - high_prev
+        delta[starts[unseen]] = 1
+        accepted = delta >= 1
+        gap = delta > 1
+        wrapped = accepted & ((unwrapped // _SEQ_MODULUS) > (high_prev // _SEQ_MODULUS))
+
+        status = np.where(gap, SequenceTracker.STATUS_GAP,
+                          np.where(accepted, SequenceTracker.STATUS_OK, SequenceTracker.STATUS_DUPLICATE))
+
+        # Fold the results back into the shared per-APID state.
+        group_apids = a[starts]
+        ends = np.append(starts[1:], n) - 1
+        last[group_apids] = high[ends] & _SEQ_MASK
+        np.frombuffer(self._received, dtype=np.int64)[group_apids] += ends - starts + 1
+        np.frombuffer(self._lost, dtype=np.int64)[:] += np.bincount(a[gap], weights=delta[gap] - 1, minlength=_NUM_APIDS).astype(np.int64)
+        np.frombuffer(self._duplicates, dtype=np.int64)[:] += np.bincount(a[~accepted], minlength=_NUM_APIDS)
+        np.frombuffer(self._wraps, dtype=np.int64)[:] += np.bincount(a[wrapped], minlength=_NUM_APIDS)
+        gap_positions = np.flatnonzero(gap)
+        gap_positions = gap_positions[np.argsort(order[gap_positions], kind='stable')]
+        if self.recent_gaps.maxlen is not None:
+            gap_positions = gap_positions[-self.recent_gaps.maxlen:]
+        for i in gap_positions.tolist():
+            self.recent_gaps.append((int(a[i]), int(high_prev[i] + 1) & _SEQ_MASK, int(delta[i] - 1)))
+
+        result = np.empty(n, dtype=np.int8)
+        result[order] = status
+        return result
+
+    def stats(self, apid):
+        """Returns the counters of one APID as a dict."""
+        apid &= 0x7FF
+        last = self._last[apid]
+        return {
+            "received": self._received[apid],
+            "lost": self._lost[apid],
+            "duplicates": self._duplicates[apid],
+            "wraps": self._wraps[apid],
+            "last_sequence_count": None if last < 0 else last
+        }
+
+    def active_apids(self):
+        """Returns the APIDs seen so far as a NumPy array."""
+        return np.flatnonzero(np.frombuffer(self._received, dtype=np.int64))